@@ -5,6 +5,7 @@ import random
 import time
 import socket
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import numpy as np
 import cv2  # OpenCV for camera streaming
@@ -14,19 +15,73 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QComboBox, QGraphicsView, QGraphicsScene, QFrame,
                              QTableWidget, QTableWidgetItem, QHeaderView, QDialog,
                              QLineEdit, QMessageBox, QInputDialog, QSlider, QRadioButton,
-                             QButtonGroup, QGroupBox, QTextEdit, QGridLayout)
-from PyQt5.QtCore import Qt, QPointF, QUrl, QTimer, pyqtSignal, QObject
+                             QButtonGroup, QGroupBox, QPlainTextEdit, QGridLayout,
+                             QGraphicsItemGroup, QOpenGLWidget, QCheckBox, QGraphicsPixmapItem)
+from PyQt5.QtCore import Qt, QPointF, QLineF, QUrl, QTimer, pyqtSignal, QObject, QThread, QSocketNotifier
 
-from PyQt5.QtGui import QPainter, QColor, QPen, QPixmap, QImage, QBrush, QFont, QPolygonF
+from PyQt5.QtGui import (QPainter, QColor, QPen, QPixmap, QImage, QBrush, QFont, QPolygonF, QPainterPath,
+                         QFontMetricsF)
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaPlaylist, QMediaContent
 
 # Import coordinate transformer
 from coordinate_transformer import CoordinateTransformer
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaPlaylist, QMediaContent
 
+# OptiTrack stream parsing (Qt-free)
+from optitrack_stream import OPTITRACK_BINARY_HANDSHAKE, OptiTrackStream
+
+
+def optitrack_canvas_coefficients(min_x, max_x, min_y, max_y, size):
+    """Linear coefficients mapping OptiTrack bounds onto a square canvas of the given size
+    
+    Returns (scale_y, offset_y, scale_x, offset_x) such that
+    canvas_x = scale_y * opti_y + offset_y  (Y: max on the left, min on the right) and
+    canvas_y = scale_x * opti_x + offset_x  (X: min at the top, max at the bottom).
+    """
+    scale_y = -size / (max_y - min_y)
+    scale_x = size / (max_x - min_x)
+    return scale_y, size - scale_y * min_y, scale_x, -scale_x * min_x
+
+
+def optitrack_canvas_positions(robot_positions, coefficients, size):
+    """Map parsed OptiTrack positions to integer canvas centers, clamped to the canvas
+    
+    Returns {robot_id: (canvas_x, canvas_y)}, all robots transformed at once.
+    """
+    if not robot_positions:
+        return {}
+    robot_ids = list(robot_positions)
+    xy = np.array([(robot_positions[robot_id]['x'], robot_positions[robot_id]['y'])
+                   for robot_id in robot_ids], dtype=np.float32)
+    scale_y, offset_y, scale_x, offset_x = coefficients
+    canvas_x = np.rint(np.clip(scale_y * xy[:, 1] + offset_y, 0, size)).astype(np.int32)
+    canvas_y = np.rint(np.clip(scale_x * xy[:, 0] + offset_x, 0, size)).astype(np.int32)
+    return dict(zip(robot_ids, zip(canvas_x.tolist(), canvas_y.tolist())))
+
+
+def adjust_to_rectangle(corners):
+    """Adjust 4 approximate (x, y) points to the axis-aligned rectangle they describe
+    
+    The rectangle is centered on the points' centroid, with half-sizes equal to
+    the mean absolute distance from it. Returned as [TL, TR, BR, BL] with Y up.
+    """
+    points = np.asarray(corners, dtype=np.float64)
+    center = points.mean(axis=0)
+    avg_dx, avg_dy = np.abs(points - center).mean(axis=0)
+    
+    # OptiTrack: Y increases upward, so +avg_dy is TOP, -avg_dy is BOTTOM
+    rectangle = center + np.array([[-avg_dx, avg_dy],    # Top-Left: (-X, +Y)
+                                   [avg_dx, avg_dy],     # Top-Right: (+X, +Y)
+                                   [avg_dx, -avg_dy],    # Bottom-Right: (+X, -Y)
+                                   [-avg_dx, -avg_dy]])  # Bottom-Left: (-X, -Y)
+    return [tuple(point) for point in rectangle.tolist()]
+
+
 class DotConnectGame(QMainWindow):
     # Signal for communication test results (color, success, message)
     communication_result = pyqtSignal(str, bool, str) 
+    # Emitted after the OptiTrack background bounds change at runtime
+    optitrack_bounds_changed = pyqtSignal()
     
     def __init__(self):
         super().__init__()
@@ -87,9 +142,14 @@ class DotConnectGame(QMainWindow):
         # Latest OptiTrack position (for calibration preview real-time updates)
         self.latest_optitrack_position = (0.0, 0.0)  # Default to origin (x, y)
         
+        # Working camera indices, probed by the first ExecutionDialog (cleared by its Re-scan button)
+        self.camera_probe_cache = None
+        self.camera_gpu_rendering = False  # Composite the camera view with OpenGL (needs a working GL driver)
+        
         # OptiTrack configuration
         self.optitrack_server_ip = "192.168.0.100"
         self.optitrack_port = 5400
+        self.optitrack_binary = False  # Request the packed binary stream instead of ASCII
         
         # OptiTrack default bounds (can be changed in Advanced Settings)
         # Based on real calibration: TL(-2.8,1.4), TR(-2.8,-0.4), BL(-1.0,1.4), BR(-1.0,-0.4)
@@ -170,6 +230,14 @@ class DotConnectGame(QMainWindow):
         self.colorblind_mode = 'normal'
 
 
+    def set_optitrack_bounds(self, min_x, max_x, min_y, max_y):
+        """Set the OptiTrack background bounds and notify open canvases"""
+        self.optitrack_bounds_min_x = min_x
+        self.optitrack_bounds_max_x = max_x
+        self.optitrack_bounds_min_y = min_y
+        self.optitrack_bounds_max_y = max_y
+        self.optitrack_bounds_changed.emit()
+    
     def save_settings(self):
         """Save settings to file"""
         settings = {
@@ -229,27 +297,7 @@ class DotConnectGame(QMainWindow):
         - Top-Left = (-X, +Y), Top-Right = (+X, +Y)
         - Bottom-Right = (+X, -Y), Bottom-Left = (-X, -Y)
         """
-        # Find center of the 4 points
-        center_x = sum(p[0] for p in corners) / 4
-        center_y = sum(p[1] for p in corners) / 4
-        
-        # Find average distances from center to corners
-        distances_x = [abs(p[0] - center_x) for p in corners]
-        distances_y = [abs(p[1] - center_y) for p in corners]
-        
-        avg_dx = sum(distances_x) / 4
-        avg_dy = sum(distances_y) / 4
-        
-        # Create rectangle centered at center with average dimensions
-        # OptiTrack: Y increases upward, so +avg_dy is TOP, -avg_dy is BOTTOM
-        adjusted = [
-            (center_x - avg_dx, center_y + avg_dy),  # Top-Left: (-X, +Y)
-            (center_x + avg_dx, center_y + avg_dy),  # Top-Right: (+X, +Y)
-            (center_x + avg_dx, center_y - avg_dy),  # Bottom-Right: (+X, -Y)
-            (center_x - avg_dx, center_y - avg_dy)   # Bottom-Left: (-X, -Y)
-        ]
-        
-        return adjusted
+        return adjust_to_rectangle(corners)
     
     def _compute_optitrack_viz_transform(self):
         """Compute transformation matrix from OptiTrack coords to canvas coords (600x400)"""
@@ -272,10 +320,7 @@ class DotConnectGame(QMainWindow):
         }
         
         # Update main bounds used for drawing axes
-        self.optitrack_bounds_min_x = min(xs)
-        self.optitrack_bounds_max_x = max(xs)
-        self.optitrack_bounds_min_y = min(ys)
-        self.optitrack_bounds_max_y = max(ys)
+        self.set_optitrack_bounds(min(xs), max(xs), min(ys), max(ys))
         
         # Save updated bounds to settings
         self.save_settings()
@@ -1427,10 +1472,7 @@ class DotConnectGame(QMainWindow):
                 
                 self.preview_velocity = preview_vel
                 self.reality_velocity = reality_vel
-                self.optitrack_bounds_min_x = x_min
-                self.optitrack_bounds_max_x = x_max
-                self.optitrack_bounds_min_y = y_min
-                self.optitrack_bounds_max_y = y_max
+                self.set_optitrack_bounds(x_min, x_max, y_min, y_max)
                 self.save_settings()
                 
                 QMessageBox.information(dialog, "Success", 
@@ -1562,6 +1604,7 @@ class DotConnectGame(QMainWindow):
         # Initialize OptiTrack connection
         optitrack_socket = None
         optitrack_connected = False
+        optitrack_stream = OptiTrackStream()  # Buffers partial entries between reads
         
         def connect_optitrack():
             nonlocal optitrack_socket, optitrack_connected
@@ -1582,30 +1625,20 @@ class DotConnectGame(QMainWindow):
                 status_label.setStyleSheet("font-weight: bold; color: #FF9800; font-size: 14px;")
         
         def read_optitrack_data():
-            nonlocal robot_positions
+            nonlocal robot_positions, optitrack_connected
             if not optitrack_connected or not optitrack_socket:
                 return
             
             try:
-                data = optitrack_socket.recv(4096).decode('utf-8')
-                if data:
-                    # Parse robot data: id,x,y,z,rotation;
+                # Drain the backlog; later entries for a robot override earlier ones
+                received, closed = optitrack_stream.drain(optitrack_socket)
+                if closed:
+                    optitrack_connected = False  # Server went away - stop reading
+                # Parse robot data: id,x,y,z,rotation;
+                frame_positions = optitrack_stream.take_frame()
+                if frame_positions is not None:
                     robot_positions.clear()
-                    entries = data.strip().split(';')
-                    
-                    for entry in entries:
-                        if entry.strip():
-                            parts = entry.split(',')
-                            if len(parts) >= 5:
-                                robot_id = int(parts[0])
-                                x = float(parts[1])
-                                y = -float(parts[2])  # Invert Y sign (server sends inverted Y)
-                                z = float(parts[3])
-                                rotation = float(parts[4])
-                                
-                                robot_positions[robot_id] = {
-                                    'x': x, 'y': y, 'z': z, 'rotation': rotation
-                                }
+                    robot_positions.update(frame_positions)
                     
                     # Update current robot info
                     if robot_positions and len(robot_positions) > 0:
@@ -2595,6 +2628,8 @@ class DrawSolutionDialog(QDialog):
             'blue': [],
             'yellow': []
         }
+        # Bumped whenever a color's path changes so the canvas only redraws that color
+        self.path_versions = {color: 0 for color in self.solution_paths}
         
         # Canvas for drawing
         self.canvas = DrawSolutionCanvas(self, self.level_data)
@@ -2680,7 +2715,7 @@ class DrawSolutionDialog(QDialog):
                 y = int(y1 + t * (y2 - y1))
                 path.append((x, y))
             
-            self.solution_paths[color] = path
+            self.set_path(color, path)
         
         self.canvas.update()
         QMessageBox.information(self, "Success", "Fastest (straight line) solution generated for all active colors!")
@@ -2741,7 +2776,7 @@ class DrawSolutionDialog(QDialog):
             # Add final point
             path.append((int(x2), int(y2)))
             
-            self.solution_paths[color] = path
+            self.set_path(color, path)
         
         self.canvas.update()
         QMessageBox.information(self, "Success", "Random curved solution generated for all active colors!")
@@ -2753,6 +2788,10 @@ class DrawSolutionDialog(QDialog):
         color_upper = color.capitalize()
         
         color_obj = self.parent_window.colors[color]
+        
+        # Pen used by the canvas while drawing - only changes with the active color
+        self.active_pen = QPen(color_obj, 4)
+        
         self.mode_label.setText(f"Drawing: {color_upper} Robot Path")
         self.mode_label.setStyleSheet(f"""
             font-size: 18px; 
@@ -2777,10 +2816,15 @@ class DrawSolutionDialog(QDialog):
         self.update_mode_label()
         self.canvas.update()
     
+    def set_path(self, color, path):
+        """Replace a color's path and mark it for redraw"""
+        self.solution_paths[color] = path
+        self.path_versions[color] += 1
+    
     def clear_current_color(self):
         """Clear current color's path"""
         color = self.colors[self.current_color_idx]
-        self.solution_paths[color] = []
+        self.set_path(color, [])
         self.canvas.update()
     
     def reset_all(self):
@@ -2791,7 +2835,7 @@ class DrawSolutionDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             for color in self.colors:
-                self.solution_paths[color] = []
+                self.set_path(color, [])
             self.current_color_idx = 0
             self.update_mode_label()
             self.canvas.update()
@@ -2877,33 +2921,60 @@ class DrawSolutionCanvas(QGraphicsView):
         self.setStyleSheet("background-color: white; border: 2px solid #333333;")
         self.setMinimumSize(600, 400)
         
+        # Skip per-item painter save/restore and cache the static background
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        
+        # Only deliver move events while a button is held (no hover storm)
+        self.setMouseTracking(False)
+        self.viewport().setMouseTracking(False)
+        
         self.is_drawing = False
         self.current_path = []
+        self.stroke_path = None
+        self.stroke_item = None
+        
+        # Per-color path items and the path version they were built from
+        self.path_items = {}
+        self.drawn_path_versions = {}
         
+        self.draw_static_elements()
         self.draw_canvas()
     
     def draw_canvas(self):
-        """Draw the canvas with boundary, dots, and current paths"""
-        self.scene.clear()
-        
-        boundary = self.level_data['boundary']
-        
-        # Draw boundary
-        pen = QPen(QColor(0, 0, 0), 2)
-        self.scene.addRect(0, 0, boundary['width'], boundary['height'], pen)
-        
-        # Draw all solution paths
+        """Redraw the paths of colors that changed since the last draw"""
         for color_name, path in self.parent_dialog.solution_paths.items():
+            version = self.parent_dialog.path_versions[color_name]
+            if self.drawn_path_versions.get(color_name) == version:
+                continue
+            self.drawn_path_versions[color_name] = version
+            
+            old_item = self.path_items.pop(color_name, None)
+            if old_item is not None:
+                self.scene.removeItem(old_item)
+            
             if len(path) < 2:
                 continue
             
             color = self.parent_dialog.parent_window.colors[color_name]
-            pen = QPen(color, 4)
+            painter_path = QPainterPath(QPointF(*path[0]))
+            for x, y in path[1:]:
+                painter_path.lineTo(x, y)
             
-            for i in range(len(path) - 1):
-                x1, y1 = path[i]
-                x2, y2 = path[i + 1]
-                self.scene.addLine(x1, y1, x2, y2, pen)
+            item = self.scene.addPath(painter_path, QPen(color, 4))
+            item.setZValue(-1)  # Keep dots on top of paths
+            self.path_items[color_name] = item
+        
+        self.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
+    
+    def draw_static_elements(self):
+        """Draw boundary and dots (these don't change while drawing)"""
+        boundary = self.level_data['boundary']
+        
+        # Draw boundary
+        pen = QPen(QColor(0, 0, 0), 2)
+        self.scene.addRect(0, 0, boundary['width'], boundary['height'], pen)
         
         # Draw dots (on top of paths)
         dot_radius = 15
@@ -2919,20 +2990,18 @@ class DrawSolutionCanvas(QGraphicsView):
             self.scene.addEllipse(start_x - dot_radius, start_y - dot_radius,
                                  dot_radius * 2, dot_radius * 2,
                                  QPen(color, 2), color)
-            text = self.scene.addText("S")
-            text.setPos(start_x - 5, start_y - 12)
-            text.setDefaultTextColor(QColor(0, 0, 0))
+            text = self.scene.addSimpleText("S")
+            text.setPos(start_x - 1, start_y - 8)  # No document margin, unlike addText
+            text.setBrush(QColor(0, 0, 0))
             
             # End dot
             end_x, end_y = positions['end']
             self.scene.addEllipse(end_x - dot_radius, end_y - dot_radius,
                                  dot_radius * 2, dot_radius * 2,
                                  QPen(color, 2), color)
-            text = self.scene.addText("E")
-            text.setPos(end_x - 5, end_y - 12)
-            text.setDefaultTextColor(QColor(0, 0, 0))
-        
-        self.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
+            text = self.scene.addSimpleText("E")
+            text.setPos(end_x - 1, end_y - 8)  # No document margin, unlike addText
+            text.setBrush(QColor(0, 0, 0))
     
     def mousePressEvent(self, event):
         """Start drawing on mouse press"""
@@ -2943,39 +3012,48 @@ class DrawSolutionCanvas(QGraphicsView):
         if 0 <= x <= boundary['width'] and 0 <= y <= boundary['height']:
             self.is_drawing = True
             self.current_path = [(int(x), int(y))]
+            
+            # Live stroke shown while dragging, replaced by the committed path on release
+            self.stroke_path = QPainterPath(QPointF(*self.current_path[0]))
+            self.stroke_item = self.scene.addPath(self.stroke_path, self.parent_dialog.active_pen)
+            event.accept()
     
     def mouseMoveEvent(self, event):
         """Continue drawing on mouse move"""
         if not self.is_drawing:
             return
+        event.accept()
         
         scene_pos = self.mapToScene(event.pos())
         x, y = scene_pos.x(), scene_pos.y()
         
         boundary = self.level_data['boundary']
         if 0 <= x <= boundary['width'] and 0 <= y <= boundary['height']:
-            self.current_path.append((int(x), int(y)))
+            point = (int(x), int(y))
             
-            # Draw temporary line
-            if len(self.current_path) >= 2:
-                color = self.parent_dialog.colors[self.parent_dialog.current_color_idx]
-                color_obj = self.parent_dialog.parent_window.colors[color]
-                pen = QPen(color_obj, 4)
-                
-                x1, y1 = self.current_path[-2]
-                x2, y2 = self.current_path[-1]
-                self.scene.addLine(x1, y1, x2, y2, pen)
+            # Drop sub-pixel moves that land on the last stored point
+            if point == self.current_path[-1]:
+                return
+            self.current_path.append(point)
+            
+            # Extend temporary stroke
+            self.stroke_path.lineTo(*point)
+            self.stroke_item.setPath(self.stroke_path)
     
     def mouseReleaseEvent(self, event):
         """Finish drawing on mouse release"""
         if self.is_drawing:
             self.is_drawing = False
+            event.accept()
             
             # Save the path to current color
             if len(self.current_path) >= 2:
                 color = self.parent_dialog.colors[self.parent_dialog.current_color_idx]
-                self.parent_dialog.solution_paths[color] = self.current_path
+                self.parent_dialog.set_path(color, self.current_path)
             
+            self.scene.removeItem(self.stroke_item)
+            self.stroke_item = None
+            self.stroke_path = None
             self.current_path = []
             self.draw_canvas()
     
@@ -3050,6 +3128,12 @@ class CustomizeLevelDialog(QDialog):
             self.temp_dots[color]['start'] = self.level_data['dots'][color]['start']
             self.temp_dots[color]['end'] = self.level_data['dots'][color]['end']
         
+        # Flat copy of temp_dots for vectorized distance checks (NaN = unset)
+        # Row index is color_idx * len(positions) + position_idx
+        self.dot_slots = [(color, pos_type) for color in self.colors for pos_type in self.positions]
+        self.dot_array = np.full((len(self.dot_slots), 2), np.nan, dtype=np.float32)
+        self.sync_dot_array()
+        
         # Canvas for customization (now temp_dots is populated)
         self.canvas = CustomizeCanvas(self, self.level_data)
         self.canvas.temp_dots = self.temp_dots  # Pass the temp_dots to canvas
@@ -3131,29 +3215,26 @@ class CustomizeLevelDialog(QDialog):
         self.update_mode_label()
         self.canvas.update()
     
+    def sync_dot_array(self):
+        """Refresh the flat dot array from temp_dots"""
+        for row, (color, pos_type) in enumerate(self.dot_slots):
+            pos = self.temp_dots[color][pos_type]
+            self.dot_array[row] = pos if pos is not None else (np.nan, np.nan)
+    
     def validate_position(self, new_x, new_y):
         """Validate if the new position is far enough from all other dots"""
-        # Collect all existing positions except the current one being placed
-        all_positions = []
-        
-        current_color = self.colors[self.current_color_idx]
-        current_position = self.positions[self.current_position_idx]
+        # Squared distance to every dot; unset dots are NaN
+        dist_sq = ((self.dot_array - (new_x, new_y)) ** 2).sum(axis=1)
         
-        for color in self.colors:
-            for pos_type in self.positions:
-                # Skip the position we're currently placing
-                if color == current_color and pos_type == current_position:
-                    continue
-                
-                pos = self.temp_dots[color][pos_type]
-                if pos is not None:
-                    all_positions.append(pos)
+        # Skip the position we're currently placing
+        current_row = self.current_color_idx * len(self.positions) + self.current_position_idx
+        dist_sq[current_row] = np.nan
         
-        # Check distance to all existing positions
-        for (x, y) in all_positions:
-            distance = ((new_x - x) ** 2 + (new_y - y) ** 2) ** 0.5
-            if distance < self.min_distance:
-                return False, (x, y)
+        dist_sq = np.nan_to_num(dist_sq, nan=np.inf)
+        nearest = int(np.argmin(dist_sq))
+        if dist_sq[nearest] < self.min_distance ** 2:
+            color, pos_type = self.dot_slots[nearest]
+            return False, self.temp_dots[color][pos_type]
         
         return True, None
     
@@ -3174,6 +3255,7 @@ class CustomizeLevelDialog(QDialog):
         position = self.positions[self.current_position_idx]
         
         self.temp_dots[color][position] = (x, y)
+        self.dot_array[self.current_color_idx * len(self.positions) + self.current_position_idx] = (x, y)
         self.canvas.temp_dots = self.temp_dots
         self.canvas.update()
         
@@ -3190,6 +3272,7 @@ class CustomizeLevelDialog(QDialog):
             for color in self.colors:
                 self.temp_dots[color]['start'] = self.level_data['dots'][color]['start']
                 self.temp_dots[color]['end'] = self.level_data['dots'][color]['end']
+            self.sync_dot_array()
             
             self.canvas.temp_dots = self.temp_dots
             self.canvas.update()
@@ -3261,6 +3344,11 @@ class CustomizeCanvas(QGraphicsView):
         # Set minimum size to prevent tiny initial viewport
         self.setMinimumSize(600, 400)
         
+        # Skip per-item painter save/restore and cache the static background
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        
         self.temp_dots = None
         self.draw_canvas()
     
@@ -3287,9 +3375,9 @@ class CustomizeCanvas(QGraphicsView):
                                          dot_radius * 2, dot_radius * 2,
                                          QPen(color, 2), color)
                     # Add "S" text
-                    text = self.scene.addText("S")
-                    text.setPos(start_x - 5, start_y - 12)
-                    text.setDefaultTextColor(QColor(0, 0, 0))
+                    text = self.scene.addSimpleText("S")
+                    text.setPos(start_x - 1, start_y - 8)  # No document margin, unlike addText
+                    text.setBrush(QColor(0, 0, 0))
                 
                 # End dot
                 if positions['end']:
@@ -3298,9 +3386,9 @@ class CustomizeCanvas(QGraphicsView):
                                          dot_radius * 2, dot_radius * 2,
                                          QPen(color, 2), color)
                     # Add "E" text
-                    text = self.scene.addText("E")
-                    text.setPos(end_x - 5, end_y - 12)
-                    text.setDefaultTextColor(QColor(0, 0, 0))
+                    text = self.scene.addSimpleText("E")
+                    text.setPos(end_x - 1, end_y - 8)  # No document margin, unlike addText
+                    text.setBrush(QColor(0, 0, 0))
         
         # Fit view
         self.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
@@ -3373,6 +3461,9 @@ class SolutionViewDialog(QDialog):
             self.solution_canvas.setScene(self.solution_scene)
             self.solution_canvas.setRenderHint(QPainter.Antialiasing)
             self.solution_canvas.setStyleSheet("background-color: white; border: 2px solid #333333;")
+            self.solution_canvas.setOptimizationFlags(QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing)
+            self.solution_canvas.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+            self.solution_canvas.setCacheMode(QGraphicsView.CacheBackground)
             
             layout.addWidget(self.solution_canvas)
             
@@ -3549,8 +3640,20 @@ class PreviewDialog(QDialog):
             self.pause_btn.setEnabled(False)
 
 
+class RobotAnimation:
+    """Per-robot preview animation state, built once when the animation starts"""
+    def __init__(self, coords, robot_item, path_item):
+        self.coords = coords            # (N, 2) float32 array of the robot's path
+        self.points = QPolygonF([QPointF(x, y) for x, y in coords])
+        self.robot_item = robot_item    # Robot circle
+        self.path_item = path_item      # Traced path item
+        self.traced = QPainterPath(self.points[0])
+
+
 class PreviewCanvas(QGraphicsView):
     """Canvas for previewing solution animation"""
+    ROBOT_RADIUS = 10
+    
     def __init__(self, parent_dialog, level_data, solution):
         super().__init__(parent_dialog)
         self.parent_dialog = parent_dialog
@@ -3563,10 +3666,25 @@ class PreviewCanvas(QGraphicsView):
         self.setStyleSheet("background-color: white; border: 2px solid #333333;")
         self.setMinimumSize(600, 400)
         
-        # Robot tracking
-        self.robot_positions = {}  # Current position index in path for each color
-        self.robot_graphics = {}   # Graphics items for each robot
-        self.path_graphics = {}    # Graphics items for traced paths
+        # Skip per-item painter save/restore and cache the static background
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        
+        # Robot tracking - one RobotAnimation per robot with a path, with the
+        # current/last path indices of all robots kept side by side in arrays
+        self.robots = []
+        self.robot_idx = np.zeros(0, dtype=np.int32)
+        self.robot_last_idx = np.zeros(0, dtype=np.int32)
+        
+        self.active_robots = 0  # Robots that have not reached the end of their path
+        
+        # All animation items live under one group so a reset is a single removal
+        self.anim_group = None
+        
+        # Pens reused by every animation run (trace pens are created per color on first use)
+        self.robot_outline_pen = QPen(QColor(0, 0, 0), 2)
+        self.trace_pens = {}
         
         self.draw_static_elements()
     
@@ -3586,12 +3704,14 @@ class PreviewCanvas(QGraphicsView):
                 continue
             
             color = self.parent_dialog.parent_window.colors[color_name]
-            pen = QPen(QColor(color.red(), color.green(), color.blue(), 60), 2, Qt.DashLine)
+            faded = QColor(color.red(), color.green(), color.blue(), 60)
+            pen = QPen(faded, 2, Qt.DashLine)
             
-            for i in range(len(path) - 1):
-                x1, y1 = path[i]
-                x2, y2 = path[i + 1]
-                self.scene.addLine(x1, y1, x2, y2, pen)
+            # One path item per color instead of one line item per segment
+            guide = QPainterPath(QPointF(*path[0]))
+            for x, y in path[1:]:
+                guide.lineTo(x, y)
+            self.scene.addPath(guide, pen)
         
         # Draw dots
         dot_radius = 15
@@ -3607,102 +3727,107 @@ class PreviewCanvas(QGraphicsView):
             self.scene.addEllipse(start_x - dot_radius, start_y - dot_radius,
                                  dot_radius * 2, dot_radius * 2,
                                  QPen(color, 2), color)
-            text = self.scene.addText("S")
-            text.setPos(start_x - 5, start_y - 12)
-            text.setDefaultTextColor(QColor(0, 0, 0))
+            text = self.scene.addSimpleText("S")
+            text.setPos(start_x - 1, start_y - 8)  # No document margin, unlike addText
+            text.setBrush(QColor(0, 0, 0))
             
             # End dot
             end_x, end_y = positions['end']
             self.scene.addEllipse(end_x - dot_radius, end_y - dot_radius,
                                  dot_radius * 2, dot_radius * 2,
                                  QPen(color, 2), color)
-            text = self.scene.addText("E")
-            text.setPos(end_x - 5, end_y - 12)
-            text.setDefaultTextColor(QColor(0, 0, 0))
+            text = self.scene.addSimpleText("E")
+            text.setPos(end_x - 1, end_y - 8)  # No document margin, unlike addText
+            text.setBrush(QColor(0, 0, 0))
         
         self.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
     
     def start_animation(self):
         """Initialize animation state"""
-        self.robot_positions = {}
-        self.robot_graphics = {}
-        self.path_graphics = {}
+        self.reset_animation()  # Drop items left over from a completed run
+        self.anim_group = QGraphicsItemGroup()
+        self.scene.addItem(self.anim_group)
         
         # Create robot graphics at start positions
-        robot_radius = 10
+        robot_radius = self.ROBOT_RADIUS
         for color_name, path in self.solution.items():
             if len(path) < 2:
                 continue
             
             color = self.parent_dialog.parent_window.colors[color_name]
-            
-            # Initialize position
-            self.robot_positions[color_name] = 0
+            coords = np.asarray(path, dtype=np.float32)
             
             # Create robot circle
             x, y = path[0]
-            robot = self.scene.addEllipse(x - robot_radius, y - robot_radius,
-                                         robot_radius * 2, robot_radius * 2,
-                                         QPen(QColor(0, 0, 0), 2), color)
-            self.robot_graphics[color_name] = robot
-            
-            # Initialize path graphics list
-            self.path_graphics[color_name] = []
+            robot_item = self.scene.addEllipse(x - robot_radius, y - robot_radius,
+                                               robot_radius * 2, robot_radius * 2,
+                                               self.robot_outline_pen, color)
+            
+            # Traced path - a single item extended as the robot moves
+            trace_pen = self.trace_pens.get(color_name)
+            if trace_pen is None:
+                trace_pen = QPen(color, 4)
+                trace_pen.setCapStyle(Qt.RoundCap)
+                self.trace_pens[color_name] = trace_pen
+            path_item = self.scene.addPath(QPainterPath(QPointF(x, y)), trace_pen)
+            
+            self.anim_group.addToGroup(robot_item)
+            self.anim_group.addToGroup(path_item)
+            self.robots.append(RobotAnimation(coords, robot_item, path_item))
+        
+        self.robot_idx = np.zeros(len(self.robots), dtype=np.int32)
+        self.robot_last_idx = np.array([len(robot.coords) - 1 for robot in self.robots], dtype=np.int32)
+        self.active_robots = len(self.robots)
     
     def animate_step(self, velocity):
-        """Move robots one step along their paths"""
-        all_finished = True
+        """Move robots one step along their paths; returns True once every robot has finished"""
+        if self.active_robots == 0:
+            return True
         
-        for color_name, path in self.solution.items():
-            if len(path) < 2:
-                continue
-            
-            current_idx = self.robot_positions.get(color_name, 0)
-            
-            # Check if this robot has finished
-            if current_idx >= len(path) - 1:
-                continue
-            
-            all_finished = False
-            
-            # Calculate how many steps to move based on velocity
-            steps_to_move = max(1, velocity // 10)  # Convert velocity to path steps
-            new_idx = min(current_idx + steps_to_move, len(path) - 1)
+        # Nothing can see the scene, so hold the robots where they are until it is shown again
+        if not self.isVisible() or self.window().isMinimized():
+            return False
+        
+        # Calculate how many steps to move based on velocity
+        steps_to_move = max(1, velocity // 10)  # Convert velocity to path steps
+        robot_radius = self.ROBOT_RADIUS
+        
+        # Advance every robot at once; robots already at their last point stay put
+        new_idx = np.minimum(self.robot_idx + steps_to_move, self.robot_last_idx)
+        moved = np.flatnonzero(new_idx != self.robot_idx)
+        
+        for i in moved:
+            robot = self.robots[i]
+            start, end = self.robot_idx[i], new_idx[i]
             
             # Update robot position
-            robot = self.robot_graphics[color_name]
-            x, y = path[new_idx]
-            robot_radius = 10
-            robot.setRect(x - robot_radius, y - robot_radius, robot_radius * 2, robot_radius * 2)
-            
-            # Draw traced path
-            color = self.parent_dialog.parent_window.colors[color_name]
-            pen = QPen(color, 4)
+            x, y = robot.coords[end]
+            robot.robot_item.setRect(x - robot_radius, y - robot_radius,
+                                     robot_radius * 2, robot_radius * 2)
             
-            for i in range(current_idx, new_idx):
-                x1, y1 = path[i]
-                x2, y2 = path[i + 1]
-                line = self.scene.addLine(x1, y1, x2, y2, pen)
-                self.path_graphics[color_name].append(line)
-            
-            # Update position index
-            self.robot_positions[color_name] = new_idx
+            # Extend traced path
+            for j in range(start + 1, end + 1):
+                robot.traced.lineTo(robot.points[j])
+            robot.path_item.setPath(robot.traced)
+        
+        # Update position indices
+        self.robot_idx = new_idx
+        self.active_robots = int(np.count_nonzero(new_idx < self.robot_last_idx))
         
-        return all_finished
+        # Report completion on the tick the last robot arrives
+        return self.active_robots == 0
     
     def reset_animation(self):
         """Reset animation to initial state"""
         # Remove robots and traced paths
-        for robot in self.robot_graphics.values():
-            self.scene.removeItem(robot)
-        
-        for color_paths in self.path_graphics.values():
-            for line in color_paths:
-                self.scene.removeItem(line)
-        
-        self.robot_positions = {}
-        self.robot_graphics = {}
-        self.path_graphics = {}
+        if self.anim_group is not None:
+            self.scene.removeItem(self.anim_group)
+            self.anim_group = None
+        
+        self.robots = []
+        self.robot_idx = np.zeros(0, dtype=np.int32)
+        self.robot_last_idx = np.zeros(0, dtype=np.int32)
+        self.active_robots = 0
     
     def resizeEvent(self, event):
         """Re-fit view when widget is resized"""
@@ -3712,9 +3837,118 @@ class PreviewCanvas(QGraphicsView):
 
 
 
+class OptiTrackReader(QThread):
+    """Background reader for the OptiTrack position stream
+    
+    Receives and parses frames off the GUI thread and emits the parsed
+    positions as {robot_id: {'x': x, 'y': y, 'z': z, 'rotation': rot}}.
+    Once a canvas transform is set, it also emits the positions already mapped
+    to integer canvas centers as {robot_id: (canvas_x, canvas_y)}.
+    """
+    positions_ready = pyqtSignal(dict)
+    canvas_positions_ready = pyqtSignal(dict)
+    read_error = pyqtSignal(str)
+    
+    def __init__(self, optitrack_socket, parent=None, binary=False):
+        super().__init__(parent)
+        self.optitrack_socket = optitrack_socket
+        self.stream = OptiTrackStream(binary)  # Keeps partial entries between reads
+        # Short blocking timeout so the loop notices stop() promptly
+        self.optitrack_socket.settimeout(0.1)
+        self.running = False
+        self.canvas_transform = None  # (coefficients, size), replaced whole from the GUI thread
+    
+    def set_canvas_transform(self, coefficients, size):
+        """Set the OptiTrack → canvas mapping used for canvas_positions_ready"""
+        self.canvas_transform = (coefficients, size)
+    
+    def run(self):
+        """Read and parse frames until stopped"""
+        self.running = True
+        while self.running:
+            try:
+                received = self.stream.receive(self.optitrack_socket)
+            except socket.timeout:
+                continue  # No data available
+            except Exception as e:
+                if self.running:
+                    self.read_error.emit(str(e))
+                break
+            
+            if not received:
+                # Server closed the connection
+                break
+            
+            # None while the rest of the entry hasn't arrived yet
+            robot_positions = self.stream.take_frame()
+            if robot_positions:
+                self.positions_ready.emit(robot_positions)
+                canvas_transform = self.canvas_transform
+                if canvas_transform is not None:
+                    self.canvas_positions_ready.emit(
+                        optitrack_canvas_positions(robot_positions, *canvas_transform))
+    
+    def stop(self):
+        """Stop the read loop and wait for the thread to finish"""
+        self.running = False
+        self.wait()
+
+
 class ExecutionDialog(QDialog):
     """Dialog for executing solution with real robots and camera feed"""
     
+    # Status label colors: status -> (background, text color)
+    STATUS_COLORS = {
+        "BOOTING": ("#FFA500", "black"),    # Orange
+        "PREP": ("#2196F3", "black"),       # Blue
+        "READY": ("#00E676", "black"),      # Bright green - ready to start
+        "EXECUTING": ("#4CAF50", "white"),  # Green
+        "ERROR": ("#f44336", "white"),      # Red
+        "DONE": ("#00C853", "white"),       # Success green
+        "TIMEOUT": ("#FF5722", "white"),    # Deep orange
+    }
+    
+    # Dialog-level stylesheet, parsed once; widgets switch look via their "state" property
+    EXECUTION_STYLESHEET = """
+        QLabel#statusLabel, QLabel#timerLabel {
+            font-size: 18px;
+            font-weight: bold;
+            padding: 5px;
+            border-radius: 5px;
+        }
+        QLabel#statusLabel { background-color: #9E9E9E; color: white; }
+    """ + "".join(
+        f"QLabel#statusLabel[state=\"{status}\"] {{ background-color: {background}; color: {text_color}; }}\n"
+        for status, (background, text_color) in STATUS_COLORS.items()
+    ) + """
+        QLabel#timerLabel { background-color: #2196F3; color: white; }
+        QLabel#timerLabel[state="caution"] { background-color: #FFC107; color: black; }
+        QLabel#timerLabel[state="warning"] { background-color: #FF9800; color: white; }
+        
+        QPushButton#vizModeToggle {
+            font-size: 16px;
+            font-weight: bold;
+            padding: 5px;
+            color: white;
+            border-radius: 5px;
+            background-color: #9C27B0;
+        }
+        QPushButton#vizModeToggle[state="camera"] { background-color: #4CAF50; }
+        
+        QPushButton#startButton {
+            background-color: #4CAF50;
+            color: white;
+            font-weight: bold;
+            padding: 10px;
+            font-size: 14px;
+        }
+        QPushButton#startButton[state="ready"] { border: 3px solid #00ff00; }
+        QPushButton#startButton[state="started"] { background-color: #666; }
+    """
+    
+    # Timer label state per time bucket (0 = normal, 1 = caution, 2 = warning)
+    TIMER_STATES = ("normal", "caution", "warning")
+    
     def __init__(self, parent, level_num, solution, player_name):
         super().__init__(parent)
         self.parent_window = parent
@@ -3725,6 +3959,7 @@ class ExecutionDialog(QDialog):
         
         self.setWindowTitle(f"Executing - {self.level_data['name']} - {player_name}")
         self.setGeometry(100, 50, 1000, 800)  # Optimized size for new layout
+        self.setStyleSheet(self.EXECUTION_STYLESHEET)
         
         # Execution state
         self.execution_status = "BOOTING"  # BOOTING/PREP/EXECUTING/ERROR/DONE/TIMEOUT
@@ -3742,10 +3977,14 @@ class ExecutionDialog(QDialog):
         # Timer control
         self.timer_started = False  # Timer only starts when user clicks Start button
         
+        # Last rendered timer state - the label is only touched when these change
+        self.last_timer_text = "0.00s"
+        self.last_timer_bucket = 0  # 0 = normal, 1 = caution (>40s), 2 = warning (>50s)
+        
         layout = QVBoxLayout(self)
 
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         
         # Title
         title = QLabel(f"<h2>Execution - {self.level_data['name']}</h2>")
@@ -3766,14 +4005,8 @@ class ExecutionDialog(QDialog):
         status_layout = QVBoxLayout(status_frame)
         status_layout.addWidget(QLabel("<b>Status:</b>"))
         self.status_label = QLabel("BOOTING")
-        self.status_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            padding: 5px;
-            background-color: #FFA500;
-            color: black;
-            border-radius: 5px;
-        """)
+        self.status_label.setObjectName("statusLabel")
+        self.status_label.setProperty("state", "BOOTING")
         self.status_label.setAlignment(Qt.AlignCenter)
         status_layout.addWidget(self.status_label)
         info_layout.addWidget(status_frame)
@@ -3784,14 +4017,8 @@ class ExecutionDialog(QDialog):
         timer_layout = QVBoxLayout(timer_frame)
         timer_layout.addWidget(QLabel("<b>Time:</b>"))
         self.timer_label = QLabel("0.00s")
-        self.timer_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            padding: 5px;
-            background-color: #2196F3;
-            color: white;
-            border-radius: 5px;
-        """)
+        self.timer_label.setObjectName("timerLabel")
+        self.timer_label.setProperty("state", self.TIMER_STATES[0])
         self.timer_label.setAlignment(Qt.AlignCenter)
         timer_layout.addWidget(self.timer_label)
         info_layout.addWidget(timer_frame)
@@ -3802,14 +4029,8 @@ class ExecutionDialog(QDialog):
         viz_mode_layout = QVBoxLayout(viz_mode_frame)
         viz_mode_layout.addWidget(QLabel("<b>View Mode:</b>"))
         self.viz_mode_toggle = QPushButton("🎯 OptiTrack View")
-        self.viz_mode_toggle.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            padding: 5px;
-            background-color: #9C27B0;
-            color: white;
-            border-radius: 5px;
-        """)
+        self.viz_mode_toggle.setObjectName("vizModeToggle")
+        self.viz_mode_toggle.setProperty("state", "optitrack")
         self.viz_mode_toggle.clicked.connect(self.toggle_viz_mode)
         viz_mode_layout.addWidget(self.viz_mode_toggle)
         info_layout.addWidget(viz_mode_frame)
@@ -3825,6 +4046,19 @@ class ExecutionDialog(QDialog):
         self.camera_combo.currentIndexChanged.connect(self.change_camera)
         camera_select_layout.addWidget(self.camera_combo)
         
+        # Probe results are cached across dialogs, so cameras plugged in later need a re-scan
+        rescan_cameras_btn = QPushButton("🔄 Re-scan")
+        rescan_cameras_btn.setToolTip("Detect cameras again (e.g. after plugging one in)")
+        rescan_cameras_btn.clicked.connect(self.rescan_cameras)
+        camera_select_layout.addWidget(rescan_cameras_btn)
+        
+        # Smooth (area + bilinear) or fast (nearest neighbor) camera downscaling
+        self.smooth_scaling_check = QCheckBox("Smooth scaling")
+        self.smooth_scaling_check.setChecked(True)
+        self.smooth_scaling_check.setToolTip("Uncheck on slow computers for a cheaper, blockier camera image")
+        self.smooth_scaling_check.toggled.connect(self.set_smooth_scaling)
+        camera_select_layout.addWidget(self.smooth_scaling_check)
+        
         camera_select_layout.addStretch()
         layout.addLayout(camera_select_layout)
         
@@ -3867,6 +4101,7 @@ class ExecutionDialog(QDialog):
         log_layout = QVBoxLayout()
         
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(200)  # Keep only the most recent lines
         self.log_text.setMaximumHeight(80)  # Restored to 80px for better readability
         self.log_text.setStyleSheet("""
             background-color: #1e1e1e;
@@ -3883,7 +4118,7 @@ class ExecutionDialog(QDialog):
         button_layout = QHBoxLayout()
         
         self.start_btn = QPushButton("▶️ Start Execution")
-        self.start_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 10px; font-size: 14px;")
+        self.start_btn.setObjectName("startButton")
         self.start_btn.clicked.connect(self.manual_start_execution)
         button_layout.addWidget(self.start_btn)
         
@@ -3906,9 +4141,18 @@ class ExecutionDialog(QDialog):
         self.update_timer.timeout.connect(self.update_execution)
         self.update_timer.start(20)  # Update every 20ms
         
+        # Single timer stepping through the simulated boot/upload sequence
+        self.boot_timer = QTimer(self)
+        self.boot_timer.setSingleShot(True)
+        self.boot_timer.timeout.connect(self.advance_boot_script)
+        self.boot_script = []  # Remaining (delay_ms, log message or callable) steps
+        
         # OptiTrack connection
         self.optitrack_socket = None
+        self.optitrack_reader = None
         self.optitrack_running = False
+        # Connected once here (after the canvas's own handler) so the reader follows bound changes
+        self.parent_window.optitrack_bounds_changed.connect(self.update_reader_canvas_transform)
         self.init_optitrack_connection()
         
         # Log initial message
@@ -3924,7 +4168,7 @@ class ExecutionDialog(QDialog):
             self.log("[OPTITRACK VIZ] Visualization started (default view)")
         
         # Prepare robots (but don't start timer automatically)
-        QTimer.singleShot(1000, self.start_execution_sequence)
+        self.run_boot_script([(1000, self.start_execution_sequence)])
     
     def toggle_viz_mode(self):
         """Toggle between Camera View and OptiTrack Visualization Mode"""
@@ -3934,15 +4178,9 @@ class ExecutionDialog(QDialog):
             self.optitrack_canvas.hide()
             self.optitrack_canvas.stop_visualization()  # Stop updating when hidden
             self.camera_canvas.show()
+            self.camera_canvas.resume_camera_stream()
             self.viz_mode_toggle.setText("📷 Camera View")
-            self.viz_mode_toggle.setStyleSheet("""
-                font-size: 16px;
-                font-weight: bold;
-                padding: 5px;
-                background-color: #4CAF50;
-                color: white;
-                border-radius: 5px;
-            """)
+            self.set_style_state(self.viz_mode_toggle, "camera")
             self.log("[SYSTEM] Switched to Camera View")
         else:
             # Switch to OptiTrack mode
@@ -3954,16 +4192,10 @@ class ExecutionDialog(QDialog):
             
             self.viz_mode = "optitrack"
             self.camera_canvas.hide()
+            self.camera_canvas.pause_camera_stream()  # Stop grabbing frames when hidden
             self.optitrack_canvas.show()
             self.viz_mode_toggle.setText("🎯 OptiTrack View")
-            self.viz_mode_toggle.setStyleSheet("""
-                font-size: 16px;
-                font-weight: bold;
-                padding: 5px;
-                background-color: #9C27B0;
-                color: white;
-                border-radius: 5px;
-            """)
+            self.set_style_state(self.viz_mode_toggle, "optitrack")
             self.log("[SYSTEM] Switched to OptiTrack Visualization Mode")
             
             # Start OptiTrack visualization
@@ -3971,24 +4203,36 @@ class ExecutionDialog(QDialog):
                 self.optitrack_canvas.start_visualization()
                 self.log("[OPTITRACK VIZ] Visualization started")
     
+    @staticmethod
+    def probe_camera(camera_id):
+        """Open a camera, read one frame to verify it works, and release it"""
+        cap = cv2.VideoCapture(camera_id, cv2.CAP_DSHOW)  # Use DirectShow on Windows
+        try:
+            if not cap.isOpened():
+                return False
+            ret, frame = cap.read()
+            return ret
+        finally:
+            cap.release()
+    
     def detect_cameras(self):
         """Detect available cameras and populate combo box"""
         self.camera_combo.clear()
-        self.log("[SYSTEM] Detecting available cameras...")
-        
-        # Try to detect up to 3 camera indices (reduced to avoid errors)
-        available_cameras = []
-        for i in range(3):
-            cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)  # Use DirectShow on Windows
-            if cap.isOpened():
-                # Try to read a frame to verify camera works
-                ret, frame = cap.read()
-                if ret:
-                    available_cameras.append(i)
-                    self.log(f"[SYSTEM] Camera {i} detected and verified")
-                cap.release()
-                # Small delay to ensure camera is released
-                QTimer.singleShot(100, lambda: None)
+        
+        # Probing is slow (DirectShow can take seconds per index), so reuse earlier results
+        available_cameras = self.parent_window.camera_probe_cache
+        if available_cameras is None:
+            self.log("[SYSTEM] Detecting available cameras...")
+            
+            # Try to detect up to 3 camera indices, two at a time (drivers dislike many concurrent opens)
+            camera_ids = range(3)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(self.probe_camera, camera_ids))
+            
+            available_cameras = [i for i, ok in zip(camera_ids, results) if ok]
+            for i in available_cameras:
+                self.log(f"[SYSTEM] Camera {i} detected and verified")
+            self.parent_window.camera_probe_cache = available_cameras
         
         if available_cameras:
             for cam_id in available_cameras:
@@ -3998,6 +4242,23 @@ class ExecutionDialog(QDialog):
             self.camera_combo.addItem("No camera detected", -1)
             self.log("[SYSTEM] ⚠️ No cameras detected!")
     
+    def rescan_cameras(self):
+        """Drop the cached probe results and detect cameras again"""
+        previous_id = self.camera_combo.currentData()
+        was_open = self.camera_canvas.camera_capture is not None
+        self.camera_canvas.set_camera(-1)  # Release the open camera so its index can be probed
+        self.parent_window.camera_probe_cache = None
+        
+        # Repopulate silently, then reopen once (keeping the previous camera if it is still there)
+        self.camera_combo.blockSignals(True)
+        self.detect_cameras()
+        index = self.camera_combo.findData(previous_id)
+        if index >= 0:
+            self.camera_combo.setCurrentIndex(index)
+        self.camera_combo.blockSignals(False)
+        if was_open:
+            self.change_camera(self.camera_combo.currentIndex())
+    
     def change_camera(self, index):
         """Change the active camera"""
         if index >= 0:
@@ -4006,6 +4267,11 @@ class ExecutionDialog(QDialog):
                 self.log(f"[CAMERA] Switching to Camera {camera_id}")
                 self.camera_canvas.set_camera(camera_id)
     
+    def set_smooth_scaling(self, smooth):
+        """Switch the camera feed between smooth and fast downscaling"""
+        self.camera_canvas.set_smooth_scaling(smooth)
+        self.log(f"[CAMERA] {'Smooth' if smooth else 'Fast'} scaling")
+    
     def update_overlay_opacity(self, value):
         """Update solution overlay opacity"""
         self.overlay_opacity = value
@@ -4016,45 +4282,48 @@ class ExecutionDialog(QDialog):
     #smal bug here
     def log(self, message):
         """Add message to log"""
-        from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        self.log_text.append(f"[{timestamp}] {message}")
+        self.log_text.appendPlainText(f"[{timestamp}] {message}")
         # Auto-scroll to bottom
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+        scroll_bar = self.log_text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+    
+    @staticmethod
+    def set_style_state(widget, state):
+        """Switch a widget to another [state=...] rule of the dialog stylesheet"""
+        widget.setProperty("state", state)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
     
     def update_status(self, status):
         """Update execution status"""
+        # Repeated status: label text and style are already current
+        if status == self.execution_status and self.status_label.text() == status:
+            return
+        
         self.execution_status = status
         self.status_label.setText(status)
         
-        # Update color based on status
-        if status == "BOOTING":
-            color = "#FFA500"  # Orange
-        elif status == "PREP":
-            color = "#2196F3"  # Blue
-        elif status == "READY":
-            color = "#00E676"  # Bright green - ready to start
-        elif status == "EXECUTING":
-            color = "#4CAF50"  # Green
-        elif status == "ERROR":
-            color = "#f44336"  # Red
-        elif status == "DONE":
-            color = "#00C853"  # Success green
-        elif status == "TIMEOUT":
-            color = "#FF5722"  # Deep orange
+        # Update color based on status (unknown statuses fall back to gray)
+        self.set_style_state(self.status_label, status)
+    
+    def run_boot_script(self, steps):
+        """Replace the pending boot steps with a new list of (delay_ms, step) and start it"""
+        self.boot_script = list(steps)
+        if self.boot_script:
+            self.boot_timer.start(self.boot_script[0][0])
+    
+    def advance_boot_script(self):
+        """Run the next boot step (log a message or call a method) and schedule the following one"""
+        delay, step = self.boot_script.pop(0)
+        if callable(step):
+            step()  # May replace the script with the next phase
         else:
-            color = "#9E9E9E"  # Gray
+            self.log(step)
         
-        self.status_label.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: bold;
-            padding: 5px;
-            background-color: {color};
-            color: {'black' if status in ['BOOTING', 'PREP', 'READY'] else 'white'};
-            border-radius: 5px;
-        """)
+        if self.boot_script and not self.boot_timer.isActive():
+            self.boot_timer.start(self.boot_script[0][0])
     
     def start_execution_sequence(self):
         """Start the execution sequence"""
@@ -4062,12 +4331,14 @@ class ExecutionDialog(QDialog):
         self.log("[ROBOT] Checking robot connections...")
         
         # TODO: Actually check robot connections
-        # Simulate connection check
-        QTimer.singleShot(500, lambda: self.log("[ROBOT] Red robot: CONNECTED"))
-        QTimer.singleShot(700, lambda: self.log("[ROBOT] Green robot: CONNECTED"))
-        QTimer.singleShot(900, lambda: self.log("[ROBOT] Blue robot: CONNECTED"))
-        QTimer.singleShot(1100, lambda: self.log("[ROBOT] Yellow robot: CONNECTED"))
-        QTimer.singleShot(1300, self.prep_robots)
+        # Simulate connection check (delays are relative to the previous step)
+        self.run_boot_script([
+            (500, "[ROBOT] Red robot: CONNECTED"),
+            (200, "[ROBOT] Green robot: CONNECTED"),
+            (200, "[ROBOT] Blue robot: CONNECTED"),
+            (200, "[ROBOT] Yellow robot: CONNECTED"),
+            (200, self.prep_robots),
+        ])
     
     def prep_robots(self):
         """Prepare robots for execution"""
@@ -4076,11 +4347,13 @@ class ExecutionDialog(QDialog):
         self.log("[SYSTEM] Uploading solution paths to robots...")
         
         # TODO: Actually upload paths to robots
-        QTimer.singleShot(1000, lambda: self.log("[UPLOAD] Uploading red robot path..."))
-        QTimer.singleShot(1500, lambda: self.log("[UPLOAD] Uploading green robot path..."))
-        QTimer.singleShot(2000, lambda: self.log("[UPLOAD] Uploading blue robot path..."))
-        QTimer.singleShot(2500, lambda: self.log("[UPLOAD] Uploading yellow robot path..."))
-        QTimer.singleShot(3000, self.ready_to_start)
+        self.run_boot_script([
+            (1000, "[UPLOAD] Uploading red robot path..."),
+            (500, "[UPLOAD] Uploading green robot path..."),
+            (500, "[UPLOAD] Uploading blue robot path..."),
+            (500, "[UPLOAD] Uploading yellow robot path..."),
+            (500, self.ready_to_start),
+        ])
     
     def ready_to_start(self):
         """All robots ready, waiting for user to click Start button"""
@@ -4091,19 +4364,12 @@ class ExecutionDialog(QDialog):
         
         # Enable Start button
         self.start_btn.setEnabled(True)
-        self.start_btn.setStyleSheet("""
-            background-color: #4CAF50; 
-            color: white; 
-            font-weight: bold; 
-            padding: 10px; 
-            font-size: 14px;
-            border: 3px solid #00ff00;
-        """)
+        self.set_style_state(self.start_btn, "ready")
     
     def manual_start_execution(self):
         """User clicked Start button - begin execution and timer"""
         self.start_btn.setEnabled(False)
-        self.start_btn.setStyleSheet("background-color: #666; color: white; font-weight: bold; padding: 10px; font-size: 14px;")
+        self.set_style_state(self.start_btn, "started")
         self.abort_btn.setEnabled(True)
         
         self.start_execution()
@@ -4130,35 +4396,28 @@ class ExecutionDialog(QDialog):
         """Update execution state (called every 20ms)"""
         # Only update timer if user has clicked Start button
         if self.timer_started and self.execution_status == "EXECUTING" and self.start_time:
-            # Update timer
+            # Update timer (only when the displayed value changes)
             self.current_time = time.time() - self.start_time
-            self.timer_label.setText(f"{self.current_time:.2f}s")
+            minimized = self.isMinimized()
+            timer_text = f"{self.current_time:.2f}s"
+            if timer_text != self.last_timer_text and not minimized:
+                self.last_timer_text = timer_text
+                self.timer_label.setText(timer_text)
             
             # Check for timeout (execution longer than 60 seconds)
             if self.current_time > self.max_execution_time:
                 self.execution_timeout()
             
-            # Update timer color based on time
-            if self.current_time > 50:
-                # Warning - getting close to timeout
-                self.timer_label.setStyleSheet("""
-                    font-size: 18px;
-                    font-weight: bold;
-                    padding: 5px;
-                    background-color: #FF9800;
-                    color: white;
-                    border-radius: 5px;
-                """)
-            elif self.current_time > 40:
-                # Caution
-                self.timer_label.setStyleSheet("""
-                    font-size: 18px;
-                    font-weight: bold;
-                    padding: 5px;
-                    background-color: #FFC107;
-                    color: black;
-                    border-radius: 5px;
-                """)
+            # Labels catch up on the first tick after the window is restored
+            if minimized:
+                return
+            
+            # Update timer color based on time (restyle only on threshold transitions)
+            bucket = 2 if self.current_time > 50 else 1 if self.current_time > 40 else 0
+            if bucket == self.last_timer_bucket:
+                return
+            self.last_timer_bucket = bucket
+            self.set_style_state(self.timer_label, self.TIMER_STATES[bucket])
             
             # TODO: Check robot status and update accordingly
             # For now, check if we should simulate completion
@@ -4171,83 +4430,54 @@ class ExecutionDialog(QDialog):
             self.optitrack_socket.settimeout(2)
             self.optitrack_socket.connect((self.parent_window.optitrack_server_ip, 
                                           self.parent_window.optitrack_port))
-            self.optitrack_socket.setblocking(False)
+            binary = self.parent_window.optitrack_binary
+            if binary:
+                self.optitrack_socket.sendall(OPTITRACK_BINARY_HANDSHAKE)
             self.optitrack_running = True
-            self.log("[OPTITRACK] Connected to OptiTrack server")
-            
-            # Start reading OptiTrack data
-            self.optitrack_timer = QTimer(self)
-            self.optitrack_timer.timeout.connect(self.read_optitrack_data)
-            self.optitrack_timer.start(30)  # Read every 30ms
+            self.log(f"[OPTITRACK] Connected to OptiTrack server{' (binary stream)' if binary else ''}")
+            
+            # Start reading OptiTrack data on a background thread
+            self.optitrack_reader = OptiTrackReader(self.optitrack_socket, self, binary=binary)
+            self.optitrack_reader.positions_ready.connect(self.on_optitrack_positions)
+            # Canvas coordinates are computed on the reader thread; the canvas only moves its dots
+            self.update_reader_canvas_transform()
+            self.optitrack_reader.canvas_positions_ready.connect(
+                self.on_optitrack_canvas_positions, Qt.QueuedConnection)
+            self.optitrack_reader.read_error.connect(
+                lambda message: self.log(f"[OPTITRACK] ⚠️ Read error: {message}"))
+            self.optitrack_reader.start()
             
         except Exception as e:
             self.log(f"[OPTITRACK] ⚠️ Failed to connect: {str(e)}")
             self.optitrack_socket = None
             self.optitrack_running = False
     
-    def read_optitrack_data(self):
-        """Read robot position data from OptiTrack"""
-        if not self.optitrack_socket or not self.optitrack_running:
-            return
+    def on_optitrack_positions(self, robot_positions):
+        """Handle positions parsed by the OptiTrack reader thread"""
+        # Store latest position of robot 2 (currently active robot) in main window for calibration preview
+        if 2 in robot_positions:
+            pos = robot_positions[2]
+            self.parent_window.latest_optitrack_position = (pos['x'], pos['y'])
         
-        try:
-            data = self.optitrack_socket.recv(4096)
-            if data:
-                # Decode and clean data (remove null bytes)
-                decoded = data.decode('utf-8', errors='ignore')
-                cleaned = decoded.replace('\x00', '').strip()
-                
-                if not cleaned:
-                    return
-                
-                # Parse robot data: id,x,y,z,rotation;
-                robot_positions = {}
-                entries = cleaned.split(';')
-                
-                for entry in entries:
-                    entry = entry.strip()
-                    if not entry:
-                        continue
-                    
-                    parts = entry.split(',')
-                    if len(parts) >= 5:
-                        try:
-                            robot_id = int(parts[0].strip())
-                            x = float(parts[1].strip())
-                            y = -float(parts[2].strip())  # Invert Y sign (server sends inverted Y)
-                            z = float(parts[3].strip())
-                            rotation = float(parts[4].strip())
-                            
-                            # Skip if any value is NaN
-                            if any(v != v for v in [x, y, z, rotation]):
-                                continue
-                            
-                            robot_positions[robot_id] = {
-                                'x': x, 'y': y, 'z': z, 'rotation': rotation
-                            }
-                            
-                            # Store latest position of robot 2 (currently active robot) in main window for calibration preview
-                            if robot_id == 2:
-                                self.parent_window.latest_optitrack_position = (x, y)
-                                
-                        except (ValueError, IndexError):
-                            # Skip invalid data
-                            continue
-                
-                # Update OptiTrack visualization canvas
-                if self.viz_mode == "optitrack":
-                    self.optitrack_canvas.set_robot_positions(robot_positions)
-                
-        except socket.error:
-            pass  # No data available
-        except Exception as e:
-            self.log(f"[OPTITRACK] ⚠️ Read error: {str(e)}")
+    
+    def on_optitrack_canvas_positions(self, canvas_positions):
+        """Handle canvas positions transformed by the OptiTrack reader thread"""
+        # Update OptiTrack visualization canvas
+        if self.viz_mode == "optitrack":
+            self.optitrack_canvas.set_canvas_positions(canvas_positions)
+    
+    def update_reader_canvas_transform(self):
+        """Hand the canvas's current OptiTrack → canvas mapping to the reader thread"""
+        if self.optitrack_reader:
+            self.optitrack_reader.set_canvas_transform(
+                self.optitrack_canvas.transform_coefficients, self.optitrack_canvas.CANVAS_SIZE)
     
     def stop_optitrack_connection(self):
         """Stop OptiTrack connection"""
         self.optitrack_running = False
-        if hasattr(self, 'optitrack_timer'):
-            self.optitrack_timer.stop()
+        if self.optitrack_reader:
+            self.optitrack_reader.stop()
+            self.optitrack_reader = None
         if self.optitrack_socket:
             try:
                 self.optitrack_socket.close()
@@ -4348,12 +4578,79 @@ class ExecutionDialog(QDialog):
         # Stop OptiTrack visualization
         self.optitrack_canvas.stop_visualization()
         
+        self.boot_timer.stop()
         self.update_timer.stop()
         event.accept()
 
+class CameraReader(QThread):
+    """Background reader for a cv2.VideoCapture
+    
+    Blocks on read() off the GUI thread and keeps only the newest frame, so
+    the GUI always renders the latest image and stale frames are dropped.
+    frame_ready is emitted when a frame lands in an empty slot, so at most
+    one notification is queued for the GUI at a time. pause() stops grabbing
+    (the capture stays open) until resume() is called.
+    """
+    frame_ready = pyqtSignal()
+    read_failed = pyqtSignal(str)
+    
+    def __init__(self, camera_capture, parent=None):
+        super().__init__(parent)
+        self.camera_capture = camera_capture
+        self.latest_frame = None
+        self.frame_lock = threading.Lock()
+        self.running = False
+        self.reading = threading.Event()  # Cleared while paused
+        self.reading.set()
+    
+    def run(self):
+        """Read frames until stopped"""
+        self.running = True
+        failing = False
+        while self.running:
+            if not self.reading.wait(0.1):
+                continue  # Paused: wake periodically so stop() is still noticed
+            ret, frame = self.camera_capture.read()
+            if not ret or frame is None:
+                if not failing:
+                    self.read_failed.emit("Failed to read frame")
+                    failing = True
+                self.msleep(30)  # Don't spin on a camera that stopped delivering
+                continue
+            
+            failing = False
+            with self.frame_lock:
+                slot_was_empty = self.latest_frame is None
+                self.latest_frame = frame
+            if slot_was_empty:
+                self.frame_ready.emit()
+    
+    def take_latest_frame(self):
+        """Return the newest frame not yet taken, or None"""
+        with self.frame_lock:
+            frame, self.latest_frame = self.latest_frame, None
+        return frame
+    
+    def pause(self):
+        """Stop grabbing frames until resume() is called"""
+        self.reading.clear()
+    
+    def resume(self):
+        """Continue grabbing frames after pause()"""
+        self.reading.set()
+    
+    def stop(self):
+        """Stop the read loop and wait for the thread to finish"""
+        self.running = False
+        self.wait()
+
+
 class ExecutionCanvas(QGraphicsView):
     """Canvas for showing camera feed with solution overlay"""
     
+    # Qt 5.14+ reads OpenCV's BGR frames directly; older Qt needs an RGB conversion pass
+    BGR_IMAGE_FORMAT = getattr(QImage, 'Format_BGR888', None)
+    
     def __init__(self, parent_dialog, level_data, solution):
         super().__init__(parent_dialog)
         self.parent_dialog = parent_dialog
@@ -4362,22 +4659,45 @@ class ExecutionCanvas(QGraphicsView):
         self.scene = QGraphicsScene()
         self.setScene(self.scene)
         
+        # Solution paths as (N, 2) arrays, transformed to camera frame space in one operation
+        self.path_arrays = {color_name: np.asarray(path, dtype=np.float32)
+                            for color_name, path in solution.items() if len(path) >= 2}
+        
         self.setRenderHint(QPainter.Antialiasing)
         self.setStyleSheet("background-color: #1e1e1e; border: 2px solid #333333;")
         self.setMinimumSize(700, 700)  # Match OptiTrack canvas size (square)
         
+        # Optionally let the GPU composite the camera frame and overlay
+        if parent_dialog.parent_window.camera_gpu_rendering:
+            self.use_opengl_viewport()
+        
         # Camera feed state
         self.camera_active = False
         self.camera_capture = None
+        self.camera_reader = None  # Reads camera_capture on a background thread
         self.camera_id = 0  # Default camera
-        self.camera_timer = QTimer(self)
-        self.camera_timer.timeout.connect(self.update_camera_feed)
-        
-        # Overlay items
-        self.overlay_items = []
-        
-        # Camera frame item
-        self.camera_frame_item = None
+        self.feed_running = False  # Render frames as the reader delivers them (off while hidden)
+        self.overlay_dirty = False  # Overlay needs redrawing on the next frame (e.g. opacity changed)
+        self.rgb_buffer = None  # RGB conversion target (old Qt only), reallocated only if the frame size changes
+        self.current_frame = None  # Frame currently wrapped by the QImage
+        self.resized_buffer = None  # Display-size frame buffer for cv2.resize
+        self.area_buffer = None  # Integer-factor INTER_AREA stage (None when not downscaling 2x+)
+        self.resize_source_size = None  # Camera frame size the buffer was sized for
+        self.smooth_scaling = True  # False: one nearest-neighbor resize (cheaper, blockier)
+        
+        # Persistent feed items, created on the first frame and updated in place afterwards
+        self.camera_frame_item = None  # Camera frame pixmap
+        self.overlay_path_items = {}   # color -> overlay QGraphicsPathItem
+        self.ref_dot_items = {}        # color -> {'start', 'end', 'S_text', 'E_text'}
+        
+        # Scene layers, bottom to top: camera frame, solution overlay, reference dots
+        self.bg_group = None
+        self.overlay_group = None
+        self.dots_group = None
+        
+        # Overlay pens per color, rebuilt only when the overlay opacity changes
+        self.overlay_pens = {}
+        self.build_overlay_pens(parent_dialog.overlay_opacity)
         
         # Scaling factors for coordinate transformation (level coords -> camera frame coords)
         self.scale_x = 1.0
@@ -4388,9 +4708,37 @@ class ExecutionCanvas(QGraphicsView):
         # Draw initial placeholder
         self.draw_placeholder()
     
+    def use_opengl_viewport(self):
+        """Render the view through a QOpenGLWidget instead of the software rasterizer
+        
+        Each new camera pixmap is uploaded as a texture once and the overlay paths
+        are drawn by the GPU, so the per-frame compositing leaves the CPU.
+        """
+        self.setViewport(QOpenGLWidget())
+        # GL viewports repaint whole frames; partial updates would just add bookkeeping
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+    
+    def clear_scene(self):
+        """Clear the scene and forget the persistent feed items it owned"""
+        self.scene.clear()
+        self.camera_frame_item = None
+        self.overlay_path_items = {}
+        self.ref_dot_items = {}
+        self.bg_group = self.overlay_group = self.dots_group = None
+    
+    def create_layers(self):
+        """Add one item group per feed layer, stacked camera frame < overlay < dots"""
+        self.bg_group = QGraphicsItemGroup()
+        self.overlay_group = QGraphicsItemGroup()
+        self.dots_group = QGraphicsItemGroup()
+        for z, group in enumerate((self.bg_group, self.overlay_group, self.dots_group)):
+            group.setZValue(z)
+            self.scene.addItem(group)
+        self.overlay_group.setVisible(self.parent_dialog.overlay_opacity > 0)
+    
     def draw_placeholder(self):
         """Draw placeholder before camera starts"""
-        self.scene.clear()
+        self.clear_scene()
         
         # Add to scene
         text = self.scene.addText("📷 Waiting for camera feed...\n\nClick 'Start' to begin execution")
@@ -4409,15 +4757,15 @@ class ExecutionCanvas(QGraphicsView):
     
     def set_camera(self, camera_id):
         """Set/change the camera device"""
-        # Stop timer first
-        self.camera_timer.stop()
+        # Stop rendering first
+        self.feed_running = False
         
         # Release old camera if exists
         if self.camera_capture is not None:
+            self.stop_camera_reader()
             self.camera_capture.release()
             self.camera_capture = None
             # Wait for camera to be fully released
-            import time
             time.sleep(0.2)
         
         # Open new camera
@@ -4427,21 +4775,45 @@ class ExecutionCanvas(QGraphicsView):
             self.camera_capture = cv2.VideoCapture(camera_id, cv2.CAP_DSHOW)
             
             if self.camera_capture.isOpened():
+                # Ask for MJPG before the resolution: compressed frames need far less USB
+                # bandwidth than the default format (often YUY2), so 720p keeps its full frame rate
+                mjpg = cv2.VideoWriter_fourcc(*'MJPG')
+                self.camera_capture.set(cv2.CAP_PROP_FOURCC, mjpg)
+                
                 # Set camera resolution (optional, adjust as needed)
                 self.camera_capture.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
                 self.camera_capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-                # Set buffer size to 1 to reduce lag
-                self.camera_capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
                 
                 self.parent_dialog.log(f"[CAMERA] Camera {camera_id} opened successfully")
+                if int(self.camera_capture.get(cv2.CAP_PROP_FOURCC)) != mjpg:
+                    # Camera refused MJPG and keeps its default format
+                    self.parent_dialog.log("[CAMERA] MJPG not supported, using the camera's default format")
+                self.start_camera_reader()
                 
-                # If already streaming, restart
-                if self.camera_active:
-                    self.camera_timer.start(30)  # ~30 FPS
+                # If already streaming, restart (only while the camera view is shown)
+                if self.camera_active and not self.isHidden():
+                    self.feed_running = True
+                    self.update_camera_feed()  # Render a frame already waiting in the reader's slot
             else:
                 self.parent_dialog.log(f"[CAMERA] ⚠️ Failed to open Camera {camera_id}")
                 self.camera_capture = None
     
+    def start_camera_reader(self):
+        """Start reading the open camera on a background thread"""
+        self.camera_reader = CameraReader(self.camera_capture, self)
+        self.camera_reader.frame_ready.connect(self.update_camera_feed)
+        self.camera_reader.read_failed.connect(
+            lambda message: self.parent_dialog.log(f"[CAMERA] ⚠️ {message}"))
+        if self.isHidden():
+            self.camera_reader.pause()  # Nothing to render until the camera view is shown
+        self.camera_reader.start()
+    
+    def stop_camera_reader(self):
+        """Stop the background reader (must happen before the capture is released)"""
+        if self.camera_reader is not None:
+            self.camera_reader.stop()
+            self.camera_reader = None
+    
     def start_camera_stream(self):
         """Start streaming camera feed"""
         self.camera_active = True
@@ -4454,17 +4826,36 @@ class ExecutionCanvas(QGraphicsView):
                 camera_id = 0  # Default to first camera
             self.set_camera(camera_id)
         
-        # Start camera update timer (30ms = ~33 FPS)
+        # Render frames as they arrive, deferred until the camera view is shown
         if self.camera_capture is not None and self.camera_capture.isOpened():
-            self.camera_timer.start(30)
+            if not self.isHidden():
+                self.feed_running = True
+                # A frame the reader stored while the feed was off suppresses frame_ready, so render it now
+                self.update_camera_feed()
             self.parent_dialog.log("[CAMERA] Camera stream active")
         else:
             self.parent_dialog.log("[CAMERA] ⚠️ No camera available!")
             self.draw_error_message()
     
+    def pause_camera_stream(self):
+        """Stop reading and rendering frames while the camera view is hidden (camera stays open)"""
+        self.feed_running = False
+        if self.camera_reader is not None:
+            self.camera_reader.pause()
+    
+    def resume_camera_stream(self):
+        """Resume reading and rendering frames if the stream was started"""
+        if self.camera_reader is None:
+            return
+        self.camera_reader.resume()
+        if self.camera_active:
+            self.feed_running = True
+            # A frame left in the reader's slot suppresses frame_ready, so render it now
+            self.update_camera_feed()
+    
     def draw_error_message(self):
         """Draw error message when camera is not available"""
-        self.scene.clear()
+        self.clear_scene()
         
         text = self.scene.addText("❌ Camera not available\n\nPlease check camera connection")
         text.setDefaultTextColor(QColor(255, 100, 100))
@@ -4479,80 +4870,129 @@ class ExecutionCanvas(QGraphicsView):
         
         self.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
     
+    def allocate_resize_buffers(self, frame_width, frame_height):
+        """Size the display buffers for a camera frame size (fit to boundary, keep aspect ratio)"""
+        boundary = self.level_data['boundary']
+        scale = min(boundary['width'] / frame_width, boundary['height'] / frame_height)
+        self.resized_buffer = np.empty((max(1, int(frame_height * scale)),
+                                        max(1, int(frame_width * scale)), 3), dtype=np.uint8)
+        
+        factor = int(1 / scale)
+        if self.smooth_scaling and factor >= 2:
+            self.area_buffer = np.empty((frame_height // factor, frame_width // factor, 3), dtype=np.uint8)
+        else:
+            self.area_buffer = None
+        self.resize_source_size = (frame_width, frame_height)
+    
+    def set_smooth_scaling(self, smooth):
+        """Choose smooth (area + bilinear) or fast (nearest neighbor) downscaling"""
+        self.smooth_scaling = smooth
+        self.resize_source_size = None  # Resize buffers are reallocated for the new mode
+    
     def update_camera_feed(self):
-        """Update camera feed frame - captures and displays real camera frame"""
-        if self.camera_capture is None or not self.camera_capture.isOpened():
-            self.camera_timer.stop()
+        """Update camera feed frame - displays the latest frame from the camera reader"""
+        if not self.feed_running or self.camera_reader is None:
             return
         
         try:
-            # Capture frame from camera
-            ret, frame = self.camera_capture.read()
-            
-            if not ret or frame is None:
-                self.parent_dialog.log("[CAMERA] ⚠️ Failed to read frame")
+            # Take the newest frame captured by the reader thread (None if nothing new)
+            frame = self.camera_reader.take_latest_frame()
+            if frame is None:
                 return
             
-            # Convert BGR (OpenCV) to RGB (Qt)
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Scale the frame to fit the boundary while maintaining aspect ratio (sizes cached per source size)
+            frame_height, frame_width = frame.shape[:2]
+            if self.resized_buffer is None or self.resize_source_size != (frame_width, frame_height):
+                self.allocate_resize_buffers(frame_width, frame_height)
+            
+            # INTER_AREA is only fast for integer factors, so box-filter down by the integer part
+            # first and finish the remaining (< 2x) step with INTER_LINEAR (smooth scaling only)
+            if self.area_buffer is not None:
+                area_height, area_width = self.area_buffer.shape[:2]
+                frame = cv2.resize(frame, (area_width, area_height), dst=self.area_buffer,
+                                   interpolation=cv2.INTER_AREA)
+            if frame.shape != self.resized_buffer.shape:
+                resized_height, resized_width = self.resized_buffer.shape[:2]
+                interpolation = cv2.INTER_LINEAR if self.smooth_scaling else cv2.INTER_NEAREST
+                frame = cv2.resize(frame, (resized_width, resized_height), dst=self.resized_buffer,
+                                   interpolation=interpolation)
+            
+            if self.BGR_IMAGE_FORMAT is not None:
+                # Hand OpenCV's BGR frame to Qt as-is
+                frame_data, image_format = frame, self.BGR_IMAGE_FORMAT
+            else:
+                # Convert BGR (OpenCV) to RGB (Qt) into a buffer reused across frames
+                if self.rgb_buffer is None or self.rgb_buffer.shape != frame.shape:
+                    self.rgb_buffer = np.empty_like(frame)
+                frame_data = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.rgb_buffer)
+                image_format = QImage.Format_RGB888
+            self.current_frame = frame_data  # Keeps the pixels alive while the QImage uses them
             
             # Get frame dimensions
-            h, w, ch = frame_rgb.shape
+            h, w, ch = frame_data.shape
             bytes_per_line = ch * w
             
-            # Convert to QImage - make a copy to prevent data corruption
-            q_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888).copy()
-            
-            # Convert to QPixmap
-            pixmap = QPixmap.fromImage(q_image)
+            # Convert to QImage - no copy needed, self.current_frame outlives it
+            q_image = QImage(frame_data.data, w, h, bytes_per_line, image_format)
             
-            # Scale pixmap to fit the boundary while maintaining aspect ratio
+            # Convert to QPixmap (already at display size)
+            scaled_pixmap = QPixmap.fromImage(q_image)
             boundary = self.level_data['boundary']
-            scaled_pixmap = pixmap.scaled(boundary['width'], boundary['height'], 
-                                          Qt.KeepAspectRatio, Qt.SmoothTransformation)
             
             # Get actual scaled pixmap dimensions (may be smaller than boundary due to aspect ratio)
             actual_width = scaled_pixmap.width()
             actual_height = scaled_pixmap.height()
             
             # Calculate scaling factors to transform level coordinates to camera frame coordinates
-            self.scale_x = actual_width / boundary['width']
-            self.scale_y = actual_height / boundary['height']
+            scale_x = actual_width / boundary['width']
+            scale_y = actual_height / boundary['height']
             
             # Calculate offsets to center the camera frame (if aspect ratios differ)
-            self.offset_x = (boundary['width'] - actual_width) / 2.0
-            self.offset_y = (boundary['height'] - actual_height) / 2.0
-            
-            # Clear scene and add camera frame
-            self.scene.clear()
-            self.overlay_items.clear()  # Clear overlay items when scene is cleared
-            
-            # Add camera frame as background, centered if needed
-            self.camera_frame_item = self.scene.addPixmap(scaled_pixmap)
-            self.camera_frame_item.setPos(self.offset_x, self.offset_y)
-            
-            # Draw solution overlay on top of camera feed
-            self.draw_solution_overlay()
+            offset_x = (boundary['width'] - actual_width) / 2.0
+            offset_y = (boundary['height'] - actual_height) / 2.0
+            
+            if self.camera_frame_item is None:
+                # First frame: replace the placeholder with the persistent feed items
+                self.clear_scene()
+                self.create_layers()
+                self.camera_frame_item = self.scene.addPixmap(scaled_pixmap)
+                self.bg_group.addToGroup(self.camera_frame_item)
+                geometry_changed = True
+            else:
+                self.camera_frame_item.setPixmap(scaled_pixmap)
+                geometry_changed = (scale_x, scale_y, offset_x, offset_y) != \
+                    (self.scale_x, self.scale_y, self.offset_x, self.offset_y)
+            
+            # Overlay and dots only move when the frame geometry changes
+            if geometry_changed:
+                self.scale_x, self.scale_y = scale_x, scale_y
+                self.offset_x, self.offset_y = offset_x, offset_y
+                
+                # Camera frame as background, centered if needed
+                self.camera_frame_item.setPos(self.offset_x, self.offset_y)
+                
+                # Draw dots on top for reference
+                self.draw_reference_dots()
             
-            # Draw dots on top for reference
-            self.draw_reference_dots()
+            if geometry_changed or self.overlay_dirty:
+                # Draw solution overlay on top of camera feed
+                self.draw_solution_overlay()
+                self.overlay_dirty = False
             
             # Fit view (don't do this every frame - causes lag)
             # self.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
             
         except Exception as e:
             self.parent_dialog.log(f"[CAMERA] ⚠️ Error updating feed: {str(e)}")
-            self.camera_timer.stop()
+            self.feed_running = False
     
     def draw_reference_dots(self):
-        """Draw reference dots on top of camera feed"""
+        """Draw reference dots on top of camera feed (items are created once, then moved)"""
         dot_radius = 15
         for color_name, positions in self.level_data['dots'].items():
             # Skip if positions are None (robot not active in this level)
             if positions['start'] is None or positions['end'] is None:
                 continue
-                
-            color = self.parent_dialog.parent_window.colors[color_name]
             
             # Transform coordinates from level space to camera frame space
             start_x = positions['start'][0] * self.scale_x + self.offset_x
@@ -4560,72 +5000,86 @@ class ExecutionCanvas(QGraphicsView):
             end_x = positions['end'][0] * self.scale_x + self.offset_x
             end_y = positions['end'][1] * self.scale_y + self.offset_y
             
-            # Start dot (semi-transparent)
-            pen = QPen(color, 3)
-            brush = QColor(color.red(), color.green(), color.blue(), 100)
-            self.scene.addEllipse(start_x - dot_radius, start_y - dot_radius,
-                                 dot_radius * 2, dot_radius * 2, pen, brush)
-            
-            # Label
-            text = self.scene.addText("S")
-            text.setPos(start_x - 5, start_y - 12)
-            text.setDefaultTextColor(QColor(255, 255, 255))
-            font = text.font()
-            font.setBold(True)
-            text.setFont(font)
-            
-            # End dot (semi-transparent)
-            self.scene.addEllipse(end_x - dot_radius, end_y - dot_radius,
-                                 dot_radius * 2, dot_radius * 2, pen, brush)
-            
-            # Label
-            text = self.scene.addText("E")
-            text.setPos(end_x - 5, end_y - 12)
-            text.setDefaultTextColor(QColor(255, 255, 255))
-            font = text.font()
-            font.setBold(True)
-            text.setFont(font)
+            items = self.ref_dot_items.get(color_name)
+            if items is None:
+                color = self.parent_dialog.parent_window.colors[color_name]
+                
+                # Start/end dots (semi-transparent)
+                pen = QPen(color, 3)
+                brush = QColor(color.red(), color.green(), color.blue(), 100)
+                items = {
+                    'start': self.scene.addEllipse(0, 0, 0, 0, pen, brush),
+                    'end': self.scene.addEllipse(0, 0, 0, 0, pen, brush),
+                }
+                
+                # Labels
+                for key, label in (('S_text', "S"), ('E_text', "E")):
+                    text = self.scene.addSimpleText(label)
+                    text.setBrush(QColor(255, 255, 255))
+                    font = text.font()
+                    font.setBold(True)
+                    text.setFont(font)
+                    items[key] = text
+                
+                for item in items.values():
+                    self.dots_group.addToGroup(item)
+                self.ref_dot_items[color_name] = items
+            
+            items['start'].setRect(start_x - dot_radius, start_y - dot_radius,
+                                   dot_radius * 2, dot_radius * 2)
+            items['S_text'].setPos(start_x - 1, start_y - 8)
+            items['end'].setRect(end_x - dot_radius, end_y - dot_radius,
+                                 dot_radius * 2, dot_radius * 2)
+            items['E_text'].setPos(end_x - 1, end_y - 8)
 
     def draw_solution_overlay(self):
-        """Draw solution paths as overlay"""
-        # Remove old overlay safely
-        for item in self.overlay_items:
-            if item.scene() == self.scene:  # Only remove if item belongs to this scene
-                self.scene.removeItem(item)
-        self.overlay_items.clear()
+        """Draw solution paths as overlay (one path item per color, reused between calls)"""
+        scale = np.array([self.scale_x, self.scale_y], dtype=np.float32)
+        offset = np.array([self.offset_x, self.offset_y], dtype=np.float32)
         
         # Draw solution paths with current opacity
-        for color_name, path in self.solution.items():
-            if len(path) < 2:
-                continue
-            
-            color = self.parent_dialog.parent_window.colors[color_name]
-            
-            # Apply opacity
-            overlay_color = QColor(color.red(), color.green(), color.blue(), 
-                                  self.parent_dialog.overlay_opacity)
-            pen = QPen(overlay_color, 6, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-            
-            for i in range(len(path) - 1):
-                # Transform coordinates from level space to camera frame space
-                x1 = path[i][0] * self.scale_x + self.offset_x
-                y1 = path[i][1] * self.scale_y + self.offset_y
-                x2 = path[i + 1][0] * self.scale_x + self.offset_x
-                y2 = path[i + 1][1] * self.scale_y + self.offset_y
-                
-                line = self.scene.addLine(x1, y1, x2, y2, pen)
-                self.overlay_items.append(line)
+        for color_name, points in self.path_arrays.items():
+            pen = self.overlay_pens[color_name]
+            
+            # Transform all vertices from level space to camera frame space at once
+            canvas_points = (points * scale + offset).tolist()
+            overlay_path = QPainterPath(QPointF(*canvas_points[0]))
+            for x, y in canvas_points[1:]:
+                overlay_path.lineTo(x, y)
+            
+            path_item = self.overlay_path_items.get(color_name)
+            if path_item is None:
+                path_item = self.scene.addPath(overlay_path, pen)
+                self.overlay_group.addToGroup(path_item)
+                self.overlay_path_items[color_name] = path_item
+            else:
+                path_item.setPath(overlay_path)
+                path_item.setPen(pen)
+    
+    def build_overlay_pens(self, opacity):
+        """Build the overlay pen for each solution color at the given opacity"""
+        colors = self.parent_dialog.parent_window.colors
+        for color_name in self.path_arrays:
+            color = colors[color_name]
+            overlay_color = QColor(color.red(), color.green(), color.blue(), opacity)
+            self.overlay_pens[color_name] = QPen(overlay_color, 6, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
     
     def update_overlay_opacity(self, opacity):
-        """Update overlay opacity"""
-        self.draw_solution_overlay()
+        """Update overlay opacity (applied with the next camera frame)"""
+        self.build_overlay_pens(opacity)
+        self.overlay_dirty = True
+        
+        # A fully transparent overlay is hidden as a whole layer instead of painted
+        if self.overlay_group is not None:
+            self.overlay_group.setVisible(opacity > 0)
     
     def stop_camera_stream(self):
         """Stop camera stream and release camera"""
         self.camera_active = False
-        self.camera_timer.stop()
+        self.feed_running = False
         
         if self.camera_capture is not None:
+            self.stop_camera_reader()
             self.camera_capture.release()
             self.camera_capture = None
             self.parent_dialog.log("[CAMERA] Camera released")
@@ -4640,6 +5094,9 @@ class ExecutionCanvas(QGraphicsView):
 class OptiTrackCalibrationPreview(QWidget):
     """Live preview canvas for OptiTrack calibration dialog with coordinate axes and log display"""
     
+    # Text labels are refreshed at most this often (seconds); the robot dot follows every packet
+    LABEL_UPDATE_INTERVAL = 0.1
+    
     def __init__(self, parent_dialog, main_window):
         super().__init__(parent_dialog)
         self.parent_dialog = parent_dialog
@@ -4712,19 +5169,34 @@ class OptiTrackCalibrationPreview(QWidget):
         self.frame_rect = None
         self.current_frame_corners = None
         self.axes_items = []  # Store axes graphics items
+        self.axes_bounds = None  # Bounds the current axes_items were drawn for
+        
+        # Axis pens and label font, built once and reused by every draw_axes call
+        self.grid_pen = QPen(QColor(100, 100, 100), 1)
+        self.zero_line_pen = QPen(QColor(255, 255, 255), 1)
+        self.center_axis_pen = QPen(QColor(0, 255, 0), 2)
+        self.label_font = QFont("Arial", 8, QFont.Bold)
+        self.label_color = QColor(255, 255, 255)
+        self.label_pixmaps = {}  # label text -> pre-rendered QPixmap, reused across redraws
         
         # Debug counters
         self.data_receive_count = 0
         self.last_update_time = time.time()
+        self.label_update_times = {}  # label -> when its text was last rewritten
+        
+        # OptiTrack → canvas coefficients, recomputed only when the bounds change
+        self.update_transform_coefficients()
+        main_window.optitrack_bounds_changed.connect(self.update_transform_coefficients)
         
-        # Timer for real-time robot position updates
+        # Timer for the connection status display (the robot dot moves as packets arrive)
         self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_robot_position)
-        self.update_timer.start(50)  # Update every 50ms
+        self.update_timer.timeout.connect(self.update_connection_status)
+        self.update_timer.start(500)  # Update every 500ms
         
         # OptiTrack connection for real-time preview
         self.optitrack_socket = None
-        self.optitrack_timer = None
+        self.optitrack_notifier = None
+        self.optitrack_stream = OptiTrackStream()  # Buffers partial entries between reads
         self.start_optitrack_connection()
         
         self.draw_initial_view()
@@ -4743,156 +5215,186 @@ class OptiTrackCalibrationPreview(QWidget):
             QBrush(QColor(255, 0, 0))  # Red
         )
         
+        # Start from the last known position until new OptiTrack data arrives
+        opti_x, opti_y = self.main_window.latest_optitrack_position
+        data = getattr(self.main_window, 'latest_optitrack_full', {})
+        self.update_robot_dot(opti_x, opti_y, data.get('z', 0.0), data.get('rotation', 0.0))
+        
         # Draw coordinate axes
         self.draw_axes()
         
         # Fit view
         self.graphics_view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
     
+    def label_pixmap(self, text):
+        """Axis label rendered once into a transparent pixmap, cached by its text
+        
+        Laid out like a QGraphicsTextItem at the same position (4px document margin).
+        """
+        pixmap = self.label_pixmaps.get(text)
+        if pixmap is None:
+            metrics = QFontMetricsF(self.label_font)
+            pixmap = QPixmap(int(metrics.horizontalAdvance(text)) + 9, int(metrics.height()) + 9)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.TextAntialiasing)
+            painter.setFont(self.label_font)
+            painter.setPen(self.label_color)
+            painter.drawText(QPointF(4, 4 + metrics.ascent()), text)
+            painter.end()
+            self.label_pixmaps[text] = pixmap
+        return pixmap
+    
     def draw_axes(self):
-        """Draw coordinate axes with labels (OptiTrack coordinate system)"""
-        # Clear previous axes
-        for item in self.axes_items:
-            self.scene.removeItem(item)
-        self.axes_items.clear()
+        """Draw coordinate axes with labels (OptiTrack coordinate system)
         
+        The grid only depends on the background bounds, so it is kept on the scene
+        and rebuilt only when the bounds in the main window settings change.
+        """
         # Get bounds from main window settings
         BACKGROUND_MIN_X = self.main_window.optitrack_bounds_min_x
         BACKGROUND_MAX_X = self.main_window.optitrack_bounds_max_x
         BACKGROUND_MIN_Y = self.main_window.optitrack_bounds_min_y
         BACKGROUND_MAX_Y = self.main_window.optitrack_bounds_max_y
         
+        bounds = (BACKGROUND_MIN_X, BACKGROUND_MAX_X, BACKGROUND_MIN_Y, BACKGROUND_MAX_Y)
+        if bounds == self.axes_bounds and self.axes_items:
+            return
+        
+        # Clear previous axes
+        for item in self.axes_items:
+            self.scene.removeItem(item)
+        self.axes_items.clear()
+        self.axes_bounds = bounds
+        
+        # Lines are collected into one path per pen and labels into one group,
+        # so the whole grid is added to the scene with a handful of items
+        grid_path = QPainterPath()
+        zero_path = QPainterPath()
+        labels = QGraphicsItemGroup()
+        
+        def add_label(text, x, y):
+            label = QGraphicsPixmapItem(self.label_pixmap(text))
+            label.setPos(x, y)
+            labels.addToGroup(label)
+        
         # Draw Y-axis grid (VERTICAL lines, since Y is horizontal)
         # Y range: -0.4 to 1.4 (1.8m range)
         y_range = abs(BACKGROUND_MAX_Y - BACKGROUND_MIN_Y)
         y_step = 0.2 if y_range <= 2 else 0.5
-        y_values = [BACKGROUND_MIN_Y + i * y_step for i in range(int(y_range / y_step) + 1)]
+        y_values = BACKGROUND_MIN_Y + np.arange(int(y_range / y_step) + 1) * y_step
         
-        for y in y_values:
-            # Y maps to canvas X (horizontal position)
-            norm_y = (y - BACKGROUND_MIN_Y) / (BACKGROUND_MAX_Y - BACKGROUND_MIN_Y)
-            canvas_x = (1 - norm_y) * 600  # Y: 1.4 (left=0) → -0.4 (right=600)
-            
+        # Y maps to canvas X (horizontal position), computed for all grid lines at once
+        # with the cached linear coefficients (one multiply-add per value)
+        scale_y, offset_y, scale_x, offset_x = self.transform_coefficients
+        canvas_x_values = scale_y * y_values + offset_y  # Y: 1.4 (left=0) → -0.4 (right=600)
+        
+        for y, canvas_x in zip(y_values.tolist(), canvas_x_values.tolist()):
             # Draw vertical line (all values in gray/white)
-            if abs(y) < 0.01:  # Y=0 - white line
-                pen = QPen(QColor(255, 255, 255), 1)
-            else:
-                pen = QPen(QColor(100, 100, 100), 1)  # Gray grid
-            
-            line = self.scene.addLine(canvas_x, 0, canvas_x, 600, pen)
-            self.axes_items.append(line)
+            path = zero_path if abs(y) < 0.01 else grid_path  # Y=0 - white line, else gray grid
+            path.moveTo(canvas_x, 0)
+            path.lineTo(canvas_x, 600)
             
             # Add label on horizontal center line (y=300) - just the number
-            text = self.scene.addText(f"{y:.1f}", QFont("Arial", 8, QFont.Bold))
-            text.setDefaultTextColor(QColor(255, 255, 255))
-            text.setPos(canvas_x - 15, 295)  # On horizontal center line
-            self.axes_items.append(text)
+            add_label(f"{y:.1f}", canvas_x - 15, 295)  # On horizontal center line
         
         # Draw X-axis grid (HORIZONTAL lines, since X is vertical)
         # X range: -2.8 to -1.0 (1.8m range)
         x_range = abs(BACKGROUND_MAX_X - BACKGROUND_MIN_X)
         x_step = 0.2 if x_range <= 2 else 0.5
-        x_values = [BACKGROUND_MIN_X + i * x_step for i in range(int(x_range / x_step) + 1)]
+        x_values = BACKGROUND_MIN_X + np.arange(int(x_range / x_step) + 1) * x_step
         
-        for x in x_values:
-            # X maps to canvas Y (vertical position)
-            norm_x = (x - BACKGROUND_MIN_X) / (BACKGROUND_MAX_X - BACKGROUND_MIN_X)
-            canvas_y = norm_x * 600  # REVERSED: X: -2.8 (bottom=600) → -1.0 (top=0)
-            
+        # X maps to canvas Y (vertical position), computed for all grid lines at once
+        canvas_y_values = scale_x * x_values + offset_x  # REVERSED: X: -2.8 (bottom=600) → -1.0 (top=0)
+        
+        for x, canvas_y in zip(x_values.tolist(), canvas_y_values.tolist()):
             # Draw horizontal line (all values in gray, no X=0 in range)
-            pen = QPen(QColor(100, 100, 100), 1)  # Gray grid
-            
-            line = self.scene.addLine(0, canvas_y, 600, canvas_y, pen)
-            self.axes_items.append(line)
+            grid_path.moveTo(0, canvas_y)
+            grid_path.lineTo(600, canvas_y)
             
             # Add label on vertical center line (x=300) - just the number
-            text = self.scene.addText(f"{x:.1f}", QFont("Arial", 8, QFont.Bold))
-            text.setDefaultTextColor(QColor(255, 255, 255))
-            text.setPos(260, canvas_y - 10)  # Left of vertical center line to avoid overlap
-            self.axes_items.append(text)
+            add_label(f"{x:.1f}", 260, canvas_y - 10)  # Left of vertical center line to avoid overlap
         
         # Draw center cross lines (GREEN axes)
         center_x = 300  # Canvas center
         center_y = 300
-        
-        # Vertical center line (green - Y axis)
-        center_v_line = self.scene.addLine(center_x, 0, center_x, 600, QPen(QColor(0, 255, 0), 2))
-        self.axes_items.append(center_v_line)
-        
-        # Horizontal center line (green - X axis)
-        center_h_line = self.scene.addLine(0, center_y, 600, center_y, QPen(QColor(0, 255, 0), 2))
-        self.axes_items.append(center_h_line)
+        center_path = QPainterPath()
+        center_path.moveTo(center_x, 0)  # Vertical center line (green - Y axis)
+        center_path.lineTo(center_x, 600)
+        center_path.moveTo(0, center_y)  # Horizontal center line (green - X axis)
+        center_path.lineTo(600, center_y)
+        
+        self.axes_items.append(self.scene.addPath(grid_path, self.grid_pen))
+        self.axes_items.append(self.scene.addPath(zero_path, self.zero_line_pen))
+        self.scene.addItem(labels)
+        self.axes_items.append(labels)
+        self.axes_items.append(self.scene.addPath(center_path, self.center_axis_pen))
         
         # Note: Axis direction labels removed as real-world X/Y directions don't match screen intuition
         # X increases from bottom to top (opposite of screen), Y increases from right to left
     
-    def update_robot_position(self):
-        """Update robot dot position from OptiTrack real-time data"""
-        try:
-            # Check connection status
-            current_time = time.time()
-            time_since_update = current_time - self.last_update_time
-            
-            # Update connection status display
-            if time_since_update > 2.0:
-                self.connection_label.setText(f"Status: ⚠️ No data ({time_since_update:.1f}s)")
-                self.connection_label.setStyleSheet("""
-                    color: #ff0000;
-                    font-family: 'Courier New', monospace;
-                    font-size: 11px;
-                    padding: 3px;
-                """)
-            elif time_since_update > 0.5:
-                self.connection_label.setText(f"Status: ⏸️ Slow ({time_since_update:.1f}s)")
-                self.connection_label.setStyleSheet("""
-                    color: #ffa500;
-                    font-family: 'Courier New', monospace;
-                    font-size: 11px;
-                    padding: 3px;
-                """)
-            else:
-                self.connection_label.setText(f"Status: ✓ Connected ({self.data_receive_count} packets)")
-                self.connection_label.setStyleSheet("""
-                    color: #00ff00;
-                    font-family: 'Courier New', monospace;
-                    font-size: 11px;
-                    padding: 3px;
-                """)
-            
-            # Get latest OptiTrack position from main window
-            if hasattr(self.main_window, 'latest_optitrack_position'):
-                opti_x, opti_y = self.main_window.latest_optitrack_position
-                
-                # Also get Z and rotation if available
-                opti_z = 0.0
-                opti_rotation = 0.0
-                if hasattr(self.main_window, 'latest_optitrack_full'):
-                    data = self.main_window.latest_optitrack_full
-                    opti_z = data.get('z', 0.0)
-                    opti_rotation = data.get('rotation', 0.0)
-                
-                # Update position label
-                self.position_label.setText(
-                    f"X = {opti_x:+.3f} m\n"
-                    f"Y = {opti_y:+.3f} m\n"
-                    f"Z = {opti_z:+.3f} m\n"
-                    f"Rotation = {opti_rotation:.1f}°"
-                )
-                
-                # Transform using fixed background bounds
-                canvas_x, canvas_y = self._preview_transform(opti_x, opti_y)
-                
-                # Update robot dot position - use setRect instead of setPos for QGraphicsEllipseItem
-                robot_radius = 12
-                self.robot_dot.setRect(
-                    canvas_x - robot_radius, 
-                    canvas_y - robot_radius,
-                    robot_radius * 2, 
-                    robot_radius * 2
-                )
-        except Exception as e:
-            # Silent - already debugged
-            pass
+    def update_connection_status(self):
+        """Update the connection status display from the time since the last packet"""
+        # Check connection status
+        current_time = time.time()
+        time_since_update = current_time - self.last_update_time
+        
+        # Update connection status display
+        if time_since_update > 2.0:
+            self.connection_label.setText(f"Status: ⚠️ No data ({time_since_update:.1f}s)")
+            self.connection_label.setStyleSheet("""
+                color: #ff0000;
+                font-family: 'Courier New', monospace;
+                font-size: 11px;
+                padding: 3px;
+            """)
+        elif time_since_update > 0.5:
+            self.connection_label.setText(f"Status: ⏸️ Slow ({time_since_update:.1f}s)")
+            self.connection_label.setStyleSheet("""
+                color: #ffa500;
+                font-family: 'Courier New', monospace;
+                font-size: 11px;
+                padding: 3px;
+            """)
+        else:
+            self.connection_label.setText(f"Status: ✓ Connected ({self.data_receive_count} packets)")
+            self.connection_label.setStyleSheet("""
+                color: #00ff00;
+                font-family: 'Courier New', monospace;
+                font-size: 11px;
+                padding: 3px;
+            """)
+    
+    def label_due(self, label):
+        """True when label's text may be rewritten again (at most ~10 Hz per label)"""
+        now = time.time()
+        if now - self.label_update_times.get(label, 0.0) < self.LABEL_UPDATE_INTERVAL:
+            return False
+        self.label_update_times[label] = now
+        return True
+    
+    def update_robot_dot(self, opti_x, opti_y, opti_z=0.0, opti_rotation=0.0):
+        """Move the robot dot and position readout to an OptiTrack position"""
+        # Update position label (throttled - rewriting it per packet costs a relayout each time)
+        if self.label_due(self.position_label):
+            self.position_label.setText(
+                f"X = {opti_x:+.3f} m\n"
+                f"Y = {opti_y:+.3f} m\n"
+                f"Z = {opti_z:+.3f} m\n"
+                f"Rotation = {opti_rotation:.1f}°"
+            )
+        
+        # Transform using fixed background bounds
+        canvas_x, canvas_y = self._preview_transform(opti_x, opti_y)
+        
+        # Update robot dot position - use setRect instead of setPos for QGraphicsEllipseItem
+        robot_radius = 12
+        self.robot_dot.setRect(
+            canvas_x - robot_radius, 
+            canvas_y - robot_radius,
+            robot_radius * 2, 
+            robot_radius * 2
+        )
 
     
     def start_optitrack_connection(self):
@@ -4904,11 +5406,11 @@ class OptiTrackCalibrationPreview(QWidget):
             
             self.optitrack_socket.connect((self.main_window.optitrack_server_ip, self.main_window.optitrack_port))
             self.optitrack_socket.setblocking(False)
+            self.optitrack_stream.clear()
             
-            # Start timer to read data
-            self.optitrack_timer = QTimer(self)
-            self.optitrack_timer.timeout.connect(self.read_optitrack_data)
-            self.optitrack_timer.start(30)  # Read every 30ms
+            # Read data whenever the socket becomes readable (no polling)
+            self.optitrack_notifier = QSocketNotifier(self.optitrack_socket.fileno(), QSocketNotifier.Read, self)
+            self.optitrack_notifier.activated.connect(self.read_optitrack_data)
             
             self.connection_label.setText("Status: ✓ Connected (waiting for data...)")
             self.connection_label.setStyleSheet("""
@@ -4928,20 +5430,27 @@ class OptiTrackCalibrationPreview(QWidget):
             self.optitrack_socket = None
     
     def read_optitrack_data(self):
-        """Read robot position data from OptiTrack"""
+        """Read robot position data from OptiTrack (called when the socket is readable)"""
         if not self.optitrack_socket:
             return
         
         try:
-            data = self.optitrack_socket.recv(4096)
-            if data:
-                # Decode and clean data (remove null bytes)
-                decoded = data.decode('utf-8', errors='ignore')
-                cleaned = decoded.replace('\x00', '').strip()
+            # Drain everything the kernel has buffered since the last notification
+            received, closed = self.optitrack_stream.drain(self.optitrack_socket)
+            if closed:
+                # Server closed the connection - stop watching the socket
+                self.optitrack_notifier.setEnabled(False)
+            
+            if received:
+                # Clean the new data for display (remove null bytes), staying in bytes
+                cleaned = self.optitrack_stream.pending[-received:].replace(b'\x00', b'').strip()
                 
-                # Update raw data display (first 100 chars)
-                display_data = cleaned[:100] + "..." if len(cleaned) > 100 else cleaned
-                self.raw_data_label.setText(f"Raw: {display_data}")
+                # Update raw data display (newest 100 chars, throttled) - only that part is decoded
+                if self.label_due(self.raw_data_label):
+                    display_data = cleaned[-100:].decode('utf-8', errors='ignore')
+                    if len(cleaned) > 100:
+                        display_data = "..." + display_data
+                    self.raw_data_label.setText(f"Raw: {display_data}")
                 
                 if not cleaned:
                     return
@@ -4950,42 +5459,19 @@ class OptiTrackCalibrationPreview(QWidget):
                 self.data_receive_count += 1
                 self.last_update_time = time.time()
                 
-                # Parse robot data: id,x,y,z,rotation;
-                entries = cleaned.split(';')
-                
-                robot_found = False
-                for entry in entries:
-                    entry = entry.strip()
-                    if not entry:
-                        continue
+                # Update main window's latest position (robot 2 = currently active robot)
+                robot_positions = self.optitrack_stream.take_frame() or {}
+                if 2 in robot_positions:
+                    pos = robot_positions[2]
+                    self.main_window.latest_optitrack_position = (pos['x'], pos['y'])
+                    # Store full data for display
+                    self.main_window.latest_optitrack_full = pos
                     
-                    parts = entry.split(',')
-                    if len(parts) >= 5:
-                        try:
-                            robot_id = int(parts[0].strip())
-                            x = float(parts[1].strip())
-                            y = -float(parts[2].strip())  # Invert Y sign (server sends inverted Y)
-                            z = float(parts[3].strip())
-                            rotation = float(parts[4].strip())
-                            
-                            # Skip if any value is NaN
-                            if x != x or y != y:
-                                continue
-                            
-                            # Update main window's latest position (robot 2 = currently active robot)
-                            if robot_id == 2:
-                                self.main_window.latest_optitrack_position = (x, y)
-                                # Store full data for display
-                                self.main_window.latest_optitrack_full = {
-                                    'x': x, 'y': y, 'z': z, 'rotation': rotation
-                                }
-                                robot_found = True
-                                
-                        except (ValueError, IndexError):
-                            continue
+                    # Move the dot as soon as the packet arrives
+                    self.update_robot_dot(pos['x'], pos['y'], pos['z'], pos['rotation'])
                 
         except socket.error:
-            # No data available (non-blocking socket)
+            # Connection error - nothing to read
             pass
         except Exception:
             # Silent - errors not critical
@@ -4994,9 +5480,9 @@ class OptiTrackCalibrationPreview(QWidget):
     
     def stop_optitrack_connection(self):
         """Stop OptiTrack connection"""
-        if self.optitrack_timer:
-            self.optitrack_timer.stop()
-            self.optitrack_timer = None
+        if self.optitrack_notifier:
+            self.optitrack_notifier.setEnabled(False)
+            self.optitrack_notifier = None
         
         if self.optitrack_socket:
             try:
@@ -5012,11 +5498,9 @@ class OptiTrackCalibrationPreview(QWidget):
             corners: List of 4 (x, y) tuples in OptiTrack coordinates, or None for default
             adjust: If True, auto-adjust corners to form rectangle. If False, use as-is.
         """
-        # Fixed background bounds
-        BACKGROUND_MIN_X = -2.0
-        BACKGROUND_MAX_X = 2.0
-        BACKGROUND_MIN_Y = -1.5
-        BACKGROUND_MAX_Y = 1.5
+        # Fixed background bounds as (x, y)
+        BACKGROUND_MIN = np.array([-2.0, -1.5])
+        BACKGROUND_MAX = np.array([2.0, 1.5])
         
         # Remove old frame if exists
         if self.frame_rect is not None:
@@ -5026,7 +5510,7 @@ class OptiTrackCalibrationPreview(QWidget):
         # Don't show frame if no corners provided or incomplete
         if corners is None or len(corners) != 4:
             self.current_frame_corners = None
-            # Redraw axes (may have been cleared)
+            # Make sure axes are drawn (rebuilt only if the bounds changed)
             self.draw_axes()
             return
         
@@ -5038,85 +5522,59 @@ class OptiTrackCalibrationPreview(QWidget):
             frame_corners = corners
         
         # Validate: all corners must be within background bounds
-        for x, y in frame_corners:
-            if (x < BACKGROUND_MIN_X or x > BACKGROUND_MAX_X or 
-                y < BACKGROUND_MIN_Y or y > BACKGROUND_MAX_Y):
-                # Frame is outside bounds, don't show it
-                self.current_frame_corners = None
-                self.draw_axes()
-                return
+        corner_array = np.asarray(frame_corners, dtype=np.float64)
+        if (corner_array < BACKGROUND_MIN).any() or (corner_array > BACKGROUND_MAX).any():
+            # Frame is outside bounds, don't show it
+            self.current_frame_corners = None
+            self.draw_axes()
+            return
         
         # Store current frame for robot position transformation
         self.current_frame_corners = frame_corners
         
-        # Transform OptiTrack corners to canvas coordinates for preview
-        canvas_corners = []
-        for opti_x, opti_y in frame_corners:
-            canvas_x, canvas_y = self._preview_transform(opti_x, opti_y)
-            canvas_corners.append((canvas_x, canvas_y))
+        # Transform all OptiTrack corners to canvas coordinates for preview at once
+        canvas_xs, canvas_ys = self._preview_transform(corner_array[:, 0], corner_array[:, 1])
         
-        # Redraw axes (to ensure they're visible)
+        # Make sure axes are drawn (rebuilt only if the bounds changed)
         self.draw_axes()
         
         # Draw frame as white rectangle outline (on top of axes)
-        if len(canvas_corners) == 4:
-            # Create polygon from corners
-            polygon = QPolygonF()
-            for x, y in canvas_corners:
-                polygon.append(QPointF(x, y))
-            
-            self.frame_rect = self.scene.addPolygon(
-                polygon,
-                QPen(QColor(255, 255, 255), 3),  # White, 3px thick
-                QBrush(Qt.NoBrush)  # No fill
-            )
+        polygon = QPolygonF([QPointF(x, y) for x, y in zip(canvas_xs.tolist(), canvas_ys.tolist())])
+        self.frame_rect = self.scene.addPolygon(
+            polygon,
+            QPen(QColor(255, 255, 255), 3),  # White, 3px thick
+            QBrush(Qt.NoBrush)  # No fill
+        )
 
     
     def _adjust_to_rectangle(self, corners):
         """Same logic as main window's _adjust_to_rectangle"""
-        center_x = sum(p[0] for p in corners) / 4
-        center_y = sum(p[1] for p in corners) / 4
-        
-        distances_x = [abs(p[0] - center_x) for p in corners]
-        distances_y = [abs(p[1] - center_y) for p in corners]
-        
-        avg_dx = sum(distances_x) / 4
-        avg_dy = sum(distances_y) / 4
-        
-        adjusted = [
-            (center_x - avg_dx, center_y + avg_dy),  # Top-Left
-            (center_x + avg_dx, center_y + avg_dy),  # Top-Right
-            (center_x + avg_dx, center_y - avg_dy),  # Bottom-Right
-            (center_x - avg_dx, center_y - avg_dy)   # Bottom-Left
-        ]
-        
-        return adjusted
+        return adjust_to_rectangle(corners)
     
     def _preview_transform(self, opti_x, opti_y, frame_corners=None):
         """Transform OptiTrack coordinates to canvas coordinates for preview
         
+        Works on scalars or NumPy arrays of coordinates.
         Maps OptiTrack coordinates to canvas using background bounds from settings:
         Canvas: 600x600 (square)
         Real-world: X goes vertical (top to bottom), Y goes horizontal (left to right)
         """
-        # Get background bounds from main window settings
-        BACKGROUND_MIN_X = self.main_window.optitrack_bounds_min_x
-        BACKGROUND_MAX_X = self.main_window.optitrack_bounds_max_x
-        BACKGROUND_MIN_Y = self.main_window.optitrack_bounds_min_y
-        BACKGROUND_MAX_Y = self.main_window.optitrack_bounds_max_y
-        
-        # Normalize to 0-1 based on BACKGROUND bounds
-        norm_x = (opti_x - BACKGROUND_MIN_X) / (BACKGROUND_MAX_X - BACKGROUND_MIN_X)
-        norm_y = (opti_y - BACKGROUND_MIN_Y) / (BACKGROUND_MAX_Y - BACKGROUND_MIN_Y)
-        
-        # SWAP X and Y for proper orientation:
+        # SWAP X and Y for proper orientation (coefficients cached per bounds):
         # - OptiTrack Y → Canvas X (horizontal: Y decreases left to right)
         # - OptiTrack X → Canvas Y (vertical: X decreases top to bottom)
-        canvas_x = (1 - norm_y) * 600  # Y: 1.4 (left) → -0.4 (right)
-        canvas_y = norm_x * 600  # REVERSED: X: -2.8 (bottom) → -1.0 (top)
+        scale_y, offset_y, scale_x, offset_x = self.transform_coefficients
+        canvas_x = scale_y * opti_y + offset_y  # Y: 1.4 (left) → -0.4 (right)
+        canvas_y = scale_x * opti_x + offset_x  # REVERSED: X: -2.8 (bottom) → -1.0 (top)
         
         return canvas_x, canvas_y
     
+    def update_transform_coefficients(self):
+        """Recompute the cached OptiTrack → canvas coefficients from the current bounds"""
+        window = self.main_window
+        self.transform_coefficients = optitrack_canvas_coefficients(
+            window.optitrack_bounds_min_x, window.optitrack_bounds_max_x,
+            window.optitrack_bounds_min_y, window.optitrack_bounds_max_y, 600)
+    
     def resizeEvent(self, event):
         """Re-fit view when widget is resized"""
         super().resizeEvent(event)
@@ -5132,6 +5590,16 @@ class OptiTrackCalibrationPreview(QWidget):
 class OptiTrackVizCanvas(QGraphicsView):
     """Canvas for OptiTrack visualization mode - with coordinate axes like calibration preview"""
     
+    ROBOT_RADIUS = 12
+    CANVAS_SIZE = 700
+    # Map robot IDs to colors
+    ROBOT_COLOR_NAMES = {
+        1: 'red',
+        2: 'green',
+        3: 'blue',
+        4: 'yellow'
+    }
+    
     def __init__(self, parent_dialog, level_data, solution):
         super().__init__(parent_dialog)
         self.parent_dialog = parent_dialog
@@ -5147,9 +5615,31 @@ class OptiTrackVizCanvas(QGraphicsView):
         self.scene.setSceneRect(0, 0, 700, 700)
         
         # Robot position state (from OptiTrack)
-        self.robot_positions = {}  # {robot_id: {'x': x, 'y': y, 'z': z, 'rotation': rot}}
         self.robot_graphics = {}    # {robot_id: QGraphicsEllipseItem}
-        self.axes_items = []  # Store axes graphics items
+        
+        # Axes are painted as the view background (not scene items) and cached by the view;
+        # draw_axes only rebuilds the line/label lists below when the bounds change
+        self.axes_lines = []   # [(pen, [QLineF, ...]), ...] in paint order
+        self.axes_labels = []  # [(QPointF baseline position, text), ...]
+        self.axes_center_lines = []  # Green center cross, painted over the grid and labels
+        self.axes_dirty = True  # Set only when the bounds change; draw_axes is a no-op otherwise
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        
+        # OptiTrack → canvas coefficients, recomputed only when the bounds change
+        self.update_transform_coefficients()
+        parent_dialog.parent_window.optitrack_bounds_changed.connect(self.update_transform_coefficients)
+        parent_dialog.parent_window.optitrack_bounds_changed.connect(self.invalidate_axes)
+        
+        # Axis pens and label font, built once and reused by every draw_axes call
+        self.grid_pen = QPen(QColor(100, 100, 100), 1)
+        self.zero_line_pen = QPen(QColor(255, 255, 255), 1)
+        self.center_axis_pen = QPen(QColor(0, 255, 0), 2)
+        self.label_font = QFont("Arial", 8, QFont.Bold)
+        self.label_color = QColor(255, 255, 255)
+        # Labels sit where a QGraphicsTextItem at the same position would draw them
+        # (4px document margin, text top at the font ascent above the baseline)
+        label_metrics = QFontMetricsF(self.label_font)
+        self.label_offset = QPointF(4, 4 + label_metrics.ascent())
         
         # Update timer
         self.update_timer = QTimer(self)
@@ -5158,13 +5648,22 @@ class OptiTrackVizCanvas(QGraphicsView):
         # Draw initial elements
         self.draw_axes()
         self.draw_static_elements()
+        self.create_robot_graphics()
+    
+    def invalidate_axes(self):
+        """Mark the axes stale after a bounds change and rebuild them"""
+        self.axes_dirty = True
+        self.draw_axes()
     
     def draw_axes(self):
-        """Draw coordinate axes with labels (OptiTrack coordinate system)"""
-        # Clear previous axes
-        for item in self.axes_items:
-            self.scene.removeItem(item)
-        self.axes_items.clear()
+        """Draw coordinate axes with labels (OptiTrack coordinate system)
+        
+        Builds the grid lines and labels for the current bounds; they are painted in
+        drawBackground, which the view caches until the next draw_axes call.
+        """
+        if not self.axes_dirty:
+            return
+        self.axes_dirty = False
         
         # Get background bounds from main window settings
         BACKGROUND_MIN_X = self.parent_dialog.parent_window.optitrack_bounds_min_x
@@ -5172,108 +5671,135 @@ class OptiTrackVizCanvas(QGraphicsView):
         BACKGROUND_MIN_Y = self.parent_dialog.parent_window.optitrack_bounds_min_y
         BACKGROUND_MAX_Y = self.parent_dialog.parent_window.optitrack_bounds_max_y
         
+        grid_lines = []
+        zero_lines = []
+        labels = []
+        
         # Draw Y-axis grid (VERTICAL lines, since Y is horizontal)
         # Y range: -0.4 to 1.4 (1.8m range)
         y_range = abs(BACKGROUND_MAX_Y - BACKGROUND_MIN_Y)
         y_step = 0.2 if y_range <= 2 else 0.5
-        y_values = [BACKGROUND_MIN_Y + i * y_step for i in range(int(y_range / y_step) + 1)]
+        y_values = BACKGROUND_MIN_Y + np.arange(int(y_range / y_step) + 1) * y_step
         
-        for y in y_values:
-            # Y maps to canvas X (horizontal position)
-            norm_y = (y - BACKGROUND_MIN_Y) / (BACKGROUND_MAX_Y - BACKGROUND_MIN_Y)
-            canvas_x = (1 - norm_y) * 700  # Y: 1.4 (left=0) → -0.4 (right=700)
-            
+        # Y maps to canvas X (horizontal position), computed for all grid lines at once
+        # with the cached linear coefficients (one multiply-add per value)
+        scale_y, offset_y, scale_x, offset_x = self.transform_coefficients
+        canvas_x_values = scale_y * y_values + offset_y  # Y: 1.4 (left=0) → -0.4 (right=700)
+        
+        for y, canvas_x in zip(y_values.tolist(), canvas_x_values.tolist()):
             # Draw vertical line (all values in gray/white)
+            line = QLineF(canvas_x, 0, canvas_x, 700)
             if abs(y) < 0.01:  # Y=0 - white line
-                pen = QPen(QColor(255, 255, 255), 1)
+                zero_lines.append(line)
             else:
-                pen = QPen(QColor(100, 100, 100), 1)  # Gray grid
-            
-            line = self.scene.addLine(canvas_x, 0, canvas_x, 700, pen)
-            self.axes_items.append(line)
+                grid_lines.append(line)  # Gray grid
             
             # Add label on horizontal center line (y=350) - just the number
-            text = self.scene.addText(f"{y:.1f}", QFont("Arial", 8, QFont.Bold))
-            text.setDefaultTextColor(QColor(255, 255, 255))
-            text.setPos(canvas_x - 15, 345)  # On horizontal center line
-            self.axes_items.append(text)
+            labels.append((QPointF(canvas_x - 15, 345) + self.label_offset, f"{y:.1f}"))
         
         # Draw X-axis grid (HORIZONTAL lines, since X is vertical)
         # X range: -2.8 to -1.0 (1.8m range)
         x_range = abs(BACKGROUND_MAX_X - BACKGROUND_MIN_X)
         x_step = 0.2 if x_range <= 2 else 0.5
-        x_values = [BACKGROUND_MIN_X + i * x_step for i in range(int(x_range / x_step) + 1)]
+        x_values = BACKGROUND_MIN_X + np.arange(int(x_range / x_step) + 1) * x_step
         
-        for x in x_values:
-            # X maps to canvas Y (vertical position)
-            norm_x = (x - BACKGROUND_MIN_X) / (BACKGROUND_MAX_X - BACKGROUND_MIN_X)
-            canvas_y = norm_x * 700  # REVERSED: X: -2.8 (bottom=700) → -1.0 (top=0)
-            
+        # X maps to canvas Y (vertical position), computed for all grid lines at once
+        canvas_y_values = scale_x * x_values + offset_x  # REVERSED: X: -2.8 (bottom=700) → -1.0 (top=0)
+        
+        for x, canvas_y in zip(x_values.tolist(), canvas_y_values.tolist()):
             # Draw horizontal line (all values in gray, no X=0 in range)
-            pen = QPen(QColor(100, 100, 100), 1)  # Gray grid
-            
-            line = self.scene.addLine(0, canvas_y, 700, canvas_y, pen)
-            self.axes_items.append(line)
+            grid_lines.append(QLineF(0, canvas_y, 700, canvas_y))
             
             # Add label on vertical center line (x=350) - just the number
-            text = self.scene.addText(f"{x:.1f}", QFont("Arial", 8, QFont.Bold))
-            text.setDefaultTextColor(QColor(255, 255, 255))
-            text.setPos(310, canvas_y - 10)  # Left of vertical center line to avoid overlap
-            self.axes_items.append(text)
+            labels.append((QPointF(310, canvas_y - 10) + self.label_offset, f"{x:.1f}"))
         
         # Draw center cross lines (GREEN axes)
         center_x = 350  # Canvas center (700/2)
         center_y = 350
+        center_lines = [
+            QLineF(center_x, 0, center_x, 700),  # Vertical center line (green - Y axis)
+            QLineF(0, center_y, 700, center_y),  # Horizontal center line (green - X axis)
+        ]
         
-        # Vertical center line (green - Y axis)
-        center_v_line = self.scene.addLine(center_x, 0, center_x, 700, QPen(QColor(0, 255, 0), 2))
-        self.axes_items.append(center_v_line)
+        self.axes_lines = [(self.grid_pen, grid_lines), (self.zero_line_pen, zero_lines)]
+        self.axes_labels = labels
+        self.axes_center_lines = center_lines
         
-        # Horizontal center line (green - X axis)
-        center_h_line = self.scene.addLine(0, center_y, 700, center_y, QPen(QColor(0, 255, 0), 2))
-        self.axes_items.append(center_h_line)
+        # Repaint the cached background with the new axes
+        self.resetCachedContent()
+        self.viewport().update()
         
         # Note: Axis direction labels removed as real-world X/Y directions don't match screen intuition
         # X increases from bottom to top (opposite of screen), Y increases from right to left
     
+    def drawBackground(self, painter, rect):
+        """Paint the axes grid, labels and center cross behind the robot dots"""
+        super().drawBackground(painter, rect)
+        painter.setRenderHint(QPainter.Antialiasing)  # Not carried over into the background cache
+        
+        for pen, lines in self.axes_lines:
+            painter.setPen(pen)
+            painter.drawLines(lines)
+        
+        painter.setFont(self.label_font)
+        painter.setPen(self.label_color)
+        for position, text in self.axes_labels:
+            painter.drawText(position, text)
+        
+        painter.setPen(self.center_axis_pen)
+        painter.drawLines(self.axes_center_lines)
+    
     def _transform_to_canvas(self, opti_x, opti_y):
         """Transform OptiTrack coordinates to canvas coordinates (same as calibration)
         Real-world: X goes vertical (top to bottom), Y goes horizontal (left to right)
         """
-        # Get background bounds from main window settings
-        BACKGROUND_MIN_X = self.parent_dialog.parent_window.optitrack_bounds_min_x
-        BACKGROUND_MAX_X = self.parent_dialog.parent_window.optitrack_bounds_max_x
-        BACKGROUND_MIN_Y = self.parent_dialog.parent_window.optitrack_bounds_min_y
-        BACKGROUND_MAX_Y = self.parent_dialog.parent_window.optitrack_bounds_max_y
-        
-        # Normalize to 0-1
-        norm_x = (opti_x - BACKGROUND_MIN_X) / (BACKGROUND_MAX_X - BACKGROUND_MIN_X)
-        norm_y = (opti_y - BACKGROUND_MIN_Y) / (BACKGROUND_MAX_Y - BACKGROUND_MIN_Y)
-        
-        # SWAP X and Y for proper orientation:
+        # SWAP X and Y for proper orientation (coefficients cached per bounds):
         # - OptiTrack Y → Canvas X (horizontal: Y decreases left to right)
         # - OptiTrack X → Canvas Y (vertical: X decreases top to bottom)
-        canvas_x = (1 - norm_y) * 700  # Y: 1.4 (left) → -0.4 (right)
-        canvas_y = norm_x * 700  # REVERSED: X: -2.8 (bottom) → -1.0 (top)
+        scale_y, offset_y, scale_x, offset_x = self.transform_coefficients
+        canvas_x = scale_y * opti_y + offset_y  # Y: 1.4 (left) → -0.4 (right)
+        canvas_y = scale_x * opti_x + offset_x  # REVERSED: X: -2.8 (bottom) → -1.0 (top)
         
         return canvas_x, canvas_y
     
+    def update_transform_coefficients(self):
+        """Recompute the cached OptiTrack → canvas coefficients from the current bounds"""
+        window = self.parent_dialog.parent_window
+        self.transform_coefficients = optitrack_canvas_coefficients(
+            window.optitrack_bounds_min_x, window.optitrack_bounds_max_x,
+            window.optitrack_bounds_min_y, window.optitrack_bounds_max_y, self.CANVAS_SIZE)
+    
     def draw_static_elements(self):
         """Draw START and END dots on the coordinate system"""
-        # Map robot IDs to colors
-        robot_color_map = {
-            1: 'red',
-            2: 'green',
-            3: 'blue',
-            4: 'yellow'
-        }
-        
         # Note: START/END dots are drawn in game coordinate system (0-600, 0-400)
         # not OptiTrack coordinate system. We can skip them or transform them.
         # For now, skip to keep clean axes view
         pass
 
     
+    def create_robot_graphics(self):
+        """Create one hidden robot dot per known robot; updates only move and show them
+        
+        Pens and brushes are resolved here once, so the update loop never looks up colors.
+        """
+        colors = self.parent_dialog.parent_window.colors
+        diameter = self.ROBOT_RADIUS * 2
+        outline_pen = QPen(QColor(255, 255, 255), 2)
+        for robot_id, color_name in self.ROBOT_COLOR_NAMES.items():
+            if color_name not in colors:
+                continue
+            robot_item = self.scene.addEllipse(0, 0, diameter, diameter, outline_pen, QBrush(colors[color_name]))
+            robot_item.hide()  # Shown once the robot is first tracked
+            self.robot_graphics[robot_id] = robot_item
+        
+        # Robot state as parallel arrays, one row per robot ID (structure of arrays)
+        self.robot_rows = {robot_id: row for row, robot_id in enumerate(self.ROBOT_COLOR_NAMES)}
+        self.robot_items = [self.robot_graphics.get(robot_id) for robot_id in self.ROBOT_COLOR_NAMES]
+        robot_count = len(self.robot_rows)
+        self.canvas_xy = np.zeros((robot_count, 2), dtype=np.int32)  # Latest integer dot centers
+        self.drawn_xy = np.full((robot_count, 2), -1, dtype=np.int32)  # Centers currently on screen
+        self.robot_tracked = np.zeros(robot_count, dtype=bool)  # Seen at least once
+    
     def start_visualization(self):
         """Start updating robot positions"""
         self.update_timer.start(30)  # 30ms = ~33 FPS
@@ -5285,58 +5811,38 @@ class OptiTrackVizCanvas(QGraphicsView):
     def set_robot_positions(self, positions):
         """Update robot positions from OptiTrack data"""
         # positions: {robot_id: {'x': x, 'y': y, 'z': z, 'rotation': rot}}
-        self.robot_positions = positions
+        self.set_canvas_positions(optitrack_canvas_positions(
+            positions, self.transform_coefficients, self.CANVAS_SIZE))
+    
+    def set_canvas_positions(self, canvas_positions):
+        """Update robot positions already transformed to canvas centers (e.g. by the reader thread)"""
+        # canvas_positions: {robot_id: (canvas_x, canvas_y)}
+        for robot_id, xy in canvas_positions.items():
+            row = self.robot_rows.get(robot_id)
+            if row is not None:
+                self.canvas_xy[row] = xy
+                self.robot_tracked[row] = True
     
     def update_robot_positions(self):
-        """Update robot graphics based on OptiTrack data"""
-        if not self.robot_positions:
+        """Move the robot graphics whose canvas position changed since the last update"""
+        if not self.isVisible():
             return
         
-        # Map robot IDs to colors
-        robot_color_map = {
-            1: 'red',
-            2: 'green',
-            3: 'blue',
-            4: 'yellow'
-        }
+        moved = np.flatnonzero(self.robot_tracked & (self.canvas_xy != self.drawn_xy).any(axis=1))
+        if not len(moved):
+            return
         
-        for robot_id, pos_data in self.robot_positions.items():
-            color_name = robot_color_map.get(robot_id)
-            if not color_name:
+        # Move the pre-created robot graphics - use setRect for ellipse
+        robot_radius = self.ROBOT_RADIUS
+        diameter = robot_radius * 2
+        for row, (x, y) in zip(moved.tolist(), self.canvas_xy[moved].tolist()):
+            robot_item = self.robot_items[row]
+            if robot_item is None:
                 continue
-            
-            # Transform OptiTrack coordinates to canvas coordinates
-            opti_x = pos_data['x']
-            opti_y = pos_data['y']
-            
-            canvas_x, canvas_y = self._transform_to_canvas(opti_x, opti_y)
-            
-            # Clamp to visible area (700x700 square)
-            canvas_x = max(0, min(700, canvas_x))
-            canvas_y = max(0, min(700, canvas_y))
-            
-            # Update or create robot graphic
-            robot_radius = 12
-            color = self.parent_dialog.parent_window.colors[color_name]
-            
-            if robot_id in self.robot_graphics:
-                # Update existing robot position - use setRect for ellipse
-                robot_item = self.robot_graphics[robot_id]
-                robot_item.setRect(
-                    canvas_x - robot_radius, 
-                    canvas_y - robot_radius,
-                    robot_radius * 2, 
-                    robot_radius * 2
-                )
-            else:
-                # Create new robot graphic
-                robot_item = self.scene.addEllipse(
-                    canvas_x - robot_radius, canvas_y - robot_radius,
-                    robot_radius * 2, robot_radius * 2,
-                    QPen(QColor(255, 255, 255), 2),
-                    QBrush(color)
-                )
-                self.robot_graphics[robot_id] = robot_item
+            robot_item.setRect(x - robot_radius, y - robot_radius, diameter, diameter)
+            if not robot_item.isVisible():
+                robot_item.show()
+        self.drawn_xy[moved] = self.canvas_xy[moved]
     
     def resizeEvent(self, event):
         """Re-fit view when widget is resized"""
@@ -13,10 +13,15 @@ class CoordinateTransformer:
     using perspective transformation (homography)
     """
     
+    # Paths up to this many points go through the specialized scalar transform;
+    # below it, building and unpacking the arrays costs more than the arithmetic
+    SCALAR_PATH_MAX = 64
+    
     def __init__(self, calibration_file='dotconnect_data/calibration.json'):
         self.calibration_file = calibration_file
         self.calibration_data = None
         self.transform_matrix = None
+        self.affine_coefficients = None  # (a, b, tx, c, d, ty) when the homography has no perspective part
         self.is_calibrated = False
         
         # Load calibration if exists
@@ -46,7 +51,7 @@ class CoordinateTransformer:
         # Compute perspective transformation matrix
         try:
             # Using OpenCV-style homography calculation
-            self.transform_matrix = self._compute_homography(src_points, dst_points)
+            self._set_transform_matrix(self._compute_homography(src_points, dst_points))
             
             self.calibration_data = {
                 'pixmap_corners': pixmap_corners,
@@ -67,49 +72,125 @@ class CoordinateTransformer:
         Compute perspective transformation matrix (3x3 homography)
         Maps src_points to dst_points
         """
+        # Hartley normalization: condition both point sets before solving
+        T_src = self._normalization_matrix(src_points)
+        T_dst = self._normalization_matrix(dst_points)
+        src_norm = self._apply_normalization(T_src, src_points)
+        dst_norm = self._apply_normalization(T_dst, dst_points)
+        
         # Build the equation system for homography
-        # For 4 point pairs, we have 8 equations (2 per point)
+        # For 4 point pairs, we have 8 equations (2 per point); fixing h22 = 1
+        # leaves an 8x8 system A h = b
         A = []
+        b = []
         for i in range(4):
-            x, y = src_points[i]
-            u, v = dst_points[i]
-            A.append([x, y, 1, 0, 0, 0, -u*x, -u*y, -u])
-            A.append([0, 0, 0, x, y, 1, -v*x, -v*y, -v])
+            x, y = src_norm[i]
+            u, v = dst_norm[i]
+            A.append([x, y, 1, 0, 0, 0, -u*x, -u*y])
+            A.append([0, 0, 0, x, y, 1, -v*x, -v*y])
+            b.extend([u, v])
         
         A = np.array(A)
+        b = np.array(b)
         
-        # Solve using SVD
-        U, S, Vt = np.linalg.svd(A)
-        H = Vt[-1].reshape(3, 3)
+        try:
+            # Solve with one LU decomposition
+            h = np.linalg.solve(A, b)
+            H_norm = np.append(h, 1.0).reshape(3, 3)
+        except np.linalg.LinAlgError:
+            # Singular with h22 fixed: fall back to the SVD null space of the full system
+            A = np.hstack([A, -b[:, None]])
+            U, S, Vt = np.linalg.svd(A)
+            H_norm = Vt[-1].reshape(3, 3)
         
-        # Normalize
+        # Undo the normalization, then fix the scale
+        H = np.linalg.inv(T_dst) @ H_norm @ T_src
         H = H / H[2, 2]
         
         return H
     
+    @staticmethod
+    def _normalization_matrix(points):
+        """
+        Similarity transform that moves the centroid of points to the origin
+        and scales them so their mean distance from it is sqrt(2)
+        """
+        points = np.asarray(points, dtype=np.float64)
+        centroid = points.mean(axis=0)
+        mean_distance = np.sqrt(((points - centroid) ** 2).sum(axis=1)).mean()
+        scale = np.sqrt(2.0) / mean_distance if mean_distance > 0 else 1.0
+        return np.array([
+            [scale, 0.0, -scale * centroid[0]],
+            [0.0, scale, -scale * centroid[1]],
+            [0.0, 0.0, 1.0]
+        ])
+    
+    @staticmethod
+    def _apply_normalization(T, points):
+        """Apply a normalization matrix to an (N, 2) array of points"""
+        points = np.asarray(points, dtype=np.float64)
+        return points * T[0, 0] + T[:2, 2]
+    
+    def _set_transform_matrix(self, H):
+        """
+        Store the homography and detect whether it is affine
+        
+        Rectangle-to-rectangle calibrations give a homography with a (0, 0, 1)
+        bottom row; those points are mapped with a 2x3 affine transform and no
+        perspective divide.
+        """
+        # Stored in single precision, like the saved calibration: far below the
+        # tracking noise over the board, and half the bandwidth for path transforms
+        H = np.ascontiguousarray(H, dtype=np.float32)
+        self.transform_matrix = H
+        if abs(H[2, 0]) < 1e-12 and abs(H[2, 1]) < 1e-12:
+            affine = H[:2] / H[2, 2]
+            self.affine_coefficients = tuple(affine.ravel().tolist())
+        else:
+            self.affine_coefficients = None
+        
+        # Shadow the generic method with one specialized to this calibration
+        self.pixmap_to_realworld = self._build_point_transform()
+    
+    def _build_point_transform(self):
+        """
+        Build a (x, y) -> (real_x, real_y) function with the calibration
+        coefficients bound as plain floats, so a call skips the calibration
+        check, the attribute lookups and the numpy round trip
+        """
+        if self.affine_coefficients is not None:
+            a, b, tx, c, d, ty = self.affine_coefficients
+            
+            def affine_transform(x, y, a=a, b=b, tx=tx, c=c, d=d, ty=ty):
+                return (a * x + b * y + tx, c * x + d * y + ty)
+            
+            return affine_transform
+        
+        h00, h01, h02, h10, h11, h12, h20, h21, h22 = self.transform_matrix.ravel().tolist()
+        
+        def perspective_transform(x, y, h00=h00, h01=h01, h02=h02, h10=h10, h11=h11, h12=h12,
+                                  h20=h20, h21=h21, h22=h22):
+            w = h20 * x + h21 * y + h22
+            return ((h00 * x + h01 * y + h02) / w, (h10 * x + h11 * y + h12) / w)
+        
+        return perspective_transform
+    
     def pixmap_to_realworld(self, x, y):
         """
         Convert a single point from pixmap coordinates to real-world coordinates
         
+        Once a calibration is set or loaded, _set_transform_matrix replaces this
+        method on the instance with the transform from _build_point_transform;
+        this version only handles the uncalibrated case.
+        
         Args:
             x, y: Coordinates in pixmap space
         
         Returns:
             (real_x, real_y): Coordinates in real-world OptiTrack space
         """
-        if not self.is_calibrated:
-            print("[WARNING] Coordinate transformer not calibrated! Returning original coordinates.")
-            return (x, y)
-        
-        # Apply perspective transformation
-        point = np.array([x, y, 1], dtype=np.float32)
-        transformed = self.transform_matrix @ point
-        
-        # Normalize by homogeneous coordinate
-        real_x = transformed[0] / transformed[2]
-        real_y = transformed[1] / transformed[2]
-        
-        return (real_x, real_y)
+        print("[WARNING] Coordinate transformer not calibrated! Returning original coordinates.")
+        return (x, y)
     
     def pixmap_path_to_realworld(self, pixmap_path):
         """
@@ -121,15 +202,35 @@ class CoordinateTransformer:
         Returns:
             List of (real_x, real_y) tuples in real-world coordinates
         """
-        if not pixmap_path:
+        if len(pixmap_path) == 0:
             return []
         
-        realworld_path = []
-        for x, y in pixmap_path:
-            real_x, real_y = self.pixmap_to_realworld(x, y)
-            realworld_path.append((real_x, real_y))
+        if not self.is_calibrated:
+            print("[WARNING] Coordinate transformer not calibrated! Returning original coordinates.")
+            return [(x, y) for x, y in pixmap_path]
         
-        return realworld_path
+        if len(pixmap_path) <= self.SCALAR_PATH_MAX:
+            transform = self.pixmap_to_realworld
+            return [transform(x, y) for x, y in pixmap_path]
+        
+        points = np.ascontiguousarray(pixmap_path, dtype=np.float32).reshape(-1, 2)
+        realworld = self._transform_points(points)
+        
+        return [tuple(point) for point in realworld.tolist()]
+    
+    def _transform_points(self, points):
+        """Transform an (N, 2) float32 array of pixmap points to real-world coordinates"""
+        if self.affine_coefficients is not None:
+            # Affine fast path: (N, 2) @ A.T + t, no perspective divide
+            affine = np.array(self.affine_coefficients, dtype=np.float32).reshape(2, 3)
+            return points @ affine[:, :2].T + affine[:, 2]
+        
+        # Transform all points at once: homogeneous (N, 3) rows times the transposed homography
+        homogeneous = np.hstack([points, np.ones((len(points), 1), dtype=np.float32)])
+        transformed = homogeneous @ self.transform_matrix.T
+        
+        # Normalize by homogeneous coordinate
+        return transformed[:, :2] / transformed[:, 2:3]
     
     def convert_solution_to_realworld(self, solution):
         """
@@ -142,12 +243,26 @@ class CoordinateTransformer:
         Returns:
             Dict with same structure but real-world coordinates
         """
-        realworld_solution = {}
+        if not self.is_calibrated:
+            return {color: self.pixmap_path_to_realworld(path) for color, path in solution.items()}
+        
+        # Stack every color's path and transform them in one go, then split by offsets
+        offsets = [0]
+        all_points = []
+        for path in solution.values():
+            all_points.extend(path)
+            offsets.append(len(all_points))
+        
+        if not all_points:
+            return {color: [] for color in solution}
         
-        for color, path in solution.items():
-            realworld_solution[color] = self.pixmap_path_to_realworld(path)
+        points = np.ascontiguousarray(all_points, dtype=np.float32).reshape(-1, 2)
+        realworld = [tuple(point) for point in self._transform_points(points).tolist()]
         
-        return realworld_solution
+        return {
+            color: realworld[offsets[i]:offsets[i + 1]]
+            for i, color in enumerate(solution)
+        }
     
     def save_calibration(self):
         """Save calibration data to file"""
@@ -175,7 +290,7 @@ class CoordinateTransformer:
             with open(self.calibration_file, 'r') as f:
                 self.calibration_data = json.load(f)
             
-            self.transform_matrix = np.array(self.calibration_data['transform_matrix'], dtype=np.float32)
+            self._set_transform_matrix(np.array(self.calibration_data['transform_matrix'], dtype=np.float32))
             self.is_calibrated = True
             print("[INFO] Calibration loaded successfully!")
             return True
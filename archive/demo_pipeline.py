@@ -2,6 +2,8 @@
 Demo Script - Test the complete path planning pipeline
 """
 
+import numpy as np
+
 from mission_config import MissionManager, RobotColor
 from path_optimizer import PathInterpolator, WaypointOptimizer, CoordinateConverter
 from path_validator import PathValidator
@@ -108,8 +110,10 @@ def demo_complete_pipeline():
     print("\n9️⃣  Distances between unique waypoints:")
     print("   " + "="*60)
     
-    for i in range(len(unique_waypoints) - 1):
-        dist = waypoint_optimizer._euclidean_distance(unique_waypoints[i], unique_waypoints[i+1])
+    # All segment lengths at once; the loop only formats them
+    points = np.asarray(unique_waypoints, dtype=np.float64).reshape(-1, 2)
+    distances = np.linalg.norm(np.diff(points, axis=0), axis=1)
+    for i, dist in enumerate(distances.tolist()):
         print(f"   WP{i+1} → WP{i+2}: {dist:6.1f} mm ({dist/10:.1f} cm)")
     
     # Summary
@@ -0,0 +1,144 @@
+"""
+OptiTrack Stream Module
+Parses the OptiTrack position stream (ASCII entries or packed binary records)
+and buffers partial entries between socket reads. Kept free of Qt so it can be
+used and tested without the GUI.
+"""
+
+import re
+import numpy as np
+
+
+# OptiTrack stream entry: id,x,y,z,rotation; (any extra fields before ';' are ignored)
+# The id may not follow a digit/sign/comma, so a fragment of a cut-off entry is never read as an id
+_OPTI_NUM = rb'(-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)'
+OPTITRACK_ENTRY_RE = re.compile(
+    rb'(?<![\w.,\-])(-?\d+)\s*,\s*' + rb'\s*,\s*'.join([_OPTI_NUM] * 4) + rb'[^;]*;'
+)
+
+
+def parse_optitrack_frame(data):
+    """Parse raw OptiTrack bytes into {robot_id: {'x', 'y', 'z', 'rotation'}}
+    
+    Works directly on the received bytes (no decode/split). Entries with
+    non-numeric values (e.g. nan) or without a terminating ';' are skipped.
+    """
+    robot_positions = {}
+    for match in OPTITRACK_ENTRY_RE.finditer(data):
+        robot_id, x, y, z, rotation = match.groups()
+        robot_positions[int(robot_id)] = {
+            'x': float(x),
+            'y': -float(y),  # Invert Y sign (server sends inverted Y)
+            'z': float(z),
+            'rotation': float(rotation)
+        }
+    return robot_positions
+
+
+# A partial entry longer than this can't be a real frame; drop it instead of buffering forever
+OPTITRACK_MAX_PARTIAL = 4096
+
+
+def optitrack_frame_end(buffer):
+    """Length of the prefix of buffered OptiTrack bytes made of complete entries
+    
+    recv() can stop mid-entry; only the prefix up to the last ';' is ready to
+    parse, the rest is kept and completed by the next read.
+    """
+    return buffer.rfind(b';') + 1
+
+
+# Size of the reusable receive buffer every recv_into() fills
+OPTITRACK_RECV_SIZE = 65536
+
+
+# Optional fixed-layout binary stream: one packed record per robot, no separators.
+# Requested with a one-byte handshake right after connecting.
+OPTITRACK_BINARY_HANDSHAKE = b'B'
+OPTITRACK_BINARY_DTYPE = np.dtype([('id', '<u1'), ('x', '<f4'), ('y', '<f4'),
+                                   ('z', '<f4'), ('rotation', '<f4')])
+
+
+def optitrack_binary_frame_end(buffer):
+    """Length of the prefix of buffered binary OptiTrack bytes made of whole records"""
+    return len(buffer) - len(buffer) % OPTITRACK_BINARY_DTYPE.itemsize
+
+
+def parse_optitrack_binary_frame(data):
+    """Parse whole binary OptiTrack records into {robot_id: {'x', 'y', 'z', 'rotation'}}
+    
+    Same result as parse_optitrack_frame; records with NaN x/y (robot not
+    tracked) are skipped.
+    """
+    records = np.frombuffer(data, dtype=OPTITRACK_BINARY_DTYPE)
+    records = records[~(np.isnan(records['x']) | np.isnan(records['y']))]
+    robot_positions = {}
+    for robot_id, x, y, z, rotation in records.tolist():
+        robot_positions[robot_id] = {
+            'x': x,
+            'y': -y,  # Invert Y sign (server sends inverted Y)
+            'z': z,
+            'rotation': rotation
+        }
+    return robot_positions
+
+
+class OptiTrackStream:
+    """Receive buffer for an OptiTrack socket that parses the complete entries
+    
+    Reads land in one reusable buffer through recv_into() and are appended to a
+    bytearray of pending bytes, so reading allocates no bytes objects. Complete
+    entries are parsed straight from a view of the pending bytes.
+    """
+    
+    def __init__(self, binary=False):
+        self.recv_buffer = bytearray(OPTITRACK_RECV_SIZE)
+        self.recv_view = memoryview(self.recv_buffer)
+        self.pending = bytearray()  # Received bytes not parsed yet (complete entries + partial entry)
+        if binary:
+            self.frame_end, self.parse_frame = optitrack_binary_frame_end, parse_optitrack_binary_frame
+        else:
+            self.frame_end, self.parse_frame = optitrack_frame_end, parse_optitrack_frame
+    
+    def receive(self, sock):
+        """Read once from sock into the pending bytes; returns the byte count (0 = closed)"""
+        received = sock.recv_into(self.recv_view)
+        self.pending += self.recv_view[:received]
+        return received
+    
+    def drain(self, sock):
+        """Read everything a non-blocking socket has buffered
+        
+        Returns (bytes received, closed); closed is True when the server has
+        shut the connection. Reading the whole backlog means the newest entries
+        are parsed instead of lagging several frames behind.
+        """
+        total = 0
+        while True:
+            try:
+                received = self.receive(sock)
+            except BlockingIOError:
+                return total, False
+            if not received:
+                return total, True
+            total += received
+    
+    def take_frame(self):
+        """Parse and drop the complete entries received so far
+        
+        Returns {robot_id: {'x', 'y', 'z', 'rotation'}}, or None while no
+        entry is complete yet.
+        """
+        end = self.frame_end(self.pending)
+        robot_positions = None
+        if end:
+            with memoryview(self.pending) as view, view[:end] as frame:
+                robot_positions = self.parse_frame(frame)
+            del self.pending[:end]
+        if len(self.pending) > OPTITRACK_MAX_PARTIAL:
+            self.pending.clear()
+        return robot_positions
+    
+    def clear(self):
+        """Forget any pending bytes (e.g. after reconnecting)"""
+        self.pending.clear()
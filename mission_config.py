@@ -3,20 +3,47 @@ Mission Configuration Module
 Defines mission parameters, robot configurations, and validation rules.
 """
 
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Optional
+from dataclasses import dataclass, field
 from enum import Enum
 
 
-class RobotColor(Enum):
-    """Robot color identifiers."""
+# Configs are immutable value objects; slots (Python 3.10+) drop the per-instance __dict__
+CONFIG_DATACLASS_OPTIONS = {'frozen': True}
+if sys.version_info >= (3, 10):
+    CONFIG_DATACLASS_OPTIONS['slots'] = True
+
+
+class RobotColor(str, Enum):
+    """
+    Robot color identifiers.
+    
+    Mixed with str so hashing and equality (color-keyed dicts) use str's C
+    implementations instead of Enum's Python-level __hash__; .value stays the
+    color name used as a key throughout the planner.
+    
+    Unlike a plain Enum, a member therefore equals and hashes like its value:
+    RobotColor.RED == "red" is True, and RobotColor.RED and "red" are the same
+    dict key. __str__ and __format__ are pinned to the plain Enum form
+    ("RobotColor.RED"), which str/Enum mixins otherwise render differently
+    across Python versions.
+    """
     RED = "red"
     GREEN = "green"
     BLUE = "blue"
     YELLOW = "yellow"
+    
+    def __str__(self):
+        return f"{type(self).__name__}.{self.name}"
+    
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
 
 
-@dataclass
+@dataclass(**CONFIG_DATACLASS_OPTIONS)
 class RobotConfig:
     """Configuration for a single robot."""
     color: RobotColor
@@ -26,21 +53,149 @@ class RobotConfig:
     hex_color: str  # For rendering
 
 
-@dataclass
+@dataclass(**CONFIG_DATACLASS_OPTIONS)
 class MissionConfig:
     """Configuration for a mission."""
     mission_id: int
     name: str
     description: str
-    robots: List[RobotConfig]
+    robots: Tuple[RobotConfig, ...]  # stored as a tuple; configs are shared between managers
     difficulty: str
+    # Color -> robot lookup, derived from robots once at construction
+    _robots_by_color: Dict[RobotColor, RobotConfig] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'robots', tuple(self.robots))
+        # Built in reverse so the first robot of a color wins, as with a linear scan
+        object.__setattr__(self, '_robots_by_color',
+                           {robot.color: robot for robot in reversed(self.robots)})
     
     def get_robot_by_color(self, color: RobotColor) -> Optional[RobotConfig]:
         """Get robot configuration by color."""
-        for robot in self.robots:
-            if robot.color == color:
-                return robot
-        return None
+        return self._robots_by_color.get(color)
+
+
+@lru_cache(maxsize=8)
+def _build_missions(canvas_width: int, canvas_height: int) -> Mapping[int, MissionConfig]:
+    """Create all mission configurations for a canvas size (cached; configs are frozen)."""
+    
+    # Helper function for positioning
+    def pos(x_frac: float, y_frac: float) -> Tuple[float, float]:
+        return (x_frac * canvas_width, y_frac * canvas_height)
+    
+    missions = {}
+    
+    # Mission 1: Single Robot (Red)
+    missions[1] = MissionConfig(
+        mission_id=1,
+        name="Mission 1: Solo Navigator",
+        description="Guide the RED robot from start to finish. Learn the basics!",
+        difficulty="Easy",
+        robots=(
+            RobotConfig(
+                color=RobotColor.RED,
+                start_pos=pos(0.15, 0.15),
+                end_pos=pos(0.85, 0.85),
+                display_name="Red Robot",
+                hex_color="#FF3333"
+            ),
+        )
+    )
+    
+    # Mission 2: Two Robots (Red, Green)
+    missions[2] = MissionConfig(
+        mission_id=2,
+        name="Mission 2: Dual Dance",
+        description="Coordinate RED and GREEN robots. Don't let them collide!",
+        difficulty="Medium",
+        robots=(
+            RobotConfig(
+                color=RobotColor.RED,
+                start_pos=pos(0.15, 0.15),
+                end_pos=pos(0.85, 0.85),
+                display_name="Red Robot",
+                hex_color="#FF3333"
+            ),
+            RobotConfig(
+                color=RobotColor.GREEN,
+                start_pos=pos(0.85, 0.15),
+                end_pos=pos(0.15, 0.85),
+                display_name="Green Robot",
+                hex_color="#33FF33"
+            )
+        )
+    )
+    
+    # Mission 3: Three Robots (Red, Green, Blue)
+    missions[3] = MissionConfig(
+        mission_id=3,
+        name="Mission 3: Triple Threat",
+        description="Navigate three robots simultaneously. Precision required!",
+        difficulty="Hard",
+        robots=(
+            RobotConfig(
+                color=RobotColor.RED,
+                start_pos=pos(0.15, 0.15),  # Top-left
+                end_pos=pos(0.85, 0.85),    # Bottom-right
+                display_name="Red Robot",
+                hex_color="#FF3333"
+            ),
+            RobotConfig(
+                color=RobotColor.GREEN,
+                start_pos=pos(0.85, 0.15),  # Top-right
+                end_pos=pos(0.15, 0.85),    # Bottom-left
+                display_name="Green Robot",
+                hex_color="#33FF33"
+            ),
+            RobotConfig(
+                color=RobotColor.BLUE,
+                start_pos=pos(0.50, 0.85),  # Bottom-center
+                end_pos=pos(0.50, 0.15),    # Top-center
+                display_name="Blue Robot",
+                hex_color="#3333FF"
+            )
+        )
+    )
+    
+    # Mission 4: Four Robots (All colors)
+    missions[4] = MissionConfig(
+        mission_id=4,
+        name="Mission 4: Quadrant Chaos",
+        description="Master level! Control all four robots without any collisions.",
+        difficulty="Expert",
+        robots=(
+            RobotConfig(
+                color=RobotColor.RED,
+                start_pos=pos(0.15, 0.30),  # Left side, upper
+                end_pos=pos(0.85, 0.70),    # Right side, lower
+                display_name="Red Robot",
+                hex_color="#FF3333"
+            ),
+            RobotConfig(
+                color=RobotColor.GREEN,
+                start_pos=pos(0.85, 0.30),  # Right side, upper
+                end_pos=pos(0.15, 0.70),    # Left side, lower
+                display_name="Green Robot",
+                hex_color="#33FF33"
+            ),
+            RobotConfig(
+                color=RobotColor.BLUE,
+                start_pos=pos(0.30, 0.15),  # Top side, left
+                end_pos=pos(0.70, 0.85),    # Bottom side, right
+                display_name="Blue Robot",
+                hex_color="#3333FF"
+            ),
+            RobotConfig(
+                color=RobotColor.YELLOW,
+                start_pos=pos(0.70, 0.15),  # Top side, right
+                end_pos=pos(0.30, 0.85),    # Bottom side, left
+                display_name="Yellow Robot",
+                hex_color="#FFDD33"
+            )
+        )
+    )
+    
+    return MappingProxyType(missions)
 
 
 class MissionManager:
@@ -60,126 +215,9 @@ class MissionManager:
         self.canvas_height = canvas_height
         self.missions = self._create_missions()
     
-    def _create_missions(self) -> Dict[int, MissionConfig]:
-        """Create all mission configurations."""
-        
-        # Helper function for positioning
-        def pos(x_frac: float, y_frac: float) -> Tuple[float, float]:
-            return (x_frac * self.canvas_width, y_frac * self.canvas_height)
-        
-        missions = {}
-        
-        # Mission 1: Single Robot (Red)
-        missions[1] = MissionConfig(
-            mission_id=1,
-            name="Mission 1: Solo Navigator",
-            description="Guide the RED robot from start to finish. Learn the basics!",
-            difficulty="Easy",
-            robots=[
-                RobotConfig(
-                    color=RobotColor.RED,
-                    start_pos=pos(0.15, 0.15),
-                    end_pos=pos(0.85, 0.85),
-                    display_name="Red Robot",
-                    hex_color="#FF3333"
-                )
-            ]
-        )
-        
-        # Mission 2: Two Robots (Red, Green)
-        missions[2] = MissionConfig(
-            mission_id=2,
-            name="Mission 2: Dual Dance",
-            description="Coordinate RED and GREEN robots. Don't let them collide!",
-            difficulty="Medium",
-            robots=[
-                RobotConfig(
-                    color=RobotColor.RED,
-                    start_pos=pos(0.15, 0.15),
-                    end_pos=pos(0.85, 0.85),
-                    display_name="Red Robot",
-                    hex_color="#FF3333"
-                ),
-                RobotConfig(
-                    color=RobotColor.GREEN,
-                    start_pos=pos(0.85, 0.15),
-                    end_pos=pos(0.15, 0.85),
-                    display_name="Green Robot",
-                    hex_color="#33FF33"
-                )
-            ]
-        )
-        
-        # Mission 3: Three Robots (Red, Green, Blue)
-        missions[3] = MissionConfig(
-            mission_id=3,
-            name="Mission 3: Triple Threat",
-            description="Navigate three robots simultaneously. Precision required!",
-            difficulty="Hard",
-            robots=[
-                RobotConfig(
-                    color=RobotColor.RED,
-                    start_pos=pos(0.15, 0.15),  # Top-left
-                    end_pos=pos(0.85, 0.85),    # Bottom-right
-                    display_name="Red Robot",
-                    hex_color="#FF3333"
-                ),
-                RobotConfig(
-                    color=RobotColor.GREEN,
-                    start_pos=pos(0.85, 0.15),  # Top-right
-                    end_pos=pos(0.15, 0.85),    # Bottom-left
-                    display_name="Green Robot",
-                    hex_color="#33FF33"
-                ),
-                RobotConfig(
-                    color=RobotColor.BLUE,
-                    start_pos=pos(0.50, 0.85),  # Bottom-center
-                    end_pos=pos(0.50, 0.15),    # Top-center
-                    display_name="Blue Robot",
-                    hex_color="#3333FF"
-                )
-            ]
-        )
-        
-        # Mission 4: Four Robots (All colors)
-        missions[4] = MissionConfig(
-            mission_id=4,
-            name="Mission 4: Quadrant Chaos",
-            description="Master level! Control all four robots without any collisions.",
-            difficulty="Expert",
-            robots=[
-                RobotConfig(
-                    color=RobotColor.RED,
-                    start_pos=pos(0.15, 0.30),  # Left side, upper
-                    end_pos=pos(0.85, 0.70),    # Right side, lower
-                    display_name="Red Robot",
-                    hex_color="#FF3333"
-                ),
-                RobotConfig(
-                    color=RobotColor.GREEN,
-                    start_pos=pos(0.85, 0.30),  # Right side, upper
-                    end_pos=pos(0.15, 0.70),    # Left side, lower
-                    display_name="Green Robot",
-                    hex_color="#33FF33"
-                ),
-                RobotConfig(
-                    color=RobotColor.BLUE,
-                    start_pos=pos(0.30, 0.15),  # Top side, left
-                    end_pos=pos(0.70, 0.85),    # Bottom side, right
-                    display_name="Blue Robot",
-                    hex_color="#3333FF"
-                ),
-                RobotConfig(
-                    color=RobotColor.YELLOW,
-                    start_pos=pos(0.70, 0.15),  # Top side, right
-                    end_pos=pos(0.30, 0.85),    # Bottom side, left
-                    display_name="Yellow Robot",
-                    hex_color="#FFDD33"
-                )
-            ]
-        )
-        
-        return missions
+    def _create_missions(self) -> Mapping[int, MissionConfig]:
+        """Create all mission configurations (shared between managers of the same canvas size)."""
+        return _build_missions(self.canvas_width, self.canvas_height)
     
     def get_mission(self, mission_id: int) -> Optional[MissionConfig]:
         """Get mission configuration by ID."""
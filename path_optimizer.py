@@ -5,23 +5,39 @@ Handles path interpolation and intelligent waypoint generation for robot navigat
 
 import numpy as np
 from scipy import interpolate
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import math
 
 
+# Sample precisions PathInterpolator can produce; float32 halves the memory moved per stage
+PRECISION_DTYPES = {'f64': np.float64, 'f32': np.float32}
+
+
+def _as_path_array(path) -> np.ndarray:
+    """(N, 2) contiguous float array of a path; float32 input stays float32, anything else is float64."""
+    path = np.asarray(path)
+    dtype = np.float32 if path.dtype == np.float32 else np.float64
+    return np.ascontiguousarray(path, dtype=dtype).reshape(-1, 2)
+
+
 class PathInterpolator:
     """
     Interpolates drawn paths into smooth curves using spline fitting.
     """
     
-    def __init__(self, smoothness: float = 0.0):
+    def __init__(self, smoothness: float = 0.0, precision: str = 'f64'):
         """
         Initialize path interpolator.
         
         Args:
             smoothness: Smoothing factor for spline (0 = no smoothing)
+            precision: 'f64' or 'f32' dtype of the sampled arrays (the spline fit
+                       itself always runs in float64)
         """
+        if precision not in PRECISION_DTYPES:
+            raise ValueError(f"precision must be one of {sorted(PRECISION_DTYPES)}, got {precision!r}")
         self.smoothness = smoothness
+        self.dtype = PRECISION_DTYPES[precision]
     
     def interpolate_path(self, points: List[Tuple[float, float]], 
                         num_samples: int = 500) -> Optional[List[Tuple[float, float]]]:
@@ -35,52 +51,94 @@ class PathInterpolator:
         Returns:
             List of interpolated (x, y) points, or None if interpolation fails
         """
-        if not points or len(points) < 2:
+        interpolated = self.interpolate_path_np(points, num_samples)
+        if interpolated is None:
+            return None
+        return [tuple(point) for point in interpolated.tolist()]
+    
+    def interpolate_path_np(self, points: List[Tuple[float, float]], 
+                            num_samples: int = 500) -> Optional[np.ndarray]:
+        """
+        Same as interpolate_path, but returns the samples as one (N, 2) array,
+        so later stages (unit conversion, waypoint optimization) can stay in NumPy.
+        The array has the interpolator's precision dtype.
+        """
+        if points is None or len(points) < 2:
             return None
         
-        # Remove duplicate consecutive points
-        cleaned_points = [points[0]]
-        for p in points[1:]:
-            if abs(p[0] - cleaned_points[-1][0]) > 0.1 or abs(p[1] - cleaned_points[-1][1]) > 0.1:
-                cleaned_points.append(p)
+        return self._sample_path(points, num_samples).astype(self.dtype, copy=False)
+    
+    def _sample_path(self, points: List[Tuple[float, float]], num_samples: int) -> np.ndarray:
+        """Spline samples of a path with at least two points, as a float64 (N, 2) array."""
+        # Remove duplicate consecutive points (within 0.1 of the last kept point)
+        points_array = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        points_array = self._remove_duplicate_points(points_array)
         
-        if len(cleaned_points) < 2:
-            return [points[0], points[-1]]
+        if len(points_array) < 2:
+            return np.array([points[0], points[-1]], dtype=np.float64)
         
-        # Convert to numpy arrays
-        points_array = np.array(cleaned_points)
         x = points_array[:, 0]
         y = points_array[:, 1]
         
         # Handle straight line case
-        if len(cleaned_points) == 2:
-            t = np.linspace(0, 1, num_samples)
-            interp_x = x[0] + t * (x[1] - x[0])
-            interp_y = y[0] + t * (y[1] - y[0])
-            return list(zip(interp_x, interp_y))
+        if len(points_array) == 2:
+            return np.linspace(points_array[0], points_array[1], num_samples)
         
         try:
-            # Parameterize by cumulative distance
-            distances = np.sqrt(np.diff(x)**2 + np.diff(y)**2)
-            distances = np.insert(distances, 0, 0)
-            t = np.cumsum(distances)
-            t = t / t[-1]  # Normalize to [0, 1]
+            # Parameterize by cumulative distance (cumsum written straight into t[1:])
+            distances = np.hypot(np.diff(x), np.diff(y))
+            t = np.empty(len(x))
+            t[0] = 0.0
+            np.cumsum(distances, out=t[1:])
+            t /= t[-1]  # Normalize to [0, 1]
             
             # Determine spline degree (k)
-            k = min(3, len(cleaned_points) - 1)
+            k = min(3, len(points_array) - 1)
             
-            # Create B-spline interpolation for both x and y together
+            u_new = np.linspace(0, 1, num_samples)
+            
+            if self.smoothness == 0:
+                # Exact interpolation: one BSpline over both coordinates, evaluated in one call
+                spline = interpolate.make_interp_spline(t, points_array[:, :2], k=k, check_finite=False)
+                return spline(u_new)
+            
+            # Smoothing spline (FITPACK) for both x and y together
             tck, u = interpolate.splprep([x, y], u=t, s=self.smoothness, k=k)
             
             # Sample the spline
-            u_new = np.linspace(0, 1, num_samples)
             x_new, y_new = interpolate.splev(u_new, tck)
             
-            return list(zip(x_new, y_new))
+            return np.column_stack((x_new, y_new))
             
         except Exception as e:
             print(f"[WARNING] Spline interpolation failed: {e}. Using linear interpolation.")
-            return self._linear_interpolation(cleaned_points, num_samples)
+            return np.array(self._linear_interpolation(points_array.tolist(), num_samples), dtype=np.float64).reshape(-1, 2)
+    
+    @staticmethod
+    def _remove_duplicate_points(points: np.ndarray) -> np.ndarray:
+        """
+        Drop points within 0.1 (in both x and y) of the last kept point.
+        
+        Exact repeats are removed with one np.diff mask, which never changes
+        the result. If every remaining step is larger than 0.1 the mask is the
+        answer; otherwise the near points are filtered sequentially, since each
+        one is compared against the last kept point, not its neighbour.
+        """
+        steps = np.abs(np.diff(points, axis=0))
+        keep = np.empty(len(points), dtype=bool)
+        keep[0] = True
+        np.any(steps > 0, axis=1, out=keep[1:])
+        points = points[keep]
+        
+        steps = np.abs(np.diff(points, axis=0))
+        if np.all(np.any(steps > 0.1, axis=1)):
+            return points
+        
+        cleaned = [points[0]]
+        for p in points[1:]:
+            if abs(p[0] - cleaned[-1][0]) > 0.1 or abs(p[1] - cleaned[-1][1]) > 0.1:
+                cleaned.append(p)
+        return np.array(cleaned)
     
     def _linear_interpolation(self, points: List[Tuple[float, float]], 
                              num_samples: int) -> List[Tuple[float, float]]:
@@ -131,48 +189,57 @@ class WaypointOptimizer:
         while eliminating redundant points on straight sections.
         
         Args:
-            path: List of (x, y) coordinates in millimeters
+            path: List of (x, y) coordinates in millimeters, or an (N, 2) array
             
         Returns:
-            List of optimized waypoints (always 20 points, padded if necessary)
+            List of optimized waypoints (always 20 points, padded if necessary);
+            tuples of floats when the path is an array
         """
-        if not path or len(path) < 2:
+        if path is None or len(path) < 2:
             return []
         
-        # Apply Ramer-Douglas-Peucker algorithm
-        simplified = self._rdp_simplify(path, self.epsilon_mm)
+        # Apply Ramer-Douglas-Peucker algorithm (path converted to an array once for all attempts)
+        coords = _as_path_array(path)
+        pivots = {}
+        kept = self._rdp_keep_indices(coords, self.epsilon_mm, pivots)
         
         # If we got too many waypoints, increase epsilon and try again
+        # (replays the first pass's pivots, no distances are recomputed)
         attempts = 0
         current_epsilon = self.epsilon_mm
-        while len(simplified) > self.max_waypoints and attempts < 5:
+        while len(kept) > self.max_waypoints and attempts < 5:
             current_epsilon *= 1.5
-            simplified = self._rdp_simplify(path, current_epsilon)
+            kept = self._rdp_keep_indices(coords, current_epsilon, pivots)
             attempts += 1
         
         # If still too many, take evenly-spaced subset
-        if len(simplified) > self.max_waypoints:
-            indices = np.linspace(0, len(simplified) - 1, self.max_waypoints, dtype=int)
-            simplified = [simplified[i] for i in indices]
+        if len(kept) > self.max_waypoints:
+            kept = kept[np.linspace(0, len(kept) - 1, self.max_waypoints, dtype=int)]
         
-        # Pad with final point to reach exactly max_waypoints
-        while len(simplified) < self.max_waypoints:
-            simplified.append(path[-1])
+        # Pad with final point to reach exactly max_waypoints (as a pre-sized index array)
+        indices = np.full(self.max_waypoints, len(coords) - 1)
+        indices[:len(kept)] = kept
         
-        return simplified[:self.max_waypoints]
+        # Only the output points are materialized as Python objects
+        if isinstance(path, np.ndarray):
+            return [tuple(point) for point in coords[indices].tolist()]
+        return [path[i] for i in indices.tolist()]
     
     def _rdp_simplify(self, points: List[Tuple[float, float]], 
-                     epsilon: float) -> List[Tuple[float, float]]:
+                     epsilon: float,
+                     coords: Optional[np.ndarray] = None) -> List[Tuple[float, float]]:
         """
         Ramer-Douglas-Peucker algorithm for path simplification.
         
-        Recursively finds points that are furthest from the line segment
-        between endpoints. If the distance exceeds epsilon, the point is kept
-        and the algorithm recurses on both sides.
+        Finds the point furthest from the line segment between the endpoints.
+        If the distance exceeds epsilon, the point is kept and both sides are
+        simplified the same way. Sides are processed from an explicit stack of
+        (lo, hi) index pairs, and kept points are marked in a boolean mask.
         
         Args:
             points: Path points to simplify
             epsilon: Distance threshold (points closer than this to line are removed)
+            coords: The same points as an (N, 2) array, if already converted
             
         Returns:
             Simplified path that preserves important geometric features
@@ -180,29 +247,60 @@ class WaypointOptimizer:
         if len(points) < 3:
             return points
         
-        # Find the point with maximum distance from line segment
-        start = points[0]
-        end = points[-1]
-        max_dist = 0.0
-        max_index = 0
-        
-        for i in range(1, len(points) - 1):
-            dist = self._perpendicular_distance(points[i], start, end)
-            if dist > max_dist:
-                max_dist = dist
-                max_index = i
-        
-        # If max distance exceeds epsilon, recursively simplify both sides
-        if max_dist > epsilon:
-            # Recursively simplify left and right segments
-            left_segment = self._rdp_simplify(points[:max_index + 1], epsilon)
-            right_segment = self._rdp_simplify(points[max_index:], epsilon)
+        if coords is None:
+            coords = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+        
+        return [points[i] for i in self._rdp_keep_indices(coords, epsilon).tolist()]
+    
+    def _rdp_keep_indices(self, coords: np.ndarray, epsilon: float,
+                          pivots: Optional[Dict[Tuple[int, int], Tuple[int, float, float]]] = None) -> np.ndarray:
+        """
+        Indices of the points _rdp_simplify keeps, for an (N, 2) array of points.
+        
+        The furthest point of a segment does not depend on epsilon, and a larger
+        epsilon only visits segments a smaller one already split. If given, pivots
+        caches (lo, hi) -> (max_index, max_scaled^2, line_length^2) for every
+        segment examined, so later calls with a larger epsilon on the same coords
+        only replay the comparisons.
+        """
+        if len(coords) < 3:
+            return np.arange(len(coords))
+        
+        keep = np.zeros(len(coords), dtype=bool)
+        keep[0] = keep[-1] = True
+        
+        # Contiguous coordinate columns for the distance math, and the points as
+        # Python floats for the per-segment endpoint arithmetic (cheaper than NumPy scalars)
+        xs = np.ascontiguousarray(coords[:, 0])
+        ys = np.ascontiguousarray(coords[:, 1])
+        point_list = coords.tolist()
+        
+        stack = [(0, len(coords) - 1)]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo < 2:
+                continue
+            
+            pivot = pivots.get((lo, hi)) if pivots is not None else None
+            if pivot is None:
+                # Find the point with maximum distance from line segment
+                # (compared squared, as (distance * length)^2 against (epsilon * length)^2: no sqrt, no divide)
+                scaled_distances, line_length_sq = self._scaled_perpendicular_distances(
+                    xs[lo + 1:hi], ys[lo + 1:hi], point_list[lo], point_list[hi])
+                max_offset = int(scaled_distances.argmax())
+                max_scaled = scaled_distances[max_offset]
+                pivot = (lo + 1 + max_offset, max_scaled * max_scaled, line_length_sq)
+                if pivots is not None:
+                    pivots[(lo, hi)] = pivot
+            max_index, max_scaled_sq, line_length_sq = pivot
             
-            # Combine results (remove duplicate middle point)
-            return left_segment[:-1] + right_segment
-        else:
-            # All intermediate points are close to the line, keep only endpoints
-            return [start, end]
+            # If max distance exceeds epsilon, keep it and simplify both sides
+            if max_scaled_sq > epsilon * epsilon * line_length_sq:
+                keep[max_index] = True
+                stack.append((lo, max_index))
+                stack.append((max_index, hi))
+        
+        return np.flatnonzero(keep)
     
     def _perpendicular_distance(self, point: Tuple[float, float],
                                line_start: Tuple[float, float],
@@ -221,11 +319,11 @@ class WaypointOptimizer:
         dy = y2 - y1
         
         # Line length
-        line_length = math.sqrt(dx * dx + dy * dy)
+        line_length = math.hypot(dx, dy)
         
         if line_length < 1e-6:
             # Line segment is essentially a point
-            return math.sqrt((x0 - x1)**2 + (y0 - y1)**2)
+            return math.hypot(x0 - x1, y0 - y1)
         
         # Calculate perpendicular distance using cross product
         # |cross product| = |(x2-x1)(y1-y0) - (x1-x0)(y2-y1)|
@@ -234,10 +332,33 @@ class WaypointOptimizer:
         
         return distance
     
+    @staticmethod
+    def _scaled_perpendicular_distances(xs: np.ndarray, ys: np.ndarray,
+                                        line_start: Tuple[float, float],
+                                        line_end: Tuple[float, float]) -> Tuple[np.ndarray, float]:
+        """
+        Vectorized _perpendicular_distance for points given as x and y
+        coordinate arrays, multiplied by the line length.
+        
+        Returns (|cross products|, squared line length); dividing the first by
+        the square root of the second gives the distances. A degenerate line
+        gives the plain point distances and a squared length of 1.
+        """
+        x1, y1 = line_start
+        dx = line_end[0] - x1
+        dy = line_end[1] - y1
+        line_length_sq = dx * dx + dy * dy
+        
+        if line_length_sq < 1e-12:
+            # Line segment is essentially a point
+            return np.hypot(xs - x1, ys - y1), 1.0
+        
+        return np.abs(dx * (y1 - ys) - (x1 - xs) * dy), line_length_sq
+    
     @staticmethod
     def _euclidean_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
         """Calculate Euclidean distance between two points."""
-        return math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
+        return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
 
 
 class CoordinateConverter:
@@ -264,6 +385,8 @@ class CoordinateConverter:
         # Calculate scaling factors
         self.scale_x = real_width_mm / canvas_width
         self.scale_y = real_height_mm / canvas_height
+        self.scale = np.array([self.scale_x, self.scale_y], dtype=np.float64)
+        self.inv_scale = 1.0 / self.scale  # real -> canvas multiplies instead of dividing
     
     def canvas_to_real(self, x: float, y: float) -> Tuple[float, float]:
         """
@@ -293,13 +416,23 @@ class CoordinateConverter:
         y = real_y / self.scale_y
         return (x, y)
     
+    def path_canvas_to_real_np(self, path: np.ndarray) -> np.ndarray:
+        """Convert an (N, 2) array path from canvas to real-world coordinates (float32 stays float32)."""
+        path = _as_path_array(path)
+        return np.multiply(path, self.scale, dtype=path.dtype)
+    
+    def path_real_to_canvas_np(self, path: np.ndarray) -> np.ndarray:
+        """Convert an (N, 2) array path from real-world to canvas coordinates (float32 stays float32)."""
+        path = _as_path_array(path)
+        return np.multiply(path, self.inv_scale, dtype=path.dtype)
+    
     def path_canvas_to_real(self, path: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
         """Convert entire path from canvas to real-world coordinates."""
-        return [self.canvas_to_real(x, y) for x, y in path]
+        return [tuple(point) for point in self.path_canvas_to_real_np(path).tolist()]
     
     def path_real_to_canvas(self, path: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
         """Convert entire path from real-world to canvas coordinates."""
-        return [self.real_to_canvas(x, y) for x, y in path]
+        return [tuple(point) for point in self.path_real_to_canvas_np(path).tolist()]
 
 
 def test_optimizer():
@@ -3,17 +3,47 @@ Path Validation Module
 Validates drawn paths for correctness and feasibility.
 """
 
-from typing import List, Tuple, Optional
+import weakref
+from dataclasses import dataclass
+from typing import Callable, List, Tuple, Optional, Union
 import math
+import numpy as np
 from mission_config import RobotConfig
 
 
 class ValidationResult:
-    """Result of path validation."""
+    """
+    Result of path validation.
+    
+    Read-only, since the validator hands the same instance to every caller
+    (cached and shared valid results). The message can be given as a callable
+    instead (message_factory); it is only formatted when .message is first read.
+    """
+    
+    __slots__ = ('_valid', '_message', '_message_factory', '_needs_reverse')
     
-    def __init__(self, valid: bool, message: str = ""):
-        self.valid = valid
-        self.message = message
+    def __init__(self, valid: bool, message: str = "", needs_reverse: bool = False,
+                 message_factory: Optional[Callable[[], str]] = None):
+        self._valid = valid
+        self._message = message
+        self._message_factory = message_factory
+        self._needs_reverse = needs_reverse
+    
+    @property
+    def valid(self) -> bool:
+        return self._valid
+    
+    @property
+    def needs_reverse(self) -> bool:
+        """Set on a valid path that was drawn from END to START."""
+        return self._needs_reverse
+    
+    @property
+    def message(self) -> str:
+        if self._message_factory is not None:
+            self._message = self._message_factory()
+            self._message_factory = None
+        return self._message
     
     def __bool__(self):
         return self.valid
@@ -23,11 +53,139 @@ class ValidationResult:
         return f"{status}: {self.message}" if self.message else status
 
 
+@dataclass(frozen=True)
+class PathArray:
+    """
+    A path stored as separate x and y coordinate arrays (structure of arrays).
+    
+    Supports len() and path[i] -> (x, y) like a list of points, so it can be
+    passed to PathValidator wherever a point list is accepted, while length
+    and reversal run as whole-array operations. The arrays are read-only
+    copies, so a PathArray never changes after construction.
+    """
+    xs: np.ndarray
+    ys: np.ndarray
+    
+    def __post_init__(self):
+        for name in ('xs', 'ys'):
+            values = np.array(getattr(self, name), dtype=np.float64)
+            values.setflags(write=False)
+            object.__setattr__(self, name, values)
+    
+    @classmethod
+    def from_points(cls, points) -> "PathArray":
+        """Build from a list of (x, y) points or an (N, 2) array."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return cls(points[:, 0], points[:, 1])
+    
+    def __len__(self) -> int:
+        return len(self.xs)
+    
+    def __getitem__(self, index: int) -> Tuple[float, float]:
+        return (float(self.xs[index]), float(self.ys[index]))
+    
+    def length(self) -> float:
+        """Total length along the path."""
+        return float(np.hypot(np.diff(self.xs), np.diff(self.ys)).sum())
+    
+    def reversed(self) -> "PathArray":
+        """The same path traversed from the other end."""
+        return PathArray(self.xs[::-1], self.ys[::-1])
+    
+    def to_points(self) -> List[Tuple[float, float]]:
+        """The path as a list of (x, y) tuples."""
+        return list(zip(self.xs.tolist(), self.ys.tolist()))
+
+
+class PathBuilder(list):
+    """
+    A point list that keeps its total length up to date, for paths that grow
+    point by point while being drawn.
+    
+    append and extend add the new segments to the running length; every other
+    in-place edit (insert, item or slice assignment, del, pop, remove, +=, ...)
+    recomputes it from the points. version increases on every change, so
+    results computed from the path can be cached against it.
+    """
+    
+    def __init__(self, points=()):
+        super().__init__()
+        self.length = 0.0
+        self.version = 0
+        self.extend(points)
+    
+    def append(self, point: Tuple[float, float]):
+        if self:
+            last = self[-1]
+            self.length += math.hypot(point[0] - last[0], point[1] - last[1])
+        super().append(point)
+        self.version += 1
+    
+    def extend(self, points):
+        for point in points:
+            self.append(point)
+    
+    def __iadd__(self, points):
+        self.extend(points)
+        return self
+    
+    def _recompute_length(self):
+        self.version += 1
+        self.length = math.fsum(
+            math.hypot(p1[0] - p0[0], p1[1] - p0[1]) for p0, p1 in zip(self, self[1:]))
+    
+    def insert(self, index, point):
+        super().insert(index, point)
+        self._recompute_length()
+    
+    def pop(self, index=-1):
+        point = super().pop(index)
+        self._recompute_length()
+        return point
+    
+    def remove(self, point):
+        super().remove(point)
+        self._recompute_length()
+    
+    def clear(self):
+        super().clear()
+        self._recompute_length()
+    
+    def reverse(self):
+        super().reverse()
+        self._recompute_length()
+    
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._recompute_length()
+    
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._recompute_length()
+    
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._recompute_length()
+    
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._recompute_length()
+        return self
+
+
+# A path as drawn (list of points) or already converted to arrays
+PathLike = Union[List[Tuple[float, float]], PathArray]
+
+
 class PathValidator:
     """
     Validates drawn paths for robots.
     """
     
+    # Point lists up to this many points are measured with the scalar loop;
+    # below it, building a PathArray costs more than the arithmetic
+    SCALAR_PATH_MAX = 100
+    
     def __init__(self, tolerance_pixels: float = 30.0, min_path_length: float = 50.0):
         """
         Initialize path validator.
@@ -38,14 +196,28 @@ class PathValidator:
         """
         self.tolerance = tolerance_pixels
         self.min_path_length = min_path_length
+        # Last result per robot color: color -> (weak ref to path, validation key, result)
+        self._cache = {}
+        # Shared valid results: (display name, needs_reverse) -> ValidationResult
+        self._valid_results = {}
     
-    def validate_path(self, path: List[Tuple[float, float]], 
+    def invalidate(self):
+        """Forget cached validation results (e.g. when a stroke ends)."""
+        self._cache.clear()
+    
+    def validate_path(self, path: PathLike, 
                      robot: RobotConfig) -> ValidationResult:
         """
         Validate a single robot's path.
         
+        For a PathBuilder or PathArray the result is cached per robot color
+        and reused while the same path object is validated again unchanged
+        (same PathBuilder.version; PathArrays are immutable) with the same
+        robot and thresholds. Plain point lists are always validated afresh,
+        since in-place edits to them cannot be detected.
+        
         Args:
-            path: List of (x, y) coordinates
+            path: List of (x, y) coordinates, or a PathArray
             robot: Robot configuration with start/end positions
             
         Returns:
@@ -55,28 +227,47 @@ class PathValidator:
         if not path or len(path) < 2:
             return ValidationResult(False, f"{robot.display_name}: No path drawn!")
         
+        if isinstance(path, PathBuilder):
+            version = path.version
+        elif isinstance(path, PathArray):
+            version = 0
+        else:
+            return self._validate_path_uncached(path, robot)
+        
+        key = (version, robot, self.tolerance, self.min_path_length)
+        cached = self._cache.get(robot.color.value)
+        if cached is not None and cached[0]() is path and cached[1] == key:
+            return cached[2]
+        
+        result = self._validate_path_uncached(path, robot)
+        # Weak reference: the cache does not keep finished strokes alive
+        self._cache[robot.color.value] = (weakref.ref(path), key, result)
+        return result
+    
+    def _validate_path_uncached(self, path: PathLike, 
+                                robot: RobotConfig) -> ValidationResult:
+        """Validate a path with at least two points (validate_path without the cache)."""
         # Check if path connects start and end (in either direction)
-        # Calculate distances from path endpoints to robot start/end positions
-        dist_first_to_start = self._euclidean_distance(path[0], robot.start_pos)
-        dist_first_to_end = self._euclidean_distance(path[0], robot.end_pos)
-        dist_last_to_start = self._euclidean_distance(path[-1], robot.start_pos)
-        dist_last_to_end = self._euclidean_distance(path[-1], robot.end_pos)
+        # by testing path endpoints against robot start/end positions
+        first, last = path[0], path[-1]
         
         # Determine if path is drawn correctly or needs to be reversed
-        forward_valid = (dist_first_to_start <= self.tolerance and 
-                        dist_last_to_end <= self.tolerance)
-        reverse_valid = (dist_first_to_end <= self.tolerance and 
-                        dist_last_to_start <= self.tolerance)
+        forward_valid = (self._within_tolerance(first, robot.start_pos) and 
+                        self._within_tolerance(last, robot.end_pos))
+        reverse_valid = (self._within_tolerance(first, robot.end_pos) and 
+                        self._within_tolerance(last, robot.start_pos))
         
         if not forward_valid and not reverse_valid:
             # Path doesn't connect start and end properly in either direction
             return ValidationResult(
                 False,
-                f"{robot.display_name}: Path must connect START to END positions!\n"
-                f"  Start position: {robot.start_pos}\n"
-                f"  End position: {robot.end_pos}\n"
-                f"  Your path goes from ({path[0][0]:.0f}, {path[0][1]:.0f}) "
-                f"to ({path[-1][0]:.0f}, {path[-1][1]:.0f})"
+                message_factory=lambda: (
+                    f"{robot.display_name}: Path must connect START to END positions!\n"
+                    f"  Start position: {robot.start_pos}\n"
+                    f"  End position: {robot.end_pos}\n"
+                    f"  Your path goes from ({first[0]:.0f}, {first[1]:.0f}) "
+                    f"to ({last[0]:.0f}, {last[1]:.0f})"
+                )
             )
         
         # Note: Path direction is handled automatically - if drawn backwards, 
@@ -87,22 +278,31 @@ class PathValidator:
         if path_length < self.min_path_length:
             return ValidationResult(
                 False, 
-                f"{robot.display_name}: Path too short ({path_length:.1f}px). Draw a longer path!"
+                message_factory=lambda: (
+                    f"{robot.display_name}: Path too short ({path_length:.1f}px). Draw a longer path!"
+                )
             )
         
         # Note: Zigzag detection disabled for hand-drawn paths
         # Hand-drawn paths naturally have variations that shouldn't be considered errors
         # The interpolation and waypoint optimization will smooth out the path anyway
         
-        direction_note = " (auto-reversed)" if reverse_valid and not forward_valid else ""
-        return ValidationResult(True, f"{robot.display_name}: Path is valid! ✓{direction_note}")
+        # Valid results only differ by robot name and direction, so they are shared
+        needs_reverse = reverse_valid and not forward_valid
+        result = self._valid_results.get((robot.display_name, needs_reverse))
+        if result is None:
+            direction_note = " (auto-reversed)" if needs_reverse else ""
+            result = ValidationResult(True, f"{robot.display_name}: Path is valid! ✓{direction_note}",
+                                      needs_reverse=needs_reverse)
+            self._valid_results[(robot.display_name, needs_reverse)] = result
+        return result
     
     def validate_all_paths(self, paths: dict, robots: List[RobotConfig]) -> ValidationResult:
         """
         Validate all robot paths.
         
         Args:
-            paths: Dictionary mapping robot colors to paths
+            paths: Dictionary mapping robot colors to paths (point lists or PathArrays)
             robots: List of robot configurations
             
         Returns:
@@ -123,14 +323,17 @@ class PathValidator:
         combined_message = "\n".join(messages)
         return ValidationResult(all_valid, combined_message)
     
-    def normalize_path_direction(self, path: List[Tuple[float, float]], 
-                                 robot: RobotConfig) -> List[Tuple[float, float]]:
+    def normalize_path_direction(self, path: PathLike, 
+                                 robot: RobotConfig,
+                                 result: Optional[ValidationResult] = None) -> PathLike:
         """
         Ensure path goes from start to end, reversing if necessary.
         
         Args:
-            path: Original path (may be in either direction)
+            path: Original path (may be in either direction), a point list or a PathArray
             robot: Robot configuration with start/end positions
+            result: Valid ValidationResult of this path, if already validated;
+                    its direction is reused instead of measuring the endpoints again
             
         Returns:
             Path oriented from start to end
@@ -138,12 +341,18 @@ class PathValidator:
         if not path or len(path) < 2:
             return path
         
-        # Check which direction the path is drawn
-        dist_first_to_start = self._euclidean_distance(path[0], robot.start_pos)
-        dist_first_to_end = self._euclidean_distance(path[0], robot.end_pos)
-        
-        # If path starts closer to end than start, reverse it
-        if dist_first_to_end < dist_first_to_start:
+        if result is not None and result.valid:
+            reverse = result.needs_reverse
+        else:
+            # Check which direction the path is drawn (squared distances order the same way)
+            # If path starts closer to end than start, reverse it
+            sq_first_to_start = self._squared_distance(path[0], robot.start_pos)
+            sq_first_to_end = self._squared_distance(path[0], robot.end_pos)
+            reverse = sq_first_to_end < sq_first_to_start
+        
+        if reverse:
+            if isinstance(path, PathArray):
+                return path.reversed()
             return list(reversed(path))
         
         return path
@@ -152,19 +361,28 @@ class PathValidator:
                        target: Tuple[float, float], 
                        endpoint_type: str) -> ValidationResult:
         """Check if point is close enough to target."""
-        distance = self._euclidean_distance(point, target)
-        
-        if distance > self.tolerance:
+        if not self._within_tolerance(point, target):
+            # The actual distance is only needed for the message
+            tolerance = self.tolerance
             return ValidationResult(
                 False,
-                f"Path {endpoint_type} point is too far from target "
-                f"({distance:.1f}px away, max {self.tolerance:.1f}px)"
+                message_factory=lambda: (
+                    f"Path {endpoint_type} point is too far from target "
+                    f"({self._euclidean_distance(point, target):.1f}px away, max {tolerance:.1f}px)"
+                )
             )
         
         return ValidationResult(True)
     
-    def _calculate_path_length(self, path: List[Tuple[float, float]]) -> float:
+    def _calculate_path_length(self, path: PathLike) -> float:
         """Calculate total path length."""
+        if isinstance(path, PathBuilder):
+            return path.length
+        if isinstance(path, PathArray):
+            return path.length()
+        if len(path) > self.SCALAR_PATH_MAX:
+            return PathArray.from_points(path).length()
+        
         total_length = 0.0
         for i in range(len(path) - 1):
             total_length += self._euclidean_distance(path[i], path[i + 1])
@@ -193,16 +411,12 @@ class PathValidator:
         if len(sampled_path) < 3:
             return False
         
-        sharp_reversals = 0
-        total_angles_checked = 0
+        # Every interior sampled point is checked in one pass
+        total_angles_checked = len(sampled_path) - 2
         
-        for i in range(len(sampled_path) - 2):
-            angle = self._calculate_angle(sampled_path[i], sampled_path[i + 1], sampled_path[i + 2])
-            total_angles_checked += 1
-            
-            # If angle is very large (close to 180°), it's a sharp reversal
-            if angle > threshold_angle:
-                sharp_reversals += 1
+        # If angle is very large (close to 180°), it's a sharp reversal
+        sharp_reversals = self._count_sharp_corners(
+            np.asarray(sampled_path, dtype=np.float64), threshold_angle)
         
         # Only fail if a significant percentage of the path consists of sharp reversals
         # This allows smooth curves while catching actual chaotic zigzags
@@ -215,7 +429,7 @@ class PathValidator:
         # This is much more lenient than the previous consecutive counting approach
         return reversal_ratio > 0.3
     
-    def _sample_path_for_validation(self, path: List[Tuple[float, float]], 
+    def _sample_path_for_validation(self, path: PathLike, 
                                     min_distance: float) -> List[Tuple[float, float]]:
         """
         Sample path at meaningful intervals to reduce noise from dense mouse tracking.
@@ -232,10 +446,28 @@ class PathValidator:
         
         sampled = [path[0]]  # Always include start point
         
-        for i in range(1, len(path)):
-            dist = self._euclidean_distance(sampled[-1], path[i])
-            if dist >= min_distance:
-                sampled.append(path[i])
+        if isinstance(path, PathArray):
+            # Cumulative arc length; a point less than min_distance further along
+            # the path than the last sample is also less than min_distance away
+            # from it, so those points are skipped with one searchsorted
+            arc = np.empty(len(path))
+            arc[0] = 0.0
+            np.cumsum(np.hypot(np.diff(path.xs), np.diff(path.ys)), out=arc[1:])
+            reach = min_distance - 1e-9 * (arc[-1] + abs(min_distance))  # slack for rounding in the sums
+            path = path.to_points()
+            
+            i = max(1, int(arc.searchsorted(reach)))
+            while i < len(path):
+                if self._euclidean_distance(sampled[-1], path[i]) >= min_distance:
+                    sampled.append(path[i])
+                    i = max(i + 1, int(arc.searchsorted(arc[i] + reach)))
+                else:
+                    i += 1
+        else:
+            for i in range(1, len(path)):
+                dist = self._euclidean_distance(sampled[-1], path[i])
+                if dist >= min_distance:
+                    sampled.append(path[i])
         
         # Always include end point if not already included
         if sampled[-1] != path[-1]:
@@ -270,6 +502,59 @@ class PathValidator:
         
         return angle_deg
     
+    @staticmethod
+    def _count_sharp_corners(points: np.ndarray, threshold_angle: float) -> int:
+        """
+        Count interior points of an (N, 2) array path whose _calculate_angle
+        exceeds threshold_angle, without square roots or acos.
+        
+        angle > threshold is cos(angle) < cos(threshold), i.e.
+        dot < cos_threshold * |v1| * |v2|; both sides are compared squared,
+        with the signs handled separately.
+        """
+        v1 = points[:-2] - points[1:-1]
+        v2 = points[2:] - points[1:-1]
+        
+        dot = np.einsum('ij,ij->i', v1, v2)
+        mag1_sq = np.einsum('ij,ij->i', v1, v1)
+        mag2_sq = np.einsum('ij,ij->i', v2, v2)
+        cos_threshold = math.cos(math.radians(threshold_angle))
+        bound_sq = cos_threshold * cos_threshold * mag1_sq * mag2_sq
+        
+        if threshold_angle >= 180.0:
+            sharp = np.zeros(len(dot), dtype=bool)
+        elif cos_threshold < 0:
+            sharp = (dot < 0) & (dot * dot > bound_sq)
+        else:
+            sharp = (dot < 0) | (dot * dot < bound_sq)
+        
+        # Degenerate corners (a side shorter than 1e-6) count as 0 degrees
+        sharp[(mag1_sq < 1e-12) | (mag2_sq < 1e-12)] = threshold_angle < 0
+        
+        return int(np.count_nonzero(sharp))
+    
+    def _within_tolerance(self, point: Tuple[float, float], target: Tuple[float, float]) -> bool:
+        """
+        Whether point is within self.tolerance of target.
+        
+        A bounding-box test rejects far points with two compares; the squared
+        distance is only compared (against the squared tolerance, no sqrt) for
+        points inside the box.
+        """
+        dx = point[0] - target[0]
+        dy = point[1] - target[1]
+        tolerance = self.tolerance
+        if abs(dx) > tolerance or abs(dy) > tolerance:
+            return False
+        return dx * dx + dy * dy <= tolerance * tolerance
+    
+    @staticmethod
+    def _squared_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
+        """Squared Euclidean distance between two points (for comparisons)."""
+        dx = p2[0] - p1[0]
+        dy = p2[1] - p1[1]
+        return dx * dx + dy * dy
+    
     @staticmethod
     def _euclidean_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
         """Calculate Euclidean distance between two points."""
@@ -18,7 +18,7 @@ from PyQt5.QtGui import (
 
 from mission_config import MissionManager, RobotColor, RobotConfig
 from path_optimizer import PathInterpolator, WaypointOptimizer, CoordinateConverter
-from path_validator import PathValidator
+from path_validator import PathBuilder, PathValidator
 
 
 class RobotPathCanvas(QGraphicsView):
@@ -264,7 +264,8 @@ class RobotPathCanvas(QGraphicsView):
             if 0 <= x <= self.canvas_width and 0 <= y <= self.canvas_height:
                 self.drawing = True
                 color_key = self.current_robot.value
-                self.drawn_paths[color_key] = [(x, y)]
+                # Stroke length is kept up to date as points are appended
+                self.drawn_paths[color_key] = PathBuilder([(x, y)])
                 # Clear optimized path when starting new drawing
                 if color_key in self.optimized_paths:
                     del self.optimized_paths[color_key]
@@ -288,6 +289,7 @@ class RobotPathCanvas(QGraphicsView):
         """Handle mouse release for ending path drawing."""
         if event.button() == Qt.LeftButton and self.drawing:
             self.drawing = False
+            self.parent_window.path_validator.invalidate()
             if self.current_robot:
                 robot = self.mission_config.get_robot_by_color(self.current_robot)
                 if robot:
@@ -973,22 +975,24 @@ class MultiRobotGUI(QMainWindow):
             
             drawn_path = self.canvas.drawn_paths[color_key]
             
-            # Normalize path direction (auto-reverse if drawn backwards)
-            normalized_path = self.path_validator.normalize_path_direction(drawn_path, robot)
+            # Normalize path direction (auto-reverse if drawn backwards), reusing the
+            # direction found by validation (cached per robot, so not recomputed)
+            validation = self.path_validator.validate_path(drawn_path, robot)
+            normalized_path = self.path_validator.normalize_path_direction(drawn_path, robot, validation)
             
             # Update the stored path if it was reversed
             if normalized_path != drawn_path:
                 self.canvas.drawn_paths[color_key] = normalized_path
                 self.log(f"ℹ {robot.display_name}: Path was drawn backwards, auto-reversed")
             
-            # Interpolate path
-            interpolated = self.path_interpolator.interpolate_path(normalized_path, num_samples=500)
-            if not interpolated:
+            # Interpolate path (kept as one array through conversion and optimization)
+            interpolated = self.path_interpolator.interpolate_path_np(normalized_path, num_samples=500)
+            if interpolated is None or len(interpolated) == 0:
                 self.log(f"✗ {robot.display_name}: Interpolation failed")
                 continue
             
             # Convert to real-world coordinates
-            real_path = self.coord_converter.path_canvas_to_real(interpolated)
+            real_path = self.coord_converter.path_canvas_to_real_np(interpolated)
             
             # Optimize waypoints
             waypoints_real = self.waypoint_optimizer.optimize_waypoints(real_path)
@@ -0,0 +1,138 @@
+"""
+Test the pixmap → OptiTrack CoordinateTransformer (archive/coordinate_transformer.py).
+Calibrations and transformed points are compared against the original
+9-column SVD homography and its per-point perspective transform.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'archive'))
+
+from coordinate_transformer import CoordinateTransformer
+
+
+PIXMAP_CORNERS = [(0, 0), (600, 0), (600, 400), (0, 400)]
+# Board rectangle (affine calibration) and a skewed quad (perspective calibration)
+RECTANGLE_CORNERS = [(0.5, -0.3), (1.5, -0.3), (1.5, 0.7), (0.5, 0.7)]
+QUAD_CORNERS = [(0.52, -0.31), (1.47, -0.28), (1.55, 0.74), (0.49, 0.69)]
+
+
+def baseline_homography(src_points, dst_points):
+    """Original solve: SVD null space of the unnormalized 8x9 system."""
+    A = []
+    for (x, y), (u, v) in zip(src_points, dst_points):
+        A.append([x, y, 1, 0, 0, 0, -u*x, -u*y, -u])
+        A.append([0, 0, 0, x, y, 1, -v*x, -v*y, -v])
+    U, S, Vt = np.linalg.svd(np.array(A, dtype=np.float64))
+    H = Vt[-1].reshape(3, 3)
+    return H / H[2, 2]
+
+
+def baseline_transform(H, x, y):
+    """Original per-point transform with a perspective divide."""
+    u, v, w = H @ np.array([x, y, 1.0])
+    return (u / w, v / w)
+
+
+def grid_points(count):
+    """Points spread over the pixmap."""
+    return [(600.0 * i / (count - 1), 400.0 * ((i * 7) % count) / count) for i in range(count)]
+
+
+def make_transformer(tmp_path, realworld_corners):
+    transformer = CoordinateTransformer(str(tmp_path / 'calibration.json'))
+    assert transformer.set_calibration(PIXMAP_CORNERS, realworld_corners)
+    return transformer
+
+
+def test_affine_detection(tmp_path):
+    """A rectangle-to-rectangle calibration is mapped as an affine transform."""
+    assert make_transformer(tmp_path, RECTANGLE_CORNERS).affine_coefficients is not None
+    assert make_transformer(tmp_path, QUAD_CORNERS).affine_coefficients is None
+
+
+def test_affine_transform_matches_baseline(tmp_path):
+    """The affine fast path maps points like the full perspective transform."""
+    transformer = make_transformer(tmp_path, RECTANGLE_CORNERS)
+    H = baseline_homography(np.float32(PIXMAP_CORNERS), np.float32(RECTANGLE_CORNERS))
+
+    for x, y in grid_points(20):
+        assert transformer.pixmap_to_realworld(x, y) == pytest.approx(baseline_transform(H, x, y), abs=1e-5)
+
+
+@pytest.mark.parametrize("realworld_corners", [RECTANGLE_CORNERS, QUAD_CORNERS])
+def test_homography_matches_baseline(tmp_path, realworld_corners):
+    """The normalized solve gives the original homography."""
+    transformer = make_transformer(tmp_path, realworld_corners)
+    expected = baseline_homography(np.float32(PIXMAP_CORNERS), np.float32(realworld_corners))
+
+    assert np.allclose(transformer.transform_matrix, expected, rtol=1e-5, atol=1e-7)
+
+
+@pytest.mark.parametrize("points", [PIXMAP_CORNERS, QUAD_CORNERS])
+def test_normalization_centers_and_scales(points):
+    """Normalized points have their centroid at the origin and mean distance sqrt(2)."""
+    T = CoordinateTransformer._normalization_matrix(points)
+    normalized = CoordinateTransformer._apply_normalization(T, points)
+
+    assert np.allclose(normalized.mean(axis=0), 0.0, atol=1e-12)
+    assert np.hypot(normalized[:, 0], normalized[:, 1]).mean() == pytest.approx(np.sqrt(2.0))
+
+
+def test_svd_fallback_matches_solve(tmp_path, monkeypatch):
+    """When the 8x8 system can't be solved, the SVD fallback gives the same homography."""
+    transformer = make_transformer(tmp_path, QUAD_CORNERS)
+    solved = transformer._compute_homography(np.float32(PIXMAP_CORNERS), np.float32(QUAD_CORNERS))
+
+    def singular(*args, **kwargs):
+        raise np.linalg.LinAlgError("Singular matrix")
+
+    monkeypatch.setattr(np.linalg, 'solve', singular)
+    fallback = transformer._compute_homography(np.float32(PIXMAP_CORNERS), np.float32(QUAD_CORNERS))
+
+    assert np.allclose(fallback, solved, rtol=1e-9, atol=1e-12)
+
+
+def test_corners_map_to_targets(tmp_path):
+    """Each calibration corner lands on its real-world corner."""
+    transformer = make_transformer(tmp_path, QUAD_CORNERS)
+    for corner, target in zip(PIXMAP_CORNERS, QUAD_CORNERS):
+        assert transformer.pixmap_to_realworld(*corner) == pytest.approx(target, abs=1e-5)
+
+
+def test_uncalibrated_returns_input(tmp_path):
+    """Without a calibration, points are returned unchanged."""
+    transformer = CoordinateTransformer(str(tmp_path / 'calibration.json'))
+    assert transformer.pixmap_to_realworld(12.0, 34.0) == (12.0, 34.0)
+    assert transformer.pixmap_path_to_realworld([(1, 2), (3, 4)]) == [(1, 2), (3, 4)]
+
+
+@pytest.mark.parametrize("realworld_corners", [RECTANGLE_CORNERS, QUAD_CORNERS])
+@pytest.mark.parametrize("count", [4, CoordinateTransformer.SCALAR_PATH_MAX + 36])
+def test_path_transform_matches_baseline(tmp_path, realworld_corners, count):
+    """Scalar (short) and array (long) path transforms match the original per-point transform."""
+    transformer = make_transformer(tmp_path, realworld_corners)
+    H = baseline_homography(np.float32(PIXMAP_CORNERS), np.float32(realworld_corners))
+    path = grid_points(count)
+
+    realworld = transformer.pixmap_path_to_realworld(path)
+    expected = [baseline_transform(H, x, y) for x, y in path]
+
+    assert len(realworld) == count
+    assert np.allclose(realworld, expected, atol=1e-5)
+
+
+def test_saved_calibration_reloads(tmp_path):
+    """A saved calibration loads back with the same matrix and can be saved again."""
+    saved = make_transformer(tmp_path, QUAD_CORNERS)
+    assert saved.save_calibration()
+
+    loaded = CoordinateTransformer(str(tmp_path / 'calibration.json'))
+    assert loaded.is_calibrated
+    assert np.array_equal(loaded.transform_matrix, saved.transform_matrix)
+    assert loaded.calibration_data['realworld_corners'] == [list(c) for c in QUAD_CORNERS]
+    assert loaded.save_calibration()
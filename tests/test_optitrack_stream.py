@@ -0,0 +1,188 @@
+"""
+Test OptiTrack stream parsing (archive/optitrack_stream.py).
+Complete entries must parse like the original split(';') / split(',') parser;
+entries cut off by recv() are kept until the rest arrives instead of being
+parsed (or dropped) early.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'archive'))
+
+from optitrack_stream import (OPTITRACK_BINARY_DTYPE, OPTITRACK_MAX_PARTIAL, OptiTrackStream,
+                              optitrack_binary_frame_end, optitrack_frame_end,
+                              parse_optitrack_binary_frame, parse_optitrack_frame)
+
+
+def baseline_parse(data):
+    """Original parser: decode, split on ';' and ',', skip NaN and invalid entries."""
+    robot_positions = {}
+    for entry in data.decode('utf-8', errors='ignore').replace('\x00', '').strip().split(';'):
+        parts = entry.strip().split(',')
+        if len(parts) < 5:
+            continue
+        try:
+            robot_id = int(parts[0].strip())
+            x, z, rotation = float(parts[1]), float(parts[3]), float(parts[4])
+            y = -float(parts[2])
+        except ValueError:
+            continue
+        if any(v != v for v in [x, y, z, rotation]):
+            continue
+        robot_positions[robot_id] = {'x': x, 'y': y, 'z': z, 'rotation': rotation}
+    return robot_positions
+
+
+class FakeSocket:
+    """Non-blocking socket stand-in that hands out the given chunks, then would block."""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def recv_into(self, buffer):
+        if not self.chunks:
+            raise BlockingIOError
+        chunk = self.chunks.pop(0)
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+FRAME = (b"1,0.5,-0.25,0.0,20.0;2,1.25,0.75,0.1,-90.5;"
+         b" 3 , -1.0 , 2.0 , 0.0 , 180 ;4,nan,nan,nan,nan;5,1e-3,2.5E+1,0,0,extra;")
+
+
+def test_complete_frame_matches_baseline():
+    """Well-formed terminated entries parse exactly like the original parser."""
+    assert parse_optitrack_frame(FRAME) == baseline_parse(FRAME)
+    assert sorted(parse_optitrack_frame(FRAME)) == [1, 2, 3, 5]
+
+
+def test_parses_memoryview():
+    """Frames are parsed straight from a view of the received bytes."""
+    assert parse_optitrack_frame(memoryview(bytearray(FRAME))) == baseline_parse(FRAME)
+
+
+@pytest.mark.parametrize("entry", [
+    b"6,+1.0,2.0,3.0,4.0;",   # explicit plus sign
+    b"6,.5,2.0,3.0,4.0;",     # no digit before the decimal point
+    b"6,1.0,2.0,3.0,4.0",     # no terminating ';'
+])
+def test_stricter_entry_format_is_dropped(entry):
+    """Entries the stricter OPTITRACK_ENTRY_RE rejects are skipped entirely."""
+    assert parse_optitrack_frame(entry) == {}
+    assert parse_optitrack_frame(b"1,0.5,0.5,0,0;" + entry) == {
+        1: {'x': 0.5, 'y': -0.5, 'z': 0.0, 'rotation': 0.0}}
+
+
+def test_cut_off_fragment_is_not_read_as_entry():
+    """The tail of an entry cut mid-number never parses as a robot of its own."""
+    assert parse_optitrack_frame(b"5,2.0,3.0,0.0,45.0,7;") == {
+        5: {'x': 2.0, 'y': -3.0, 'z': 0.0, 'rotation': 45.0}}
+    assert parse_optitrack_frame(b"2.0,3.0,0.0,45.0,7;") == {}
+    assert parse_optitrack_frame(b".0,3.0,0.0,45.0,7;") == {}
+
+
+@pytest.mark.parametrize("cut", range(1, len(FRAME)))
+def test_frame_split_anywhere_parses_like_whole(cut):
+    """Parsing up to the last ';' and keeping the rest loses no entry."""
+    pending = FRAME[:cut]
+    end = optitrack_frame_end(pending)
+    first = parse_optitrack_frame(pending[:end])
+    second = parse_optitrack_frame(pending[end:] + FRAME[cut:])
+
+    assert {**first, **second} == baseline_parse(FRAME)
+
+
+def test_frame_end_without_complete_entry():
+    """Nothing is ready to parse until an entry's ';' has arrived."""
+    assert optitrack_frame_end(b"") == 0
+    assert optitrack_frame_end(b"1,0.5,") == 0
+    assert optitrack_frame_end(b"1,0.5,0.5,0,0;2,1") == len(b"1,0.5,0.5,0,0;")
+
+
+def test_binary_records_match_text():
+    """Binary records parse to the same positions as the text entries; NaN robots are skipped."""
+    records = np.array([(1, 0.5, -0.25, 0.0, 20.0), (2, 1.25, 0.75, 0.125, -90.5),
+                        (4, np.nan, np.nan, 0.0, 0.0)], dtype=OPTITRACK_BINARY_DTYPE).tobytes()
+    text = b"1,0.5,-0.25,0.0,20.0;2,1.25,0.75,0.125,-90.5;"
+
+    assert parse_optitrack_binary_frame(records) == parse_optitrack_frame(text)
+
+
+def test_binary_frame_end_keeps_partial_record():
+    """Only whole records are parsed; the cut-off record waits for the next read."""
+    size = OPTITRACK_BINARY_DTYPE.itemsize
+    assert optitrack_binary_frame_end(b"x" * (size - 1)) == 0
+    assert optitrack_binary_frame_end(b"x" * (2 * size + 3)) == 2 * size
+
+
+def test_drain_reads_whole_backlog():
+    """drain() reads until the socket would block, so the newest entries are parsed."""
+    stream = OptiTrackStream()
+    old = b"1,0.0,0.0,0,0;"
+    new = b"1,0.5,0.5,0,0;"
+
+    assert stream.drain(FakeSocket([old, old, new])) == (3 * len(old), False)
+    assert stream.take_frame() == {1: {'x': 0.5, 'y': -0.5, 'z': 0.0, 'rotation': 0.0}}
+
+
+def test_drain_reports_closed_socket():
+    """A zero-byte read means the server closed the connection."""
+    class ClosedSocket:
+        def recv_into(self, buffer):
+            return 0
+
+    assert OptiTrackStream().drain(ClosedSocket()) == (0, True)
+
+
+def test_stream_keeps_partial_entry():
+    """A frame split mid-entry is completed by the next read into the same buffer."""
+    stream = OptiTrackStream()
+    recv_buffer = stream.recv_buffer
+    cut = FRAME.index(b"3 , -1.0") + 6
+    sock = FakeSocket([FRAME[:cut]])
+
+    stream.drain(sock)
+    first = stream.take_frame()
+    assert sorted(first) == [1, 2]
+    assert bytes(stream.pending) == FRAME[FRAME.rindex(b";", 0, cut) + 1:cut]
+
+    sock.chunks.append(FRAME[cut:])
+    stream.drain(sock)
+    second = stream.take_frame()
+    assert {**first, **second} == baseline_parse(FRAME)
+    assert stream.pending == bytearray()
+    assert stream.recv_buffer is recv_buffer
+
+
+def test_stream_waits_for_first_complete_entry():
+    """take_frame returns None until an entry is complete."""
+    stream = OptiTrackStream()
+    stream.drain(FakeSocket([b"1,0.5,"]))
+    assert stream.take_frame() is None
+    stream.drain(FakeSocket([b"0.5,0,0;"]))
+    assert stream.take_frame() == {1: {'x': 0.5, 'y': -0.5, 'z': 0.0, 'rotation': 0.0}}
+
+
+def test_stream_drops_overlong_partial():
+    """Garbage without any ';' is dropped instead of buffered forever."""
+    stream = OptiTrackStream()
+    stream.drain(FakeSocket([b"x" * (OPTITRACK_MAX_PARTIAL + 1)]))
+    assert stream.take_frame() is None
+    assert stream.pending == bytearray()
+
+
+def test_binary_stream_split_records():
+    """The binary stream completes records split across reads."""
+    records = np.array([(1, 0.5, -0.25, 0.0, 20.0), (2, 1.25, 0.75, 0.125, -90.5)],
+                       dtype=OPTITRACK_BINARY_DTYPE).tobytes()
+    stream = OptiTrackStream(binary=True)
+    stream.drain(FakeSocket([records[:7], records[7:30]]))
+    first = stream.take_frame()
+    stream.drain(FakeSocket([records[30:]]))
+
+    assert {**first, **stream.take_frame()} == parse_optitrack_binary_frame(records)
@@ -0,0 +1,73 @@
+"""
+Test the float32 ('f32') precision mode of the path optimization pipeline.
+The f32 samples must be the f64 samples rounded to float32, and the waypoints
+chosen from them must match the f64 waypoints to float32 accuracy.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from path_optimizer import CoordinateConverter, PathInterpolator, WaypointOptimizer
+
+
+def drawn_path():
+    """Straight section, arc, straight section (canvas pixels)."""
+    path = [(100 + 250 * i / 24, 100 + 250 * i / 24) for i in range(25)]
+    for i in range(1, 25):
+        angle = i / 24 * math.pi / 3
+        path.append((350 + 150 * math.sin(angle), 350 + 150 * (1 - math.cos(angle))))
+    path.extend((path[-1][0] + 10 * i, path[-1][1]) for i in range(1, 20))
+    return path
+
+
+@pytest.mark.parametrize("smoothness", [0.0, 200.0])
+def test_f32_samples_are_rounded_f64_samples(smoothness):
+    """The spline is fitted in float64 either way; f32 only rounds the samples."""
+    points = drawn_path()
+    samples64 = PathInterpolator(smoothness).interpolate_path_np(points, 300)
+    samples32 = PathInterpolator(smoothness, precision='f32').interpolate_path_np(points, 300)
+
+    assert samples64.dtype == np.float64
+    assert samples32.dtype == np.float32
+    assert np.array_equal(samples32, samples64.astype(np.float32))
+
+
+def test_f64_default_matches_list_output():
+    """The default precision keeps interpolate_path's list output unchanged."""
+    points = drawn_path()
+    interpolator = PathInterpolator(200.0)
+
+    assert interpolator.interpolate_path(points, 300) == [
+        tuple(point) for point in interpolator.interpolate_path_np(points, 300).tolist()]
+
+
+def test_f32_pipeline_stays_float32():
+    """Unit conversion keeps float32 arrays in float32."""
+    converter = CoordinateConverter(800, 800, 2000.0, 2000.0)
+    samples = PathInterpolator(200.0, precision='f32').interpolate_path_np(drawn_path(), 300)
+
+    assert converter.path_canvas_to_real_np(samples).dtype == np.float32
+    assert converter.path_real_to_canvas_np(samples).dtype == np.float32
+
+
+def test_f32_waypoints_match_f64():
+    """RDP on the f32 samples keeps the same waypoints as on the f64 samples."""
+    converter = CoordinateConverter(800, 800, 2000.0, 2000.0)
+    optimizer = WaypointOptimizer(epsilon_mm=50.0, max_waypoints=20)
+    points = drawn_path()
+
+    waypoints = {}
+    for precision in ('f64', 'f32'):
+        samples = PathInterpolator(200.0, precision=precision).interpolate_path_np(points, 500)
+        waypoints[precision] = optimizer.optimize_waypoints(converter.path_canvas_to_real_np(samples))
+
+    assert len(waypoints['f32']) == len(waypoints['f64']) == 20
+    assert np.allclose(waypoints['f32'], waypoints['f64'], atol=1e-3)
+
+
+def test_unknown_precision_is_rejected():
+    """Only 'f64' and 'f32' are accepted."""
+    with pytest.raises(ValueError):
+        PathInterpolator(precision='f16')
@@ -0,0 +1,283 @@
+"""
+Test the PathValidator data structures and validation shortcuts.
+Checks that PathArray, PathBuilder, the validation cache and the other fast
+paths give the same results as the original validator on a plain point list.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from mission_config import RobotColor, RobotConfig
+from path_validator import PathArray, PathBuilder, PathValidator, ValidationResult
+
+
+ROBOT = RobotConfig(
+    color=RobotColor.RED,
+    start_pos=(100, 100),
+    end_pos=(700, 700),
+    display_name="Test Robot",
+    hex_color="#FF0000"
+)
+
+# Messages of the original validator for the paths used below
+VALID_MESSAGE = "Test Robot: Path is valid! ✓"
+REVERSED_MESSAGE = "Test Robot: Path is valid! ✓ (auto-reversed)"
+WRONG_START_MESSAGE = (
+    "Test Robot: Path must connect START to END positions!\n"
+    "  Start position: (100, 100)\n"
+    "  End position: (700, 700)\n"
+    "  Your path goes from (150, 150) to (700, 700)"
+)
+
+
+def wavy_path(count=300):
+    """Dense hand-drawn-like stroke from START to END."""
+    return [(100 + i * 600.0 / (count - 1), 100 + i * 600.0 / (count - 1) + 20 * math.sin(i / 7.0))
+            for i in range(count)]
+
+
+def reference_length(points):
+    """Path length summed segment by segment, as the original validator did."""
+    return sum(math.hypot(x1 - x0, y1 - y0) for (x0, y0), (x1, y1) in zip(points, points[1:]))
+
+
+# --- PathArray ---
+
+@pytest.mark.parametrize("path, valid, message", [
+    ([(100, 100), (400, 400), (700, 700)], True, VALID_MESSAGE),
+    ([(700, 700), (400, 400), (100, 100)], True, REVERSED_MESSAGE),
+    ([(150, 150), (700, 700)], False, WRONG_START_MESSAGE),
+])
+def test_validation_matches_original_messages(path, valid, message):
+    """Every accepted path type validates like the original point list."""
+    for variant in (path, PathBuilder(path), PathArray.from_points(path)):
+        result = PathValidator().validate_path(variant, ROBOT)
+        assert result.valid == valid
+        assert result.message == message
+
+
+def test_path_array_matches_point_list():
+    """PathArray behaves like the point list it was built from."""
+    points = wavy_path()
+    path = PathArray.from_points(points)
+
+    assert len(path) == len(points)
+    assert path[0] == points[0] and path[-1] == points[-1]
+    assert path.to_points() == points
+    assert path.reversed().to_points() == points[::-1]
+    assert path.length() == pytest.approx(reference_length(points), rel=1e-12)
+    assert PathValidator()._calculate_path_length(path) == pytest.approx(reference_length(points), rel=1e-12)
+
+
+def test_path_array_is_read_only():
+    """The coordinate arrays are copies that can't be written."""
+    xs = np.array([0.0, 1.0, 2.0])
+    path = PathArray(xs, np.zeros(3))
+    xs[0] = 5.0
+
+    assert path[0] == (0.0, 0.0)
+    with pytest.raises(ValueError):
+        path.xs[0] = 5.0
+
+
+def test_normalize_reverses_path_array():
+    """A backwards PathArray is reversed as a PathArray."""
+    backward = PathArray.from_points([(700, 700), (400, 400), (100, 100)])
+    normalized = PathValidator().normalize_path_direction(backward, ROBOT)
+
+    assert isinstance(normalized, PathArray)
+    assert normalized.to_points() == [(100, 100), (400, 400), (700, 700)]
+
+
+# --- Sampling ---
+
+def reference_sample(path, min_distance):
+    """Original _sample_path_for_validation: greedy scan over every point."""
+    sampled = [path[0]]
+    for point in path[1:]:
+        if math.hypot(point[0] - sampled[-1][0], point[1] - sampled[-1][1]) >= min_distance:
+            sampled.append(point)
+    if sampled[-1] != path[-1]:
+        sampled.append(path[-1])
+    return sampled
+
+
+@pytest.mark.parametrize("min_distance", [1.0, 5.0, 30.0, 250.0])
+def test_searchsorted_sampling_matches_original(min_distance):
+    """Sampling a PathArray picks the same points as the original scan."""
+    validator = PathValidator()
+    points = wavy_path()
+    # A sharp back-and-forth section, where arc length and distance differ most
+    points[150:160] = [(400 + (i % 2) * 40.0, 400.0) for i in range(10)]
+
+    expected = reference_sample(points, min_distance)
+    assert validator._sample_path_for_validation(points, min_distance) == expected
+    assert validator._sample_path_for_validation(PathArray.from_points(points), min_distance) == expected
+
+
+def test_zigzag_detection_matches_for_path_array():
+    """Zigzag detection gives the same answer for a list and a PathArray."""
+    validator = PathValidator()
+    smooth = wavy_path()
+    zigzag = [(100 + i * 10.0, 100 + (i % 2) * 60.0) for i in range(60)]
+
+    for points in (smooth, zigzag):
+        assert (validator._has_extreme_zigzag(PathArray.from_points(points))
+                == validator._has_extreme_zigzag(points))
+
+
+# --- Sharp corners ---
+
+@pytest.mark.parametrize("threshold_angle", [-10.0, 0.0, 45.0, 90.0, 135.0, 160.0, 180.0])
+def test_sharp_corner_count_matches_angles(threshold_angle):
+    """Counting by dot products agrees with _calculate_angle > threshold."""
+    validator = PathValidator()
+    points = [(100 + i * 10.0, 100 + (i % 3) * 25.0 * (-1) ** i) for i in range(40)]
+    points[5] = points[4]  # A degenerate (zero-length) side
+
+    expected = sum(validator._calculate_angle(points[i - 1], points[i], points[i + 1]) > threshold_angle
+                   for i in range(1, len(points) - 1))
+    assert validator._count_sharp_corners(np.asarray(points, dtype=np.float64), threshold_angle) == expected
+
+
+# --- Validation cache ---
+
+def test_cache_reuses_result_for_unchanged_path():
+    """Validating the same unchanged PathBuilder again returns the cached result."""
+    validator = PathValidator()
+    path = PathBuilder(wavy_path())
+
+    first = validator.validate_path(path, ROBOT)
+    assert validator.validate_path(path, ROBOT) is first
+
+
+def test_cache_follows_builder_changes():
+    """Any edit to a PathBuilder (new version) is validated afresh."""
+    validator = PathValidator()
+    path = PathBuilder([(100, 100), (400, 400)])
+
+    assert not validator.validate_path(path, ROBOT).valid
+    path.append((700, 700))
+    assert validator.validate_path(path, ROBOT).message == VALID_MESSAGE
+    path[-1] = (650, 650)
+    assert not validator.validate_path(path, ROBOT).valid
+
+
+def test_plain_lists_are_not_cached():
+    """In-place edits to a plain list are always seen."""
+    validator = PathValidator()
+    path = [(100, 100), (400, 400), (700, 700)]
+
+    assert validator.validate_path(path, ROBOT).valid
+    path[-1] = (650, 650)
+    assert not validator.validate_path(path, ROBOT).valid
+
+
+def test_cache_checks_thresholds():
+    """Changing the tolerance invalidates the cached result."""
+    validator = PathValidator()
+    path = PathArray.from_points([(100, 100), (400, 400), (725, 725)])
+
+    assert not validator.validate_path(path, ROBOT).valid
+    validator.tolerance = 40.0
+    assert validator.validate_path(path, ROBOT).valid
+
+
+def test_invalidate_clears_cache():
+    """invalidate() forgets cached results."""
+    validator = PathValidator()
+    path = PathArray.from_points(wavy_path())
+
+    first = validator.validate_path(path, ROBOT)
+    validator.invalidate()
+    assert validator._cache == {}
+    assert validator.validate_path(path, ROBOT).message == first.message
+
+
+# --- PathBuilder ---
+
+def test_path_builder_length_while_drawing():
+    """Running length matches the segment sum as points are appended."""
+    points = wavy_path()
+    path = PathBuilder(points[:1])
+    for point in points[1:]:
+        path.append(point)
+
+    assert path.length == pytest.approx(reference_length(points), rel=1e-12)
+    assert PathValidator()._calculate_path_length(path) == pytest.approx(reference_length(points), rel=1e-12)
+
+
+@pytest.mark.parametrize("edit", [
+    lambda p: p.insert(1, (0, 0)),
+    lambda p: p.pop(),
+    lambda p: p.pop(0),
+    lambda p: p.remove(p[2]),
+    lambda p: p.reverse(),
+    lambda p: p.sort(),
+    lambda p: p.clear(),
+    lambda p: p.__setitem__(3, (0, 0)),
+    lambda p: p.__setitem__(slice(2, 5), [(1, 1)]),
+    lambda p: p.__delitem__(slice(0, 4)),
+    lambda p: p.__iadd__([(5, 5), (9, 9)]),
+    lambda p: p.__imul__(2),
+    lambda p: p.extend([(5, 5)]),
+])
+def test_path_builder_length_after_edit(edit):
+    """Every in-place list edit keeps length correct and bumps version."""
+    path = PathBuilder(wavy_path(20))
+    version = path.version
+    edit(path)
+
+    assert path.length == pytest.approx(reference_length(list(path)), rel=1e-12)
+    assert path.version > version
+
+
+# --- Direction ---
+
+@pytest.mark.parametrize("path", [
+    [(700, 700), (400, 400), (100, 100)],
+    [(100, 100), (400, 400), (700, 700)],
+])
+def test_normalize_reuses_validation_direction(path):
+    """normalize_path_direction with a result orients the path like without one."""
+    validator = PathValidator()
+    result = validator.validate_path(path, ROBOT)
+
+    assert result.needs_reverse == (path[0] == (700, 700))
+    assert (validator.normalize_path_direction(path, ROBOT, result)
+            == validator.normalize_path_direction(path, ROBOT)
+            == [(100, 100), (400, 400), (700, 700)])
+
+
+# --- Results ---
+
+def test_valid_results_are_shared():
+    """Valid results are shared per robot and direction."""
+    validator = PathValidator()
+    first = validator.validate_path([(100, 100), (400, 400), (700, 700)], ROBOT)
+    second = validator.validate_path([(100, 100), (300, 500), (700, 700)], ROBOT)
+
+    assert first is second
+    assert validator.validate_path([(700, 700), (100, 100)], ROBOT) is not first
+
+
+def test_validation_result_is_read_only():
+    """Shared results can't be modified by a caller."""
+    result = PathValidator().validate_path([(100, 100), (700, 700)], ROBOT)
+    with pytest.raises(AttributeError):
+        result.valid = False
+    with pytest.raises(AttributeError):
+        result.message = "changed"
+
+
+def test_failure_message_is_formatted_lazily():
+    """A message factory is only called when the message is read, then kept."""
+    calls = []
+    result = ValidationResult(False, message_factory=lambda: calls.append(1) or "too short")
+
+    assert not calls
+    assert result.message == "too short"
+    assert result.message == "too short"
+    assert calls == [1]